@@ -0,0 +1,66 @@
+from qgate_perf.executor_sync import ExecutorSync
+from qgate_perf.helper import Helper
+from qgate_perf.file_marker import FileMarker
+
+
+class AdaptiveDuration:
+    """
+    Adaptive duration of run, the coordinator samples throughput cross all executors (amount of calls
+    from shared memory) in intervals and the run is stopped, when the relative half-width of 95% confidence
+    interval of mean throughput is under requested precision (between min. and max. duration).
+    """
+
+    INTERVAL = 0.1              # interval in seconds for one sample of throughput
+    MIN_SAMPLES = 5             # min. amount of samples for confidence interval
+
+    def __init__(self, sync: ExecutorSync, executors, start, precision, min_duration, max_duration, interval = INTERVAL):
+        """
+        Init of adaptive duration
+
+        :param sync:            shared memory with amount of calls from executors
+        :param executors:       amount of executors
+        :param start:           start time of measurement (in seconds, time from epoch)
+        :param precision:       requested relative half-width of confidence interval (e.g. 0.02 = +/-2%)
+        :param min_duration:    min. duration in seconds
+        :param max_duration:    max. duration in seconds
+        :param interval:        interval in seconds for one sample of throughput
+        """
+        self._sync = sync
+        self._executors = executors
+        self._precision = precision
+        self._interval = interval
+        self._last_calls, self._last_time = None, None
+        self.start = start
+        self.min_time = start + min(min_duration, max_duration)
+        self.stop_time = start + max_duration
+        self.next_time = start
+        self.samples = []
+        self.precision = None
+
+    def sample(self, now) -> bool:
+        """
+        Sample of throughput (it is called in time 'next_time')
+
+        :param now:     current time (in seconds, time from epoch)
+        :return:        True - the throughput is stable or max. duration elapsed (stop), False - continue
+        """
+        calls = self._sync.total_calls(self._executors)
+        if self._last_calls is not None and calls >= self._last_calls and now > self._last_time:
+            self.samples.append((calls - self._last_calls) / (now - self._last_time))
+        self._last_calls, self._last_time = calls, now
+        self.next_time = now + self._interval
+
+        if now >= self.stop_time:
+            return True
+        if now >= self.min_time and len(self.samples) >= AdaptiveDuration.MIN_SAMPLES:
+            mean, std, low, high = Helper.confidence_interval(self.samples)
+            self.precision = (high - mean) / mean if mean > 0 else None
+            if self.precision is not None and self.precision <= self._precision:
+                return True
+        return False
+
+    def result(self, now) -> dict:
+        """Summary of adaptive duration (duration, amount of samples and reached precision)"""
+        return {FileMarker.PRF_CORE_ADAPTIVE_DURATION: now - self.start,
+                FileMarker.PRF_CORE_ADAPTIVE_SAMPLES: len(self.samples),
+                FileMarker.PRF_CORE_ADAPTIVE_PRECISION: self.precision}
@@ -0,0 +1,97 @@
+import os
+import glob
+
+
+class CpuAffinity:
+    """
+    Placement of executor processes to the CPU cores (pinning via 'os.sched_setaffinity'), the plan
+    contains list of cores for each process slot (the process with key N uses slot N % amount of slots).
+    """
+
+    COMPACT = "compact"         # one core for each process, the neighbour processes on neighbour cores
+    SPREAD = "spread"           # one core for each process, the neighbour processes on different NUMA nodes
+    NUMA = "numa"               # all cores of one NUMA node for each process (round-robin cross nodes)
+
+    NODE_PATH = "/sys/devices/system/node/node*/cpulist"
+
+    @staticmethod
+    def available() -> bool:
+        """Pinning of executors is available (only on platforms with 'os.sched_setaffinity', e.g. Linux)"""
+        return hasattr(os, "sched_setaffinity")
+
+    @staticmethod
+    def parse_list(cpulist: str) -> list:
+        """
+        Parse list of cores in kernel format
+
+        :param cpulist:     list of cores e.g. '0-3,8,10-11'
+        :return:            list of cores e.g. [0, 1, 2, 3, 8, 10, 11]
+        """
+        cores = []
+        for item in cpulist.strip().split(","):
+            if item:
+                first, _, last = item.partition("-")
+                cores.extend(range(int(first), int(last if last else first) + 1))
+        return cores
+
+    @staticmethod
+    def nodes(cores = None) -> list:
+        """
+        NUMA nodes with available cores
+
+        :param cores:       available cores (default is None, cores available for current process)
+        :return:            list of cores for each NUMA node (one node with all cores without NUMA information)
+        """
+        cores = sorted(cores if cores is not None else os.sched_getaffinity(0))
+        nodes = []
+        for path in sorted(glob.glob(CpuAffinity.NODE_PATH), key = lambda name: int(name.split("node")[-1].split("/")[0])):
+            with open(path, "r") as file:
+                node = [core for core in CpuAffinity.parse_list(file.read()) if core in cores]
+            if node:
+                nodes.append(node)
+        return nodes if nodes else [cores]
+
+    @staticmethod
+    def plan(policy, cores = None, nodes = None) -> list:
+        """
+        Plan of cores for process slots based on policy
+
+        :param policy:      'compact', 'spread', 'numa', list of cores e.g. [0, 2, 4] (one core for each
+                            process) or list of lists e.g. [[0, 1], [2, 3]] (set of cores for each process)
+        :param cores:       available cores (default is None, cores available for current process)
+        :param nodes:       list of cores for each NUMA node (default is None, based on system information)
+        :return:            list of cores for each process slot or None (without pinning)
+        """
+        if policy is None:
+            return None
+        if not CpuAffinity.available():
+            raise ValueError("The CPU affinity is not supported on this platform (missing 'os.sched_setaffinity').")
+
+        cores = sorted(cores if cores is not None else os.sched_getaffinity(0))
+        nodes = nodes if nodes is not None else CpuAffinity.nodes(cores)
+        if policy == CpuAffinity.COMPACT:
+            return [[core] for core in cores]
+        if policy == CpuAffinity.SPREAD:
+            # round-robin cross nodes (the first core from each node, the second core from each node, etc.)
+            return [[node[index]] for index in range(max(len(node) for node in nodes)) for node in nodes if index < len(node)]
+        if policy == CpuAffinity.NUMA:
+            return [list(node) for node in nodes]
+        if isinstance(policy, (list, tuple)) and policy:
+            plan = [list(item) if isinstance(item, (list, tuple, set)) else [item] for item in policy]
+            unavailable = sorted(set(core for item in plan for core in item) - set(cores))
+            if unavailable or not all(plan):
+                raise ValueError(f"Invalid CPU affinity '{policy}', the cores {unavailable} are not available "
+                                 f"(available cores are {cores}).")
+            return plan
+        raise ValueError(f"Invalid CPU affinity '{policy}', accepted values are 'compact', 'spread', 'numa' or list of cores.")
+
+    @staticmethod
+    def cores(plan, process_key) -> list:
+        """
+        Cores for the process from plan
+
+        :param plan:            plan of cores for process slots
+        :param process_key:     key of process
+        :return:                list of cores or None (without pinning)
+        """
+        return plan[process_key % len(plan)] if plan else None
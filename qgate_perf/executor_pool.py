@@ -0,0 +1,608 @@
+import asyncio
+import concurrent.futures
+import inspect
+import multiprocessing
+import multiprocessing.connection
+import gc
+import os
+import signal
+from platform import python_version
+from packaging import version
+from qgate_perf.run_setup import RunSetup
+from qgate_perf.run_return import RunReturn
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.executor_sync import ExecutorSync
+from qgate_perf.adaptive_duration import AdaptiveDuration
+from qgate_perf.cpu_affinity import CpuAffinity
+from time import time
+
+
+_PARTIAL = "partial"            # mark of partial message with return values of finished executors
+
+
+async def _async_executor(func, async_func_wrapper, executor_key, return_dict, run_setup: RunSetup, tasks):
+    """
+    Run tasks in one event loop (each task has own key and return value)
+
+    :param func:                original call function in format 'async def my_func(run_setup) -> ParallelProbe'
+    :param async_func_wrapper:  wrapper for exception handling in async executor
+    :param executor_key:        key of executor (process or thread)
+    :param return_dict:         dictionary for return values
+    :param run_setup:           setup for run
+    :param tasks:               amount of tasks in event loop
+    """
+    if tasks == 1:
+        await async_func_wrapper(func, RunReturn(executor_key, return_dict), run_setup)
+    else:
+        await asyncio.gather(*[async_func_wrapper(func, RunReturn(f"{executor_key}x{task_key}", return_dict),
+                                                  run_setup.executor_copy(run_setup.executor_index + task_key))
+                               for task_key in range(tasks)])
+
+
+def _task_executor(func, func_wrapper, async_func_wrapper, executor_key, return_dict, run_setup: RunSetup, tasks, cores = None):
+    """
+    Run executor in current thread, the event loop is used in case of 'async def' function or tasks > 1
+
+    :param func:                original call function
+    :param func_wrapper:        wrapper for exception handling in executor
+    :param async_func_wrapper:  wrapper for exception handling in async executor
+    :param executor_key:        key of executor (process or thread)
+    :param return_dict:         dictionary for return values
+    :param run_setup:           setup for run
+    :param tasks:               amount of tasks in event loop
+    :param cores:               pinning of current thread to the cores (None - without pinning)
+    """
+    sync = None
+    try:
+        if cores:
+            os.sched_setaffinity(0, cores)
+        if run_setup.sync:
+            # one access to the shared memory for all executors in the thread (shared by probes of tasks)
+            sync = ExecutorSync(name = run_setup.sync)
+            run_setup = run_setup.executor_copy(run_setup.executor_index)
+            run_setup.set_sync_access(sync)
+    except Exception as ex:
+        # the executors are not started, the error is reported for each executor
+        for task_key in range(tasks):
+            RunReturn(executor_key if tasks == 1 else f"{executor_key}x{task_key}",
+                      return_dict).probe = ParallelProbe(None, f"{type(ex).__name__}: {str(ex)}")
+        if sync:
+            sync.close()
+        return
+
+    try:
+        if tasks == 1 and not inspect.iscoroutinefunction(func):
+            func_wrapper(func, RunReturn(executor_key, return_dict), run_setup)
+        else:
+            # start barrier for all tasks before the event loop (the blocking waiting in probe of the
+            # first task would block also other tasks), the probes in tasks are released immediately
+            ParallelProbe._wait_for_start(run_setup, tasks = tasks, sync = sync)
+            asyncio.run(_async_executor(func, async_func_wrapper, executor_key, return_dict, run_setup, tasks))
+    finally:
+        if sync:
+            sync.close()
+
+
+def _executor_keys(process_key, threads, tasks) -> list:
+    """
+    Keys and indexes of executors in the process (the same keys as in return values from executors)
+
+    :param process_key:     key of process
+    :param threads:         amount of threads in the process
+    :param tasks:           amount of tasks in event loop for each thread
+    :return:                list of executors in format [(key, index), ...]
+    """
+    keys = []
+    for thread_key in range(threads):
+        thread = process_key if threads == 1 else f"{process_key}x{thread_key}"
+        for task_key in range(tasks):
+            keys.append((thread if tasks == 1 else f"{thread}x{task_key}", (process_key * threads + thread_key) * tasks + task_key))
+    return keys
+
+
+def _pool_worker(func, func_wrapper, async_func_wrapper, connection, process_init = None, process_finish = None, launch_time = None,
+                 affinity = None):
+    """
+    Main loop of executor process, the process waits for tasks (one task for each
+    execution step) till the end of pool. The outputs from all executors in the process
+    are sent back via pipe in one message (without central Manager server). With watchdog,
+    the outputs of finished threads are also sent immediately as partial message (they are
+    available also in case of termination of the process).
+
+    :param func:                original call function
+    :param func_wrapper:        wrapper for exception handling in executor
+    :param async_func_wrapper:  wrapper for exception handling in async executor
+    :param connection:          pipe for receiving tasks and for sending of return values
+    :param process_init:        function 'def my_init(run_setup) -> object' called once in the process for each
+                                step, the return value is shared by all executors via 'run_setup.shared'
+    :param process_finish:      function 'def my_finish(run_setup)' called in the process after the end of all
+                                executors in the step
+    :param launch_time:         time of process launch in pool owner (for startup time of process)
+    :param affinity:            plan of cores for process slots (None - without pinning)
+    """
+    # startup time of process (start of process incl. imports), it is reported only in the first step
+    startup = time() - launch_time if launch_time else None
+    thread_pool = None
+    thread_pool_size = 0
+
+    # default termination (the handler of sub-coordinator is inherited in case of 'fork')
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    try:
+        while True:
+            task = connection.recv()
+            if task is None:
+                break
+
+            process_key, threads, tasks, run_setup = task
+            try:
+                # shared value for all executors in the process (e.g. connection pool)
+                run_setup.set_shared(process_init(run_setup) if process_init else None)
+            except Exception as ex:
+                # the executors in the process are not started
+                connection.send({process_key: ParallelProbe(None, f"{type(ex).__name__}: {str(ex)}")})
+                continue
+
+            return_dict = {}
+            cores = CpuAffinity.cores(affinity, process_key)
+            try:
+                if threads == 1:
+                    _task_executor(func, func_wrapper, async_func_wrapper, process_key, return_dict,
+                                   run_setup.executor_copy(process_key * tasks), tasks, cores)
+                else:
+                    # reuse thread pool, it will be created again only in case of bigger amount of threads
+                    if threads > thread_pool_size:
+                        if thread_pool:
+                            thread_pool.shutdown(wait=True)
+                        thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=threads)
+                        thread_pool_size = threads
+
+                    # each thread has own return values (for partial message after the end of thread)
+                    features = {}
+                    for thread_key in range(threads):
+                        thread_dict = {}
+                        features[thread_pool.submit(_task_executor, func, func_wrapper, async_func_wrapper,
+                                                    f"{process_key}x{thread_key}", thread_dict,
+                                                    run_setup.executor_copy((process_key * threads + thread_key) * tasks),
+                                                    tasks, cores)] = thread_dict
+
+                    for future in concurrent.futures.as_completed(features):
+                        future.result()
+                        if run_setup["watchdog"]:
+                            _send_partial(connection, features[future], cores)
+                    for thread_dict in features.values():
+                        return_dict.update(thread_dict)
+            except Exception as ex:
+                print(f"SYSTEM ERROR in '_pool_worker': {type(ex).__name__} - '{str(ex)}'")
+            for probe in return_dict.values():
+                if probe:
+                    probe.startup = startup
+                    probe.cores = cores
+            startup = None
+            if process_finish:
+                try:
+                    process_finish(run_setup)
+                except Exception as ex:
+                    print(f"SYSTEM ERROR in 'process_finish': {type(ex).__name__} - '{str(ex)}'")
+
+            # send return values (in one message)
+            try:
+                connection.send(return_dict)
+            except (EOFError, BrokenPipeError):
+                raise
+            except Exception as ex:
+                # issue with serialization of return values
+                connection.send({process_key: ParallelProbe(None, f"{type(ex).__name__}: {str(ex)}")})
+            del return_dict
+
+            # memory clean (outside of measurement)
+            gc.collect(generation = 2)
+    except (EOFError, BrokenPipeError):
+        # pool owner does not exist
+        pass
+    finally:
+        if thread_pool:
+            thread_pool.shutdown(wait=False)
+        connection.close()
+
+
+def _send_partial(connection, return_dict, cores):
+    """
+    Send return values of finished executors as partial message (the process continues)
+
+    :param connection:      pipe for sending of return values
+    :param return_dict:     return values of finished executors
+    :param cores:           pinning of executors (None - without pinning)
+    """
+    for probe in return_dict.values():
+        if probe:
+            probe.cores = cores
+    try:
+        connection.send((_PARTIAL, return_dict))
+    except (EOFError, BrokenPipeError):
+        raise
+    except Exception:
+        # issue with serialization, the return values will be sent (incl. error) in final message
+        pass
+
+
+def _group_worker(func, func_wrapper, async_func_wrapper, connection, process_init = None, process_finish = None,
+                  start_method = None, preload = None, affinity = None):
+    """
+    Main loop of sub-coordinator process, the process starts own group of executor processes
+    and waits for tasks (one part of execution step for each task) till the end of pool. The outputs
+    from all executors in the group are sent back via pipe in one message.
+
+    :param func:                original call function
+    :param func_wrapper:        wrapper for exception handling in executor
+    :param async_func_wrapper:  wrapper for exception handling in async executor
+    :param connection:          pipe for receiving tasks and for sending of return values
+    :param process_init:        function called once in each executor process before executors
+    :param process_finish:      function called once in each executor process after the end of executors
+    :param start_method:        start method of executor processes
+    :param preload:             list of module names for preload in server process (only for 'forkserver')
+    :param affinity:            plan of cores for process slots (None - without pinning)
+    """
+    def _sigterm(signum, frame):
+        raise SystemExit(signum)
+
+    pool = ExecutorPool(func, func_wrapper, async_func_wrapper, process_init, process_finish, start_method, preload,
+                        affinity = affinity)
+    # termination from pool owner (e.g. watchdog) is propagated to the executor processes in the group
+    signal.signal(signal.SIGTERM, _sigterm)
+    try:
+        while True:
+            task = connection.recv()
+            if task is None:
+                break
+
+            first_key, processes, threads, tasks, run_setup = task
+            connection.send(pool.execute_group(run_setup, first_key, processes, threads, tasks))
+    except (EOFError, BrokenPipeError):
+        # pool owner does not exist
+        pass
+    except SystemExit:
+        pool.terminate()
+    finally:
+        pool.close()
+        connection.close()
+
+
+class ExecutorPool:
+    """
+    Pool of executor processes, the processes can be started only once and re-dispatched
+    with new RunSetup and amount of threads for each execution step (it saves time for start of
+    processes and imports in each step). The return values are transferred via pipe from each
+    process (collection is O(executors) without central server). For huge amount of processes,
+    the pool contains sub-coordinators, each sub-coordinator starts own group of processes
+    and sends return values from the group in one message (hierarchical launch).
+    """
+
+    TERMINATE_TIMEOUT = 1       # time in seconds for soft termination of hung process (then the process is killed)
+    WATCHDOG_STEP = 1           # max. interval in seconds for update of deadline in sub-coordinator
+    WATCHDOG_MARGIN = 2         # extra time in seconds for deadline of sub-coordinators (the hung executors
+                                # in group are terminated by sub-coordinator)
+
+    def __init__(self, func, func_wrapper, async_func_wrapper, process_init = None, process_finish = None,
+                 start_method = None, preload = None, group_size = None, affinity = None):
+        """
+        Setting of pool
+
+        :param func:                function for parallel run
+        :param func_wrapper:        wrapper for exception handling in executor
+        :param async_func_wrapper:  wrapper for exception handling in async executor
+        :param process_init:        function called once in each process before executors (the return
+                                    value is shared by all executors in the process via 'run_setup.shared')
+        :param process_finish:      function called once in each process after the end of executors
+        :param start_method:        start method of processes 'fork', 'spawn' or 'forkserver' (default is None,
+                                    the default method of platform)
+        :param preload:             list of module names for preload in server process (only for 'forkserver')
+        :param group_size:          max. amount of processes started by one sub-coordinator (default is None,
+                                    all processes are started directly from pool owner)
+        :param affinity:            plan of cores for process slots, see 'CpuAffinity.plan' (default is None,
+                                    without pinning)
+        """
+        self._func = func
+        self._func_wrapper = func_wrapper
+        self._async_func_wrapper = async_func_wrapper
+        self._process_init = process_init
+        self._process_finish = process_finish
+        self._start_method = start_method
+        self._preload = preload
+        self._context = multiprocessing.get_context(start_method)
+        if preload and self._context.get_start_method() == "forkserver":
+            self._context.set_forkserver_preload(preload)
+        if group_size is not None and group_size < 1:
+            raise ValueError(f"Invalid group size '{group_size}', the value has to be >= 1.")
+        self._group_size = group_size
+        self._affinity = affinity
+        self._workers = []
+        self._open = False
+
+        # Technical point, how to close Process
+        #   in python >= 3.7 Close() as soft closing
+        #   in python < 3.7 Terminate() as hard closing (the Close method does not exist in python lower versions)
+        self._process_close = True if version.parse(python_version()) >= version.parse("3.7") else False
+
+    @property
+    def is_open(self):
+        return self._open
+
+    @property
+    def size(self):
+        """Amount of processes in pool (amount of sub-coordinators for hierarchical launch)"""
+        return len(self._workers)
+
+    def open(self, processes = 0):
+        """
+        Open pool and start processes
+
+        :param processes:   amount of processes for start (pool will grow based on requests in each step)
+        """
+        self._open = True
+        self._grow(processes)
+
+    def close(self):
+        """Stop all processes in pool"""
+        for process, connection in self._workers:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process, connection in self._workers:
+            self._release(process, connection)
+        self._workers = []
+        self._open = False
+
+    def terminate(self):
+        """Terminate all processes in pool (without waiting for the end of executors)"""
+        for process, connection in self._workers:
+            process.terminate()
+        for process, connection in self._workers:
+            process.join(ExecutorPool.TERMINATE_TIMEOUT)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            connection.close()
+        self._workers = []
+        self._open = False
+
+    def _release(self, process, connection):
+        """Wait for end of process and release sources"""
+        process.join()
+        if self._process_close:
+            process.close()       # soft close
+        else:
+            process.terminate()   # hard close
+        connection.close()
+
+    def _units(self, processes, first_key = 0) -> list:
+        """Process keys for each worker in format [(first key, amount of processes), ...]"""
+        if self._group_size:
+            return [(key, min(self._group_size, first_key + processes - key))
+                    for key in range(first_key, first_key + processes, self._group_size)]
+        return [(key, 1) for key in range(first_key, first_key + processes)]
+
+    def _grow(self, processes):
+        """Start new processes (or sub-coordinators), if the pool is smaller than request"""
+        while len(self._workers) < len(self._units(processes)):
+            parent_connection, child_connection = self._context.Pipe()
+            # non-daemon processes (the daemon process cannot have children, e.g. sub-coordinator or
+            # user function with own processes), the processes are ended via explicit close/terminate
+            if self._group_size:
+                process = self._context.Process(target=_group_worker,
+                                                args=(self._func, self._func_wrapper, self._async_func_wrapper, child_connection,
+                                                      self._process_init, self._process_finish, self._start_method, self._preload,
+                                                      self._affinity),
+                                                daemon=False)
+            else:
+                process = self._context.Process(target=_pool_worker,
+                                                args=(self._func, self._func_wrapper, self._async_func_wrapper, child_connection,
+                                                      self._process_init, self._process_finish, time(), self._affinity),
+                                                daemon=False)
+            process.start()
+            child_connection.close()
+            self._workers.append((process, parent_connection))
+
+    def _dispatch(self, run_setup: RunSetup, units, threads, tasks) -> dict:
+        """Send step to the workers, the return value is pending connections with position of worker"""
+        pending = {}
+        for position, (first_key, processes) in enumerate(units):
+            connection = self._workers[position][1]
+            if self._group_size:
+                connection.send((first_key, processes, threads, tasks, run_setup))
+            else:
+                connection.send((first_key, threads, tasks, run_setup))
+            pending[connection] = position
+        return pending
+
+    @staticmethod
+    def _receive(connection, pending, units, responses, broken):
+        """Receive return values from the worker (the values are None for crashed worker), the partial
+        message with finished executors is stored and the worker is still pending"""
+        position = pending[connection]
+        try:
+            message = connection.recv()
+            if isinstance(message, tuple) and message[0] == _PARTIAL:
+                responses.setdefault(position, {}).update(message[1])
+                return
+            del pending[connection]
+            responses[position] = message
+        except (EOFError, OSError):
+            del pending[connection]
+            # process crashed (without return values), it will be replaced in next step
+            first_key, processes = units[position]
+            responses[position] = {process_key: None for process_key in range(first_key, first_key + processes)}
+            broken.append(position)
+
+    def _merge(self, responses, units, broken) -> dict:
+        """Release crashed workers and merge return values in order of executors"""
+        for position in sorted(broken, reverse=True):
+            self._release(*self._workers.pop(position))
+
+        return_dict = {}
+        for position in range(len(units)):
+            return_dict.update(responses[position])
+        return return_dict
+
+    def execute_group(self, run_setup: RunSetup, first_key, processes, threads, tasks = 1) -> dict:
+        """
+        Execute part of step in processes from pool and wait for finish (for sub-coordinator,
+        the synchronization of executors is managed by pool owner)
+
+        :param run_setup:       setup for run
+        :param first_key:       key of the first process in the group
+        :param processes:       amount of processes in the group
+        :param threads:         amount of threads in each process
+        :param tasks:           amount of tasks in event loop for each thread
+        :return:                return values from all executors in the group
+        """
+        units = self._units(processes, first_key)
+        self._grow(processes)
+        pending = self._dispatch(run_setup, units, threads, tasks)
+        responses = {}
+        broken = []
+
+        # access to the shared memory for watchdog (time of release and partial statistics)
+        sync = ExecutorSync(name = run_setup.sync) if run_setup["watchdog"] and run_setup.sync else None
+        try:
+            while pending:
+                deadline = ExecutorPool._deadline(run_setup, sync)
+                ready = multiprocessing.connection.wait(list(pending.keys()),
+                                                        None if deadline is None else max(min(deadline - time(), ExecutorPool.WATCHDOG_STEP), 0))
+                for connection in ready:
+                    ExecutorPool._receive(connection, pending, units, responses, broken)
+                if deadline is not None and pending and time() >= deadline:
+                    self._terminate(pending, units, responses, broken, threads, tasks, sync)
+        finally:
+            if sync:
+                sync.close()
+        return self._merge(responses, units, broken)
+
+    @staticmethod
+    def _deadline(run_setup: RunSetup, sync: ExecutorSync):
+        """
+        Deadline for executors in the step, the executors after deadline are terminated by watchdog
+
+        :param run_setup:   setup with 'watchdog' (grace time in seconds after planned end of executors,
+                            the time budget in seconds for fixed-iteration mode)
+        :param sync:        shared memory with time of release (None - the start time is used)
+        :return:            deadline (in seconds, time from epoch) or None (without watchdog)
+        """
+        if not run_setup["watchdog"]:
+            return None
+        if sync and sync.release_time:
+            start = sync.release_time
+        else:
+            start = run_setup.when_start.timestamp() if run_setup.when_start else time()
+        # fixed-iteration mode is without planned end, the watchdog is absolute time budget after start (and warm-up)
+        return (start + (run_setup["warmup_duration"] if run_setup["warmup_duration"] else 0) +
+                (0 if run_setup["total_calls"] else run_setup.duration_second) + run_setup["watchdog"])
+
+    def _terminate(self, pending, units, responses, broken, threads, tasks, sync: ExecutorSync):
+        """Terminate hung processes, the return values contain partial statistics from shared memory
+        and the executors are marked as timed-out (the finished executors from partial messages are kept)"""
+        for connection, position in list(pending.items()):
+            del pending[connection]
+            process = self._workers[position][0]
+            pid = process.pid
+            process.terminate()
+            # the sub-coordinator terminates own executor processes before the end
+            process.join(ExecutorPool.TERMINATE_TIMEOUT * (2 if self._group_size else 1))
+            if process.is_alive():
+                process.kill()
+
+            first_key, processes = units[position]
+            finished = responses.get(position, {})
+            responses[position] = {key: finished[key] if finished.get(key) else ParallelProbe.timed_out("TimeoutError: the executor exceeded deadline of watchdog", pid,
+                                                                 *(sync.partial(index) if sync else (0, 0, 0, 0)))
+                                   for process_key in range(first_key, first_key + processes)
+                                   for key, index in _executor_keys(process_key, threads, tasks)}
+            broken.append(position)
+
+    def execute(self, run_setup: RunSetup, processes, threads, tasks = 1) -> dict:
+        """
+        Execute one step in processes from pool and wait for finish
+
+        :param run_setup:       setup for run
+        :param processes:       amount of processes for the step
+        :param threads:         amount of threads in each process
+        :param tasks:           amount of tasks in event loop for each thread
+        :return:                return values from all executors (key is executor identification)
+        """
+        units = self._units(processes)
+        self._grow(processes)
+        executors = processes * threads * tasks
+
+        # shared memory for start barrier of all executors
+        sync = ExecutorSync(executors) if ExecutorSync.available() else None
+        run_setup.set_sync(sync.name if sync else None)
+        try:
+            # dispatch step to the processes (or sub-coordinators)
+            pending = self._dispatch(run_setup, units, threads, tasks)
+
+            stop_time = None
+            adaptive = None
+            run_setup.set_adaptive(None)
+            if sync:
+                ExecutorPool._start_barrier(sync, run_setup, executors, pending)
+                if not run_setup["warmup_calls"] and not run_setup["total_calls"]:
+                    # time for global stop of all executors (not for fixed iterations)
+                    start = sync.release_time + (run_setup["warmup_duration"] if run_setup["warmup_duration"] else 0)
+                    stop_time = start + run_setup.duration_second
+                    if run_setup["adaptive_precision"]:
+                        # adaptive duration, the stop is based on stable throughput
+                        adaptive = AdaptiveDuration(sync, executors, start, run_setup["adaptive_precision"],
+                                                    run_setup["adaptive_min_duration"] if run_setup["adaptive_min_duration"] else 1,
+                                                    run_setup.duration_second)
+                        stop_time = adaptive.next_time
+
+            # deadline for hung executors (the sub-coordinators terminate own executors)
+            deadline = ExecutorPool._deadline(run_setup, sync)
+            if deadline is not None and self._group_size:
+                deadline += ExecutorPool.WATCHDOG_MARGIN
+
+            # collect return values from processes (in order of finish)
+            responses = {}
+            broken = []
+            while pending:
+                wake_time = min([value for value in (stop_time, deadline) if value is not None], default = None)
+                ready = multiprocessing.connection.wait(list(pending.keys()),
+                                                        None if wake_time is None else max(wake_time - time(), 0))
+                if stop_time is not None and time() >= stop_time:
+                    if adaptive and not adaptive.sample(time()):
+                        stop_time = adaptive.next_time
+                    else:
+                        if adaptive:
+                            run_setup.set_adaptive(adaptive.result(time()))
+                        sync.stop()
+                        stop_time = None
+                for connection in ready:
+                    ExecutorPool._receive(connection, pending, units, responses, broken)
+                if deadline is not None and pending and time() >= deadline:
+                    self._terminate(pending, units, responses, broken, threads, tasks, sync)
+        finally:
+            run_setup.set_sync(None)
+            if sync:
+                sync.close()
+
+        # return values in order of executors
+        return self._merge(responses, units, broken)
+
+    @staticmethod
+    def _start_barrier(sync: ExecutorSync, run_setup: RunSetup, executors, pending):
+        """
+        Release all executors at once, when the last executor is ready (the max. time
+        for waiting is defined by start delay in run setup)
+
+        :param sync:        shared memory for synchronization
+        :param run_setup:   setup for run
+        :param executors:   amount of executors
+        :param pending:     connections to the processes
+        """
+        timeout = run_setup.when_start.timestamp() if run_setup.when_start else time()
+        while sync.ready_executors(executors) < executors and time() < timeout:
+            # some process finished or crashed before ready state, it does not make sense to wait
+            if multiprocessing.connection.wait(list(pending.keys()), timeout = ExecutorSync.WAIT_STEP * 5):
+                break
+        sync.release()
@@ -0,0 +1,161 @@
+from time import time, sleep
+from threading import Lock
+from platform import python_version
+from packaging import version
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:
+    # python < 3.8, synchronization via shared memory is not supported
+    shared_memory = None
+
+
+class ExecutorSync:
+    """
+    Shared memory for synchronization of executors cross processes (without central server). The
+    memory contains header (time of release for start barrier and time of global stop) and one slot
+    for each executor (time, when the executor is ready, amount of calls for adaptive duration and
+    partial statistics for watchdog). Each executor writes only to own slot, the coordinator writes
+    only to the header.
+    """
+
+    HEADER_SIZE = 2
+    HEADER_RELEASE = 0
+    HEADER_STOP = 1
+    SLOT_SIZE = 5
+    SLOT_READY = 0
+    SLOT_CALLS = 1
+    SLOT_TOTAL = 2
+    SLOT_MIN = 3
+    SLOT_MAX = 4
+    DOUBLE_SIZE = 8
+    WAIT_STEP = 0.0001          # step in seconds for waiting of executors to the release
+
+    _attach_lock = Lock()       # attach from more threads in the same process (without resource tracker)
+
+    def __init__(self, executors = 0, name = None):
+        """
+        Create new shared memory (coordinator) or attach to the existing (executor)
+
+        :param executors:   amount of executors (only for creation of new shared memory)
+        :param name:        name of existing shared memory (None - create new shared memory)
+        """
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create = True,
+                                                   size = (ExecutorSync.HEADER_SIZE + ExecutorSync.SLOT_SIZE * max(executors, 1)) * ExecutorSync.DOUBLE_SIZE)
+            self._owner = True
+        else:
+            self._shm = ExecutorSync._attach(name)
+            self._owner = False
+        self._values = self._shm.buf.cast('d')
+        if self._owner:
+            for index in range(len(self._values)):
+                self._values[index] = 0.0
+
+    @staticmethod
+    def available() -> bool:
+        """Synchronization via shared memory is available (python >= 3.8)"""
+        return shared_memory is not None
+
+    @staticmethod
+    def _attach(name):
+        """Attach to the existing shared memory without tracking (the owner is responsible for unlink)"""
+        if version.parse(python_version()) >= version.parse("3.13"):
+            return shared_memory.SharedMemory(name = name, track = False)
+        # without registration in resource tracker (the tracker can be shared with the owner)
+        with ExecutorSync._attach_lock:
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                return shared_memory.SharedMemory(name = name)
+            finally:
+                resource_tracker.register = register
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def values(self):
+        """Direct access to the shared values (header and slots)"""
+        return self._values
+
+    def _slot(self, index, item):
+        return ExecutorSync.HEADER_SIZE + index * ExecutorSync.SLOT_SIZE + item
+
+    def calls_slot(self, index):
+        """Position of amount of calls for the executor in shared values (the executor writes directly)"""
+        return self._slot(index, ExecutorSync.SLOT_CALLS)
+
+    def slot(self, index):
+        """Position of slot for the executor in shared values (the executor writes directly)"""
+        return self._slot(index, 0)
+
+    # region EXECUTOR side
+
+    def ready(self, index):
+        """Executor is ready for start"""
+        self._values[self._slot(index, ExecutorSync.SLOT_READY)] = time()
+
+    def wait_for_release(self, timeout):
+        """
+        Wait for release of all executors
+
+        :param timeout:     the latest time for waiting (in seconds, time from epoch)
+        :return:            True - released, False - timeout
+        """
+        while self._values[ExecutorSync.HEADER_RELEASE] == 0:
+            if time() >= timeout:
+                return False
+            sleep(ExecutorSync.WAIT_STEP)
+        return True
+
+    def is_stopped(self) -> bool:
+        """Global stop from coordinator"""
+        return self._values[ExecutorSync.HEADER_STOP] != 0
+
+    # endregion
+
+    # region COORDINATOR side
+
+    def ready_executors(self, executors):
+        """Amount of ready executors"""
+        return sum(1 for index in range(executors) if self._values[self._slot(index, ExecutorSync.SLOT_READY)] > 0)
+
+    def total_calls(self, executors):
+        """Amount of calls cross all executors"""
+        return sum(self._values[self._slot(index, ExecutorSync.SLOT_CALLS)] for index in range(executors))
+
+    def partial(self, index):
+        """
+        Partial statistics of the executor (for watchdog)
+
+        :param index:   index of executor
+        :return:        calls, total duration, min and max duration
+        """
+        slot = self._slot(index, 0)
+        return (int(self._values[slot + ExecutorSync.SLOT_CALLS]),
+                self._values[slot + ExecutorSync.SLOT_TOTAL],
+                self._values[slot + ExecutorSync.SLOT_MIN],
+                self._values[slot + ExecutorSync.SLOT_MAX])
+
+    def release(self):
+        """Release all executors (start barrier)"""
+        self._values[ExecutorSync.HEADER_RELEASE] = time()
+
+    @property
+    def release_time(self):
+        """Time of release (0 - without release)"""
+        return self._values[ExecutorSync.HEADER_RELEASE]
+
+    def stop(self):
+        """Global stop for all executors"""
+        self._values[ExecutorSync.HEADER_STOP] = time()
+
+    # endregion
+
+    def close(self):
+        """Close access to the shared memory (the owner also removes the shared memory)"""
+        self._values.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
@@ -9,11 +9,15 @@ class FileMarker:
     PRF_HDR_BULK = "bulk"
     PRF_HDR_DURATION = "duration"
     PRF_HDR_PERCENTILE = "percentile"
+    PRF_HDR_PERCENTILES = "percentiles"
     PRF_HDR_AVIALABLE_CPU = "cpu"
     PRF_HDR_HOST = "host"
     PRF_HDR_MEMORY = "mem"
     PRF_HDR_MEMORY_FREE = "mem_free"
     PRF_HDR_NOW = "now"
+    PRF_HDR_ARRIVAL_RATE = "arrival_rate"
+    PRF_HDR_ARRIVAL_RATE_TOTAL = "arrival_rate_total"
+    PRF_HDR_TIME_SERIES = "time_series"
         # header for HUMAN
     HR_PRF_HDR_LABEL = "lbl"
     HR_PRF_HDR_MEMORY = "mem/free"
@@ -33,11 +37,19 @@ class FileMarker:
     PRF_DETAIL_TIME_INIT = "initexec"
     PRF_DETAIL_TIME_START = "startexec"
     PRF_DETAIL_TIME_END = "endexec"
+    PRF_DETAIL_UNCORRECTED = "uncorrected"
+    PRF_DETAIL_OVERHEAD = "overhead"
+    PRF_DETAIL_SERIES = "series"
+    PRF_DETAIL_STARTUP = "startup"
+    PRF_DETAIL_CORES = "cores"
+    PRF_DETAIL_TIMEOUT = "timeout"
         # detail for HUMAN
     HR_PRF_DETAIL_CALLS = "call"
     HR_PRF_DETAIL_AVRG = "avr"
     HR_PRF_DETAIL_STDEV = "std"
     HR_PRF_DETAIL_TOTAL = "dur"
+    HR_PRF_DETAIL_UNCORRECTED = "uncorr"
+    HR_PRF_DETAIL_OVERHEAD = "ovrh"
 
     # core output
     PRF_CORE_TYPE = "core"
@@ -52,12 +64,78 @@ class FileMarker:
     PRF_CORE_MAX = "max"
     PRF_CORE_TOTAL_CALL_PER_SEC = "total_call_per_sec"              # total raw performance and multiply by rows in bundle
     PRF_CORE_TOTAL_CALL_PER_SEC_RAW = "total_call_per_sec_raw"      # total raw performance (calls per one second)
+    PRF_CORE_TOTAL_CALL_PER_SEC_WALL = "total_call_per_sec_wall"    # total performance based on wall-clock and multiply by rows in bundle
+    PRF_CORE_TOTAL_CALL_PER_SEC_WALL_RAW = "total_call_per_sec_wall_raw"    # total performance based on wall-clock (calls / active window)
     PRF_CORE_TIME_END = "endexec"
+    PRF_CORE_UNCORRECTED = "uncorrected"
+    PRF_CORE_OVERHEAD = "overhead"
+    PRF_CORE_SERIES = "series"
+    PRF_CORE_STEADY = "steady"
+    PRF_CORE_START_SKEW = "start_skew"
+    PRF_CORE_STARTUP = "startup"
+    PRF_CORE_TIMEOUTS = "timeouts"
+    PRF_CORE_WINDOW = "window"
+    PRF_CORE_WINDOW_DURATION = "duration"
+    PRF_CORE_WINDOW_CALLS = "calls"
+    PRF_CORE_WINDOW_CALL_PER_SEC = "call_per_sec"
+    PRF_CORE_WINDOW_EXECUTORS = "executors"
+    PRF_CORE_STEADY_FIRST = "first"
+    PRF_CORE_STEADY_LAST = "last"
+    PRF_CORE_TRIALS = "trials"
+    PRF_CORE_TRIALS_COUNT = "count"
+    PRF_CORE_TRIALS_MEAN = "mean"
+    PRF_CORE_TRIALS_STD = "std"
+    PRF_CORE_TRIALS_CI_LOW = "ci_low"
+    PRF_CORE_TRIALS_CI_HIGH = "ci_high"
+    PRF_CORE_TRIALS_EXECUTORS = "trials_executors"
+    PRF_CORE_ADAPTIVE = "adaptive"
+    PRF_CORE_ADAPTIVE_DURATION = "duration"
+    PRF_CORE_ADAPTIVE_SAMPLES = "samples"
+    PRF_CORE_ADAPTIVE_PRECISION = "precision"
+    PRF_CORE_ITERATIONS = "iterations"
+    PRF_CORE_ITERATIONS_PLANNED = "planned"
+    PRF_CORE_ITERATIONS_CALLS = "calls"
+    PRF_CORE_ITERATIONS_ELAPSED = "elapsed"
+    PRF_CORE_ITERATIONS_CALL_PER_SEC = "call_per_sec"
+        # summary of one trial (in case of repeated trials)
+    PRF_TRIAL_TYPE = "trial"
+        # detail of executor in one trial (it is not part of executor graph)
+    PRF_TRIAL_DETAIL_TYPE = "trial_detail"
+        # capacity under SLO
+    PRF_CAPACITY_TYPE = "capacity"
+    PRF_CAPACITY_SLO = "slo"
+    PRF_CAPACITY_KNEE = "knee"
+    PRF_CAPACITY_CURVE = "curve"
+    PRF_CAPACITY_EXECUTORS = "executors"
+    PRF_CAPACITY_CALL_PER_SEC = "call_per_sec"
+    PRF_CAPACITY_LATENCY = "latency"
+    PRF_CAPACITY_VALID = "valid"
+        # verdict from quality gates
+    PRF_VERDICT_TYPE = "verdict"
+    PRF_VERDICT_STATE = "state"
+    PRF_VERDICT_RESULTS = "results"
+    PRF_VERDICT_FAILED = "failed"
+    PRF_VERDICT_REASONS = "reasons"
+        # comparison of runs
+    PRF_COMPARE_TYPE = "compare"
+    PRF_COMPARE_EXECUTORS = "executors"
+    PRF_COMPARE_METRICS = "metrics"
+    PRF_COMPARE_METRIC = "metric"
+    PRF_COMPARE_BASELINE = "baseline"
+    PRF_COMPARE_CURRENT = "current"
+    PRF_COMPARE_CHANGE = "change"
+    PRF_COMPARE_EFFECT = "effect"
+    PRF_COMPARE_P_VALUE = "p_value"
+    PRF_COMPARE_VERDICT = "verdict"
         # core output for HUMAN
     HM_PRF_CORE_PLAN_EXECUTOR_ALL = "plan"
     HM_PRF_CORE_REAL_EXECUTOR = "exec"
     HM_PRF_CORE_GROUP = "grp"
     HM_PRF_CORE_TOTAL_CALL = "call"
     HM_PRF_CORE_TOTAL_CALL_PER_SEC = "callsec(raw)"
+    HM_PRF_CORE_TOTAL_CALL_PER_SEC_WALL = "callsec(wall)"
     HM_PRF_CORE_AVRG_TIME = "avr"
     HM_PRF_CORE_STD_DEVIATION = "std"
+    HM_PRF_CORE_UNCORRECTED = "uncorr"
+    HM_PRF_CORE_OVERHEAD = "ovrh"
+    HM_PRF_CORE_START_SKEW = "skew"
@@ -1,4 +1,4 @@
-from math import pow
+from math import pow, sqrt, exp, log, lgamma
 from enum import Flag
 from time import perf_counter, perf_counter_ns, sleep
 from numpy import random
@@ -34,6 +34,11 @@ class GraphScope(Flag):
 class Helper:
     """ Predefines values for setting of executor lists with pattern [[processes, threads, label], ...] """
 
+    # quantiles of Student's t-distribution for 95% confidence interval (degrees of freedom 1..30)
+    T_975 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+             2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+             2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
     @staticmethod
     def grow_thread(label_thread=True, process=2, thread_pow_start=1, thread_pow_stop=6):
         """
@@ -140,6 +145,74 @@ class Helper:
             str_duration.append(f"{seconds} sec")
         return ' '.join(str_duration)
 
+    @staticmethod
+    def confidence_interval(values: list):
+        """
+        Mean, standard deviation (sample) and 95% confidence interval (Student's t-distribution)
+
+        :param values:  list of values (e.g. calls per second from trials)
+        :return:        mean, std, low and high bound of confidence interval
+        """
+        count = len(values)
+        mean = sum(values) / count if count > 0 else 0
+        std = sqrt(sum((value - mean) * (value - mean) for value in values) / (count - 1)) if count > 1 else 0
+        t = Helper.T_975[count - 2] if 1 < count <= len(Helper.T_975) + 1 else 1.96
+        margin = t * std / sqrt(count) if count > 1 else 0
+        return mean, std, mean - margin, mean + margin
+
+    @staticmethod
+    def t_p_value(t: float, df: float) -> float:
+        """
+        Two-sided p-value of Student's t-distribution (via regularized incomplete beta function)
+
+        :param t:   value of t-statistic
+        :param df:  degrees of freedom (can be fractional, e.g. Welch-Satterthwaite)
+        :return:    probability of |T| >= |t|
+        """
+        if df <= 0:
+            return 1.0
+        return Helper._incomplete_beta(df / 2, 0.5, df / (df + t * t))
+
+    @staticmethod
+    def _incomplete_beta(a: float, b: float, x: float) -> float:
+        """
+        Regularized incomplete beta function I_x(a, b) (continued fraction, modified Lentz's method)
+
+        :param a:   first shape parameter
+        :param b:   second shape parameter
+        :param x:   value in interval <0, 1>
+        :return:    value of I_x(a, b)
+        """
+        if x <= 0:
+            return 0.0
+        if x >= 1:
+            return 1.0
+        front = exp(lgamma(a + b) - lgamma(a) - lgamma(b) + a * log(x) + b * log(1 - x))
+        # symmetry relation for faster convergence of continued fraction
+        if x > (a + 1) / (a + b + 2):
+            return 1.0 - front * Helper._beta_fraction(b, a, 1 - x) / b
+        return front * Helper._beta_fraction(a, b, x) / a
+
+    @staticmethod
+    def _beta_fraction(a: float, b: float, x: float, iterations = 200, epsilon = 1e-14) -> float:
+        """ Continued fraction of incomplete beta function (see Numerical Recipes, betacf) """
+        tiny = 1e-300
+        c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        fraction = d
+        for m in range(1, iterations + 1):
+            # even and odd step of continued fraction
+            for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                              -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+                d = 1.0 + numerator * d
+                d = 1.0 / (d if abs(d) > tiny else tiny)
+                c = 1.0 + numerator / c
+                c = c if abs(c) > tiny else tiny
+                fraction *= c * d
+            if abs(c * d - 1.0) < epsilon:
+                break
+        return fraction
+
 
 class Singleton (type):
     _instances = {}
@@ -0,0 +1,256 @@
+from math import ceil, floor, log, sqrt
+from sys import float_info
+import numpy
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed histogram of durations (HDR/DDSketch style) with fixed relative precision.
+
+    Each bucket covers values with the same relative error (defined by precision) and keeps
+    count, sum, sum of squares, min and max of values in the bucket. The record cost is O(1),
+    the memory is limited by the amount of buckets between MIN_VALUE and MAX_VALUE (it does not
+    grow with duration of the run) and any percentile can be calculated after the run. The histograms
+    from more executors can be merged.
+    """
+
+    PRECISION = 0.01            # default relative precision (1%)
+    MIN_VALUE = 1e-9            # smaller values (incl. zero) are stored in the bucket for MIN_VALUE
+    MAX_VALUE = 31536000        # bigger values are stored in the bucket for MAX_VALUE (one year in seconds)
+    MIN_DURATION = float_info.max
+
+    def __init__(self, precision = PRECISION):
+        """
+        Init of histogram
+
+        :param precision:   relative precision of values in percentiles (e.g. 0.01 = 1%, default),
+                            accepted values are higher than 0 and lower than 1
+        """
+        if precision <= 0 or precision >= 1:
+            raise Exception(f"Invalid range for value 'precision', requested value is '{precision}', accepted values are "
+                            f"> 0 and < 1.")
+        self._precision = precision
+        self._multiplier = 1 / log((1 + precision) / (1 - precision))
+        self._min_index = self._index(LatencyHistogram.MIN_VALUE)
+        self._max_index = self._index(LatencyHistogram.MAX_VALUE)
+        self._buckets = {}
+        self.count = 0
+
+    @property
+    def precision(self):
+        return self._precision
+
+    @property
+    def max_buckets(self):
+        """Max. amount of buckets (the limit for memory allocation)"""
+        return self._max_index - self._min_index + 1
+
+    def __len__(self):
+        """Amount of used buckets"""
+        return len(self._buckets)
+
+    def _index(self, value):
+        return ceil(log(value) * self._multiplier)
+
+    def record(self, value):
+        """
+        Add new value to the histogram
+
+        :param value:   value for adding (e.g. duration of one call in seconds)
+        """
+        if value <= LatencyHistogram.MIN_VALUE:
+            index = self._min_index
+        elif value >= LatencyHistogram.MAX_VALUE:
+            index = self._max_index
+        else:
+            index = ceil(log(value) * self._multiplier)
+
+        self.count += 1
+        bucket = self._buckets.get(index)
+        if bucket is None:
+            self._buckets[index] = [1, value, value * value, value, value]
+        else:
+            bucket[0] += 1
+            bucket[1] += value
+            bucket[2] += value * value
+            if value < bucket[3]:
+                bucket[3] = value
+            if value > bucket[4]:
+                bucket[4] = value
+
+    def record_repeated(self, value, count):
+        """
+        Add the same value more times to the histogram (e.g. average duration of one operation in batch)
+
+        :param value:   value for adding
+        :param count:   amount of values
+        """
+        if value <= LatencyHistogram.MIN_VALUE:
+            index = self._min_index
+        elif value >= LatencyHistogram.MAX_VALUE:
+            index = self._max_index
+        else:
+            index = ceil(log(value) * self._multiplier)
+
+        self.count += count
+        bucket = self._buckets.get(index)
+        if bucket is None:
+            self._buckets[index] = [count, value * count, value * value * count, value, value]
+        else:
+            bucket[0] += count
+            bucket[1] += value * count
+            bucket[2] += value * value * count
+            if value < bucket[3]:
+                bucket[3] = value
+            if value > bucket[4]:
+                bucket[4] = value
+
+    def record_batch(self, values):
+        """
+        Add more values to the histogram (vectorized, useful for values from buffer)
+
+        :param values:  numpy array with values for adding
+        """
+        if len(values) == 0:
+            return
+        indexes = numpy.ceil(numpy.log(numpy.clip(values, LatencyHistogram.MIN_VALUE, LatencyHistogram.MAX_VALUE)) * self._multiplier)
+
+        # values sorted by buckets
+        order = numpy.lexsort((values, indexes))
+        values, indexes = values[order], indexes[order]
+        unique, starts, counts = numpy.unique(indexes, return_index = True, return_counts = True)
+        totals = numpy.add.reduceat(values, starts)
+        totals_sq = numpy.add.reduceat(values * values, starts)
+
+        self.count += len(values)
+        for index, b_count, b_total, b_total_sq, b_min, b_max in zip(unique.astype(numpy.int64).tolist(),
+                                                                     counts.tolist(),
+                                                                     totals.tolist(),
+                                                                     totals_sq.tolist(),
+                                                                     values[starts].tolist(),
+                                                                     values[starts + counts - 1].tolist()):
+            bucket = self._buckets.get(index)
+            if bucket is None:
+                self._buckets[index] = [b_count, b_total, b_total_sq, b_min, b_max]
+            else:
+                bucket[0] += b_count
+                bucket[1] += b_total
+                bucket[2] += b_total_sq
+                if b_min < bucket[3]:
+                    bucket[3] = b_min
+                if b_max > bucket[4]:
+                    bucket[4] = b_max
+
+    def merge(self, histogram):
+        """
+        Merge values from other histogram (with the same precision)
+
+        :param histogram:   histogram for merge
+        """
+        if histogram._precision != self._precision:
+            raise Exception(f"Histograms with different precision '{self._precision}' and "
+                            f"'{histogram._precision}' cannot be merged.")
+        for index, source in histogram._buckets.items():
+            bucket = self._buckets.get(index)
+            if bucket is None:
+                self._buckets[index] = source.copy()
+            else:
+                bucket[0] += source[0]
+                bucket[1] += source[1]
+                bucket[2] += source[2]
+                bucket[3] = min(bucket[3], source[3])
+                bucket[4] = max(bucket[4], source[4])
+        self.count += histogram.count
+
+    def value_at(self, percentile):
+        """
+        Value for requested percentile (e.g. 0.5, 0.99, 0.999 or 1 for max)
+
+        :param percentile:  requested percentile
+        :return:            value in relative precision of histogram (0 for empty histogram)
+        """
+        if self.count == 0:
+            return 0
+        rank = min(max(ceil(round(self.count * percentile, 6)), 1), self.count)
+        count = 0
+        for index in sorted(self._buckets):
+            bucket = self._buckets[index]
+            if count + bucket[0] >= rank:
+                # linear interpolation inside the bucket
+                return bucket[3] + (bucket[4] - bucket[3]) * ((rank - count) / bucket[0])
+            count += bucket[0]
+        return self._buckets[max(self._buckets)][4]
+
+    def summary(self, percentile = 1):
+        """
+        Summary for values till requested percentile (values above percentile are ignored),
+        the amount of values is floor((count + 1) * percentile) for percentile < 1.
+
+        :param percentile:  requested percentile (1 - all values)
+        :return:            count, total, std (population), min, max
+        """
+        requested = self.count if percentile >= 1 else min(self.count, floor((self.count + 1) * percentile))
+
+        count, total, mean, m2 = 0, 0, 0.0, 0.0
+        min_value, max_value = LatencyHistogram.MIN_DURATION, 0
+        for index in sorted(self._buckets):
+            if count >= requested:
+                break
+            b_count, b_total, b_total_sq, b_min, b_max = self._buckets[index]
+            b_m2 = max(b_total_sq - b_total * b_total / b_count, 0)
+
+            take = min(b_count, requested - count)
+            if take < b_count:
+                # only part of bucket (approximation in relative precision of bucket)
+                b_total = b_total / b_count * take
+                b_m2 = b_m2 * take / b_count
+                b_max = b_min + (b_max - b_min) * take / b_count
+
+            # combination of partial results (parallel alg. for variance)
+            new_count = count + take
+            delta = b_total / take - mean
+            mean += delta * take / new_count
+            m2 += b_m2 + delta * delta * count * take / new_count
+            count = new_count
+            total += b_total
+
+            min_value = min(min_value, b_min)
+            max_value = b_max
+
+        return count, total, sqrt(m2 / count) if count > 0 else 0, min_value, max_value
+
+    @staticmethod
+    def percentile_list(percentile) -> list:
+        """
+        Validate and sort requested percentile(s)
+
+        :param percentile:  one percentile or list of percentiles, accepted values are
+                            higher than 0 and lower than 1 (e.g. 0.99 or [0.5, 0.9, 0.99, 0.999])
+        :return:            sorted list of percentiles
+        """
+        percentiles = percentile if isinstance(percentile, (list, tuple)) else [percentile]
+        for itm in percentiles:
+            if not (itm > 0 and itm < 1):
+                raise Exception(f"Invalid range for value 'percentile', requested value is '{itm}', accepted values are "
+                                f"> 0 and < 1.")
+        return sorted(set(percentiles))
+
+    @staticmethod
+    def percentile_suffix(percentile) -> str:
+        """
+        Suffix for keys with values of percentile e.g. '_50', '_99', '_999' ('' for percentile 1)
+
+        :param percentile:  percentile
+        :return:            suffix for key in outputs
+        """
+        return f"_{percentile * 100:g}".replace(".", "") if percentile < 1 else ""
+
+    @staticmethod
+    def graph_suffix(percentile) -> str:
+        """
+        Suffix for keys of header percentile in format of graphs (qgate_graph) e.g. '_99' for 0.999
+
+        :param percentile:  percentile
+        :return:            suffix for key in outputs
+        """
+        return f"_{int(percentile * 100)}" if percentile < 1 else ""
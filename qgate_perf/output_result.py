@@ -1,11 +1,14 @@
 import multiprocessing
 import os.path
-from json import dumps
+from json import dumps, loads
+from math import sqrt
 from datetime import datetime
 from qgate_perf.file_marker import FileMarker
 from qgate_perf.run_setup import RunSetup
 from qgate_perf.helper import Helper
 from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.latency_histogram import LatencyHistogram
+from qgate_perf.time_series import TimeSeries
 from qgate_perf.output_setup import OutputSetup
 
 
@@ -32,10 +35,42 @@ class PercentileSummary:
         self.max = max
         self.executors = executors
 
+        # summary without correction of coordinated omission (only for open-loop mode)
+        self.uncorrected = None
+
+        # merged histogram from all executors (only for runs with percentiles)
+        self.histogram = None
+
+        # summary only for steady state, ramp-up and ramp-down are trimmed (only with detection of steady state)
+        self.steady = None
+
+        # difference in seconds between the first and the last start of executors
+        self.start_skew = None
+
+        # max. startup time of executor processes in seconds (only for new processes)
+        self.startup = None
+
+        # full concurrency window, the time when all planned executors were running (duration, calls, call_per_sec)
+        self.full_window = None
+
+        # throughput cross repeated trials, mean, std and 95% confidence interval (only for percentile 1)
+        self.trials = None
+
+        # summary of adaptive duration, duration, samples and reached precision (only for percentile 1)
+        self.adaptive = None
+
+        # summary of fixed-iteration mode, planned calls, calls, elapsed time and calls per second (only for percentile 1)
+        self.iterations = None
+
+        # throughput based on wall-clock, all calls / active window from the first start to the last
+        # end of executors (incl. time outside of measured part), only for percentile 1
+        self.call_per_sec_wall_raw = None
+        self.call_per_sec_wall = None
+
 class PerfResult:
     """Output from one performance test (summary data from all executors and for all percentiles)"""
 
-    def __init__(self, state, row, col, process, thread, percentile_summaries: dict[PercentileSummary]):
+    def __init__(self, state, row, col, process, thread, percentile_summaries: dict[PercentileSummary], task = 1):
 
         self.state = state
 
@@ -44,9 +79,13 @@ class PerfResult:
 
         self.executor_process = process
         self.executor_thread = thread
+        self.executor_task = task
 
         self._percentile_summaries = percentile_summaries
 
+        # reasons, why the result is not valid (from quality gates)
+        self.reasons = []
+
     @property
     def percentiles(self) -> dict[PercentileSummary]:
         return self._percentile_summaries
@@ -61,10 +100,15 @@ class PerfResult:
     def __len__(self):
         return len(self._percentile_summaries)
 
+    @property
+    def executors(self) -> str:
+        """Executors in format 'processes x threads' or 'processes x threads x tasks'"""
+        return f"{self.executor_process}x{self.executor_thread}" + (f"x{self.executor_task}" if self.executor_task > 1 else "")
+
     def __str__(self):
-        info = f"bundle ({self.bundle_row}x{self.bundle_col}), executor ({self.executor_process}x{self.executor_thread}) = "
+        info = f"bundle ({self.bundle_row}x{self.bundle_col}), executor ({self.executors}) = "
         for percentile in self._percentile_summaries.keys():
-            info += f"{self._percentile_summaries[percentile].call_per_sec} [{int(percentile * 100)}ph], "
+            info += f"{self._percentile_summaries[percentile].call_per_sec} [{percentile * 100:g}ph], "
         return info[:-2]
 
 class PerfResults:
@@ -76,6 +120,13 @@ class PerfResults:
         self._count_states = 0
         self._count_false_states = 0
 
+        # the best result (only for search of saturation point)
+        self.best = None
+
+        # label and bulk of run (only for results loaded from output file)
+        self.label = None
+        self.bulk = None
+
     @property
     def results(self) -> list[PerfResult]:
         return self._results
@@ -101,6 +152,12 @@ class PerfResults:
             self._state = False
             self._count_false_states += 1
 
+    def refresh_state(self):
+        """Recalculate total state based on states of all results"""
+        self._state = all(result.state for result in self._results)
+        self._count_states = len(self._results)
+        self._count_false_states = sum(1 for result in self._results if not result.state)
+
     def append(self, item):
 
         if isinstance(item, PerfResult):
@@ -115,6 +172,58 @@ class PerfResults:
     def __getitem__(self, index) -> PerfResult:
         return self._results[index]
 
+    @staticmethod
+    def load(input_file) -> list:
+        """
+        Load performance results from output file, each run (header with 'core' lines) is one
+        item in the list
+
+        :param input_file:  output file from performance tests
+        :return:            list of performance results (with label and bulk of run)
+        """
+        runs = []
+        percentiles = [1]
+        with open(input_file, "r") as file:
+            for line in file:
+                try:
+                    data = loads(line.strip())
+                except ValueError:
+                    continue
+                if not isinstance(data, dict):
+                    continue
+                if data.get(FileMarker.PRF_TYPE) == FileMarker.PRF_HDR_TYPE:
+                    runs.append(PerfResults())
+                    runs[-1].label = data.get(FileMarker.PRF_HDR_LABEL, None)
+                    runs[-1].bulk = data.get(FileMarker.PRF_HDR_BULK, [1, 1])
+                    percentiles = [1] + LatencyHistogram.percentile_list(data[FileMarker.PRF_HDR_PERCENTILES]
+                                                                         if FileMarker.PRF_HDR_PERCENTILES in data else
+                                                                         data.get(FileMarker.PRF_HDR_PERCENTILE, []))
+                elif data.get(FileMarker.PRF_TYPE) == FileMarker.PRF_CORE_TYPE and runs:
+                    executors = data[FileMarker.PRF_CORE_PLAN_EXECUTOR] + [1]
+                    summaries = {}
+                    for percentile in percentiles:
+                        suffix = LatencyHistogram.percentile_suffix(percentile)
+                        if FileMarker.PRF_CORE_TOTAL_CALL + suffix in data:
+                            summaries[percentile] = PercentileSummary(percentile,
+                                                                      data[FileMarker.PRF_CORE_TOTAL_CALL + suffix],
+                                                                      data[FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC_RAW + suffix],
+                                                                      data[FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC + suffix],
+                                                                      data[FileMarker.PRF_CORE_AVRG_TIME + suffix],
+                                                                      data[FileMarker.PRF_CORE_STD_DEVIATION + suffix],
+                                                                      data.get(FileMarker.PRF_CORE_MIN + suffix, 0),
+                                                                      data.get(FileMarker.PRF_CORE_MAX + suffix, 0),
+                                                                      data[FileMarker.PRF_CORE_REAL_EXECUTOR])
+                    if 1 in summaries:
+                        summaries[1].trials = data.get(FileMarker.PRF_CORE_TRIALS, None)
+                    runs[-1].append(PerfResult(data[FileMarker.PRF_CORE_REAL_EXECUTOR] == data[FileMarker.PRF_CORE_PLAN_EXECUTOR_ALL],
+                                               runs[-1].bulk[0],
+                                               runs[-1].bulk[1],
+                                               executors[0],
+                                               executors[1],
+                                               summaries,
+                                               executors[2]))
+        return runs
+
     def __str__(self):
         info = ""
         for i in range(len(self._results)):
@@ -142,9 +251,20 @@ class Output:
             self._file.close()
             self._file = None
 
-    def _create_percentile_list(self, run_setup: RunSetup, return_dict):
+    def _create_percentile_list(self, run_setup: RunSetup, return_dict, uncorrected = False):
+        """
+        Summary from all executors for each percentile
 
+        :param run_setup:       Setting for executors
+        :param return_dict:     Return values from executors
+        :param uncorrected:     True - summary from durations without correction of coordinated
+                                omission (only for open-loop mode)
+        :return:                Summary for each percentile
+        """
         percentile_summaries = {}
+        histogram = None            # merged histogram from all executors (for global percentiles)
+        histogram_all = True        # all executors provide histogram
+        track_start, track_end = None, None     # active window cross all executors (wall-clock)
 
         # pre-calculation
             # iteration cross executors results
@@ -152,25 +272,42 @@ class Output:
             response = return_dict[return_key]
             if response:
                 if response.exception is None:
+                    # active window (the first start and the last end)
+                    if response.counter > 0:
+                        track_start = response.track_start if track_start is None else min(track_start, response.track_start)
+                        track_end = response.track_end if track_end is None else max(track_end, response.track_end)
+
+                    statistics = response.uncorrected if uncorrected else response
+                    if statistics:
+                        # merge histograms
+                        if statistics.histogram and statistics.histogram.count > 0:
+                            if histogram is None:
+                                histogram = LatencyHistogram(statistics.histogram.precision)
+                            histogram.merge(statistics.histogram)
+                        elif statistics.counter > 0:
+                            histogram_all = False
+
                     # iteration cross all percentiles
-                    for result in response.percentile_results:
+                    for result in (statistics.percentile_results if statistics else []):
                         if result.count > 0:
-                            # sum of average time for one call
+                            # call-weighted average and pooled variance (combination of M2 from executors)
                             if percentile_summaries.get(result.percentile, None) is None:
                                 percentile_summaries[result.percentile] = PercentileSummary(result.percentile,
                                                                                             result.count,
                                                                                             0,
                                                                                             0,
                                                                                             result.total_duration / result.count,
-                                                                                            result.std,
+                                                                                            result.std * result.std * result.count,
                                                                                             result.min,
                                                                                             result.max,
                                                                                             1)
                             else:
                                 itm = percentile_summaries[result.percentile]
-                                itm.count += result.count
-                                itm.avrg += result.total_duration / result.count
-                                itm.std += result.std
+                                count = itm.count + result.count
+                                delta = result.total_duration / result.count - itm.avrg
+                                itm.avrg += delta * result.count / count
+                                itm.std += result.std * result.std * result.count + delta * delta * itm.count * result.count / count
+                                itm.count = count
                                 itm.min = min(result.min, itm.min)
                                 itm.max = max(result.max, itm.max)
                                 itm.executors += 1
@@ -193,23 +330,34 @@ class Output:
 
             # if expected percentile does not exist, create it
         if run_setup.exist("percentile"):
-            if percentile_summaries.get(run_setup["percentile"], None) is None:
-                percentile_summaries[run_setup["percentile"]] = PercentileSummary(run_setup["percentile"], 0, 0, 0, 0, 0, 0, 0, 0)
+            for expected in LatencyHistogram.percentile_list(run_setup["percentile"]):
+                if percentile_summaries.get(expected, None) is None:
+                    percentile_summaries[expected] = PercentileSummary(expected, 0, 0, 0, 0, 0, 0, 0, 0)
 
         # final calculation
         for percentile in percentile_summaries.values():
             if percentile.executors > 0:
+                percentile.std = sqrt(percentile.std / percentile.count)
+                if histogram and histogram_all and percentile.percentile < 1:
+                    # global percentile cross all calls from all executors
+                    percentile.count, total, percentile.std, percentile.min, percentile.max = histogram.summary(percentile.percentile)
+                    percentile.avrg = 0 if percentile.count == 0 else total / percentile.count
+
                 # Calc clarification (for better understanding):
-                #   avrg / count     = average time for one executor (average is cross all calls and executors)
-                #   1 / (avrg/count) = average amount of calls per one second (cross executors)
-                percentile.call_per_sec_raw  = 0 if (percentile.avrg / percentile.executors) == 0 else (1 / (percentile.avrg / percentile.executors)) * percentile.executors
+                #   avrg                = average time for one call (weighted by calls cross all executors)
+                #   executors / avrg    = average amount of calls per one second (cross executors)
+                percentile.call_per_sec_raw  = 0 if percentile.avrg == 0 else percentile.executors / percentile.avrg
                 percentile.call_per_sec = percentile.call_per_sec_raw * run_setup._bulk_row
 
-                percentile.avrg = 0 if percentile.executors == 0 else percentile.avrg / percentile.executors
-                percentile.std = 0 if percentile.executors == 0 else percentile.std / percentile.executors
+                #   count / window      = amount of calls per one second in active window (wall-clock)
+                if percentile.percentile == 1 and track_start is not None:
+                    window = (track_end - track_start).total_seconds()
+                    percentile.call_per_sec_wall_raw = 0 if window <= 0 else percentile.count / window
+                    percentile.call_per_sec_wall = percentile.call_per_sec_wall_raw * run_setup._bulk_row
             else:
                 percentile.min = 0
                 percentile.max = 0
+            percentile.histogram = histogram if histogram_all else None
 
         return percentile_summaries
 
@@ -222,6 +370,11 @@ class Output:
         # print to the console 'readable_out' or 'out'
         print(readable_out if readable_out else out)
 
+    @staticmethod
+    def _primary_percentile(percentile):
+        """The first requested percentile (the header contains only one percentile for graphs)"""
+        return percentile[0] if isinstance(percentile, (list, tuple)) else percentile
+
     def print_header(self, run_setup: RunSetup=None):
         self._start_tasks = datetime.utcnow()
         self.print(f"############### {self._start_tasks.isoformat(' ')} ###############")
@@ -232,7 +385,15 @@ class Output:
         out[FileMarker.PRF_HDR_BULK] = [run_setup._bulk_row, run_setup._bulk_col]
         out[FileMarker.PRF_HDR_DURATION] = run_setup._duration_second
         if run_setup.exist('percentile'):
-            out[FileMarker.PRF_HDR_PERCENTILE] = run_setup['percentile']
+            out[FileMarker.PRF_HDR_PERCENTILE] = Output._primary_percentile(run_setup['percentile'])
+            if isinstance(run_setup['percentile'], (list, tuple)):
+                out[FileMarker.PRF_HDR_PERCENTILES] = run_setup['percentile']
+        if run_setup.exist('arrival_rate'):
+            out[FileMarker.PRF_HDR_ARRIVAL_RATE] = run_setup['arrival_rate']
+        if run_setup.exist('arrival_rate_total'):
+            out[FileMarker.PRF_HDR_ARRIVAL_RATE_TOTAL] = run_setup['arrival_rate_total']
+        if run_setup.exist('time_series'):
+            out[FileMarker.PRF_HDR_TIME_SERIES] = run_setup['time_series']
         out[FileMarker.PRF_HDR_AVIALABLE_CPU] = multiprocessing.cpu_count()
         out[FileMarker.PRF_HDR_MEMORY] = total
         out[FileMarker.PRF_HDR_MEMORY_FREE] = free
@@ -245,19 +406,227 @@ class Output:
         readable_out[FileMarker.PRF_HDR_DURATION] = run_setup._duration_second
         if run_setup.exist('percentile'):
             readable_out[FileMarker.HR_PRF_HDR_PERCENTILE] = run_setup['percentile']
+        if run_setup.exist('arrival_rate'):
+            readable_out[FileMarker.PRF_HDR_ARRIVAL_RATE] = run_setup['arrival_rate']
+        if run_setup.exist('arrival_rate_total'):
+            readable_out[FileMarker.PRF_HDR_ARRIVAL_RATE_TOTAL] = run_setup['arrival_rate_total']
+        if run_setup.exist('time_series'):
+            readable_out[FileMarker.PRF_HDR_TIME_SERIES] = run_setup['time_series']
         readable_out[FileMarker.PRF_HDR_AVIALABLE_CPU] = multiprocessing.cpu_count()
         readable_out[FileMarker.HR_PRF_HDR_MEMORY] = f"{total}/{free}"
 
         self.print(dumps(out, separators=OutputSetup().json_separator),
                     dumps(readable_out, separators = OutputSetup().human_json_separator))
 
+    def print_capacity(self, slo, percentile, knee, explored: dict, open_loop = False):
+        """
+        Print capacity under SLO, the knee point and the curve of latency vs throughput
+
+        :param slo:         max. latency in seconds for the percentile
+        :param percentile:  percentile for SLO
+        :param knee:        the max. valid load (None - without valid load)
+        :param explored:    performance results for each load (amount of processes or arrival rate)
+        :param open_loop:   True - the load is arrival rate cross all executors
+        """
+        curve = {}
+        for load in sorted(explored.keys()):
+            result = explored[load]
+            point = {}
+            point[FileMarker.PRF_CAPACITY_EXECUTORS] = [result.executor_process, result.executor_thread, result.executor_task]
+            if open_loop:
+                point[FileMarker.PRF_HDR_ARRIVAL_RATE_TOTAL] = load
+            point[FileMarker.PRF_CAPACITY_CALL_PER_SEC] = result[1].call_per_sec_wall if result[1].call_per_sec_wall is not None else result[1].call_per_sec
+            point[FileMarker.PRF_CAPACITY_LATENCY] = result[percentile].max
+            point[FileMarker.PRF_CAPACITY_VALID] = bool(result.state and result[1].count > 0 and result[percentile].max <= slo)
+            curve[load] = point
+
+        out = {}
+        out[FileMarker.PRF_TYPE] = FileMarker.PRF_CAPACITY_TYPE
+        out[FileMarker.PRF_CAPACITY_SLO] = slo
+        out[FileMarker.PRF_HDR_PERCENTILE] = percentile
+        out[FileMarker.PRF_CAPACITY_KNEE] = curve[knee] if knee is not None else None
+        out[FileMarker.PRF_CAPACITY_CURVE] = list(curve.values())
+
+        readable_out = {}
+        readable_out[FileMarker.PRF_TYPE] = FileMarker.PRF_CAPACITY_TYPE
+        readable_out[FileMarker.PRF_CAPACITY_SLO] = slo
+        readable_out[FileMarker.HR_PRF_HDR_PERCENTILE] = percentile
+        readable_out[FileMarker.PRF_CAPACITY_KNEE] = {key: round(value, OutputSetup().human_precision) if isinstance(value, float) else value
+                                                      for key, value in curve[knee].items()} if knee is not None else None
+
+        self.print(dumps(out, separators = OutputSetup().json_separator),
+                   dumps(readable_out, separators = OutputSetup().human_json_separator))
+
+    def print_verdict(self, state, count_states, count_false_states, reasons: list):
+        """
+        Print verdict from quality gates
+
+        :param state:               final state, True - all results are valid
+        :param count_states:        amount of results
+        :param count_false_states:  amount of not valid results
+        :param reasons:             reasons, why the results are not valid
+        """
+        out = {}
+        out[FileMarker.PRF_TYPE] = FileMarker.PRF_VERDICT_TYPE
+        out[FileMarker.PRF_HDR_LABEL] = self._label if self._label is not None else "Noname"
+        out[FileMarker.PRF_VERDICT_STATE] = state
+        out[FileMarker.PRF_VERDICT_RESULTS] = count_states
+        out[FileMarker.PRF_VERDICT_FAILED] = count_false_states
+        out[FileMarker.PRF_VERDICT_REASONS] = reasons
+        out[FileMarker.PRF_HDR_NOW] = datetime.utcnow().isoformat(' ')
+        self.print(dumps(out, separators = OutputSetup().json_separator),
+                   dumps(out, separators = OutputSetup().human_json_separator))
+
+    def print_compare(self, comparison: dict):
+        """
+        Print comparison of one configuration between baseline and current run
+
+        :param comparison:  comparison with label, bulk, executors and findings for metrics
+        """
+        out = {FileMarker.PRF_TYPE: FileMarker.PRF_COMPARE_TYPE, **comparison}
+
+        readable_out = {}
+        readable_out[FileMarker.PRF_TYPE] = FileMarker.PRF_COMPARE_TYPE
+        readable_out[FileMarker.HR_PRF_HDR_LABEL] = comparison[FileMarker.PRF_HDR_LABEL]
+        readable_out[FileMarker.PRF_HDR_BULK] = comparison[FileMarker.PRF_HDR_BULK]
+        readable_out[FileMarker.PRF_COMPARE_EXECUTORS] = comparison[FileMarker.PRF_COMPARE_EXECUTORS]
+        for finding in comparison[FileMarker.PRF_COMPARE_METRICS]:
+            effect = finding[FileMarker.PRF_COMPARE_EFFECT]
+            readable_out[finding[FileMarker.PRF_COMPARE_METRIC]] = f"{finding[FileMarker.PRF_COMPARE_VERDICT]} " \
+                                                                   f"{round(finding[FileMarker.PRF_COMPARE_CHANGE] * 100, 1)}%" \
+                                                                   f"{'' if effect is None else f' (d={round(effect, 2)})'}"
+        self.print(dumps(out, separators = OutputSetup().json_separator),
+                   dumps(readable_out, separators = OutputSetup().human_json_separator))
+
     def print_footer(self, final_state):
         seconds = round((datetime.utcnow() - self._start_tasks).total_seconds(), 1)
         self.print(f"############### State: {'OK' if final_state else 'Error'}, "
                     f"Duration: {Helper.get_readable_duration(seconds)} ({seconds} "
                     f"seconds) ###############")
 
-    def print_detail(self, run_setup: RunSetup, return_dict, processes, threads, group=''):
+    @staticmethod
+    def _summary_dump(out, summaries, readable = False, percentile = None):
+        """Add summary values for each percentile to the output (in file or in readable form), the values
+        of header percentile are also under keys in format of graphs (if they are different and not used)"""
+
+        items = [(LatencyHistogram.percentile_suffix(result.percentile), result) for result in summaries]
+        if percentile and not readable:
+            primary = Output._primary_percentile(percentile)
+            suffix = LatencyHistogram.graph_suffix(primary)
+            if suffix not in [itm[0] for itm in items]:
+                items.extend([(suffix, result) for result in summaries if result.percentile == primary])
+
+        for suffix, result in items:
+            if readable:
+                out[FileMarker.HM_PRF_CORE_TOTAL_CALL + suffix] = result.count
+                if result.call_per_sec_raw == result.call_per_sec:
+                    call_readable = f"{round(result.call_per_sec_raw, OutputSetup().human_precision)}"
+                else:
+                    call_readable = f"{round(result.call_per_sec_raw, OutputSetup().human_precision)}/{round(result.call_per_sec, OutputSetup().human_precision)}"
+                out[FileMarker.HM_PRF_CORE_TOTAL_CALL_PER_SEC + suffix] = call_readable
+                if result.call_per_sec_wall_raw is not None:
+                    if result.call_per_sec_wall_raw == result.call_per_sec_wall:
+                        call_readable = f"{round(result.call_per_sec_wall_raw, OutputSetup().human_precision)}"
+                    else:
+                        call_readable = f"{round(result.call_per_sec_wall_raw, OutputSetup().human_precision)}/{round(result.call_per_sec_wall, OutputSetup().human_precision)}"
+                    out[FileMarker.HM_PRF_CORE_TOTAL_CALL_PER_SEC_WALL + suffix] = call_readable
+                out[FileMarker.HM_PRF_CORE_AVRG_TIME + suffix] =  round(result.avrg, OutputSetup().human_precision)
+                out[FileMarker.HM_PRF_CORE_STD_DEVIATION + suffix] = round(result.std, OutputSetup().human_precision)
+                out[FileMarker.PRF_CORE_MIN + suffix] = round(result.min, OutputSetup().human_precision)
+                out[FileMarker.PRF_CORE_MAX + suffix] = round(result.max, OutputSetup().human_precision)
+            else:
+                out[FileMarker.PRF_CORE_TOTAL_CALL + suffix] = result.count                         # ok
+                out[FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC_RAW + suffix] = result.call_per_sec_raw  # ok
+                out[FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC + suffix] = result.call_per_sec          # ok
+                if result.call_per_sec_wall_raw is not None:
+                    out[FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC_WALL_RAW + suffix] = result.call_per_sec_wall_raw
+                    out[FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC_WALL + suffix] = result.call_per_sec_wall
+                out[FileMarker.PRF_CORE_AVRG_TIME + suffix] = result.avrg                           # ok
+                out[FileMarker.PRF_CORE_STD_DEVIATION + suffix] = result.std                        # ok
+                out[FileMarker.PRF_CORE_MIN + suffix] = result.min                                  # ok
+                out[FileMarker.PRF_CORE_MAX + suffix] = result.max                                  # ok
+        return out
+
+    @staticmethod
+    def _create_full_window(return_dict):
+        """
+        Full concurrency window, the time when all successful executors were running (all planned executors
+        without errors). The calls in window are based on time series (if exist) or on amount of calls
+        of each executor (proportional part).
+
+        :param return_dict:     Return values from executors
+        :return:                Dictionary with duration of window, calls, calls per second and amount
+                                of executors in window or None
+        """
+        probes = [response for response in return_dict.values() if response and response.exception is None and response.end_time]
+        if not probes:
+            return None
+
+        start = max(probe.init_time for probe in probes)
+        end = min(probe.end_time for probe in probes)
+        window = max(end - start, 0)
+
+        calls = 0
+        for probe in probes if window > 0 else []:
+            if probe.series:
+                dump = probe.series.dump()
+                for position, value in enumerate(dump["calls"]):
+                    begin = probe.init_time + (dump["first"] + position) * dump["interval"]
+                    finish = min(begin + dump["interval"], probe.end_time)
+                    if value > 0 and finish > begin:
+                        calls += value * max(min(finish, end) - max(begin, start), 0) / (finish - begin)
+            elif probe.end_time > probe.init_time:
+                calls += probe.counter * window / (probe.end_time - probe.init_time)
+
+        return {FileMarker.PRF_CORE_WINDOW_DURATION: window,
+                FileMarker.PRF_CORE_WINDOW_CALLS: calls,
+                FileMarker.PRF_CORE_WINDOW_CALL_PER_SEC: calls / window if window > 0 else 0,
+                FileMarker.PRF_CORE_WINDOW_EXECUTORS: len(probes)}
+
+    @staticmethod
+    def _create_iterations(run_setup: RunSetup, return_dict):
+        """
+        Summary for fixed-iteration mode, the elapsed time is from the first start to the last end of executors
+
+        :param run_setup:       Setting for executors (parameter 'total_calls' is planned amount of calls)
+        :param return_dict:     Return values from executors
+        :return:                Dictionary with planned calls, calls, elapsed time and calls per second or None
+        """
+        if not run_setup["total_calls"]:
+            return None
+        probes = [response for response in return_dict.values() if response and response.exception is None and response.end_time]
+        calls = sum(probe.counter for probe in probes)
+        elapsed = max(probe.end_time for probe in probes) - min(probe.init_time for probe in probes) if probes else 0
+        return {FileMarker.PRF_CORE_ITERATIONS_PLANNED: run_setup["total_calls"],
+                FileMarker.PRF_CORE_ITERATIONS_CALLS: calls,
+                FileMarker.PRF_CORE_ITERATIONS_ELAPSED: elapsed,
+                FileMarker.PRF_CORE_ITERATIONS_CALL_PER_SEC: calls / elapsed if elapsed > 0 else 0}
+
+    @staticmethod
+    def _create_steady_state(run_setup: RunSetup, series, executors):
+        """
+        Summary for steady state, the ramp-up and ramp-down intervals are trimmed
+
+        :param run_setup:       Setting for executors (parameter 'steady_state' is tolerance of calls
+                                in interval from median or True for default tolerance 0.1)
+        :param series:          Time series merged cross executors
+        :param executors:       Amount of executors
+        :return:                Summary, index of the first and the last interval in steady state or None
+        """
+        if not run_setup["steady_state"] or not series:
+            return None
+        tolerance = 0.1 if run_setup["steady_state"] is True else run_setup["steady_state"]
+        positions = TimeSeries.steady_state(series, tolerance)
+        if positions is None:
+            return None
+
+        count, total, std, min_duration, max_duration = TimeSeries.summary(series, positions[0], positions[1])
+        avrg = total / count if count > 0 else 0
+        call_per_sec_raw = 0 if avrg == 0 else executors / avrg
+        steady = PercentileSummary(1, count, call_per_sec_raw, call_per_sec_raw * run_setup._bulk_row, avrg, std, min_duration, max_duration, executors)
+        return steady, series["first"] + positions[0], series["first"] + positions[1]
+
+    def print_detail(self, run_setup: RunSetup, return_dict, processes, threads, group='', tasks = 1, trial = None):
         """
         Print detail from executors
 
@@ -266,52 +635,206 @@ class Output:
         :param processes:       Number of processes
         :param threads:         Number of threads
         :param group:           Name of group
+        :param tasks:           Number of tasks in event loop (for each thread)
+        :param trial:           Index of trial, the summary is in 'trial' line instead of 'core'
+                                line and the details are in 'trial_detail' lines (None - without repeated trials)
         :return:                Performance, total calls per one second
         """
         if self._detail_output == True:
             for return_key in return_dict:
                 parallel_ret = return_dict[return_key]
-                self.print(f"    {str(parallel_ret) if parallel_ret else ParallelProbe.dump_error('SYSTEM overloaded')}",
+                detail = str(parallel_ret) if parallel_ret else ParallelProbe.dump_error('SYSTEM overloaded')
+                if trial is not None:
+                    # the details of trials are without relation to the 'core' line (e.g. for executor graph)
+                    detail = dumps({**loads(detail), FileMarker.PRF_TYPE: FileMarker.PRF_TRIAL_DETAIL_TYPE},
+                                   separators = OutputSetup().json_separator)
+                self.print(f"    {detail}",
                            f"    {parallel_ret.readable_str() if parallel_ret else ParallelProbe.readable_dump_error('SYSTEM overloaded')}")
 
         # new calculation
         percentile_summaries = self._create_percentile_list(run_setup, return_dict)
+        if ParallelProbe._arrival_interval(run_setup):
+            # open-loop mode, summary also without correction of coordinated omission
+            uncorrected_summaries = self._create_percentile_list(run_setup, return_dict, True)
+            for percentile in percentile_summaries.keys():
+                percentile_summaries[percentile].uncorrected = uncorrected_summaries.get(percentile, None)
+
+        # average probe overhead per call (cross executors)
+        overheads = [response.overhead for response in return_dict.values() if response and response.exception is None and response.overhead is not None]
+        overhead = sum(overheads) / len(overheads) if overheads else None
+
+        # difference between the first and the last start of executors
+        release_times = [response.release_time for response in return_dict.values() if response and response.exception is None and response.release_time]
+        percentile_summaries[1].start_skew = max(release_times) - min(release_times) if release_times else None
+        timeouts = sum(1 for response in return_dict.values() if response and response.timeout)
+        startups = [response.startup for response in return_dict.values() if response and response.startup is not None]
+        percentile_summaries[1].startup = max(startups) if startups else None
+        percentile_summaries[1].full_window = Output._create_full_window(return_dict)
+        percentile_summaries[1].adaptive = run_setup.adaptive
+        percentile_summaries[1].iterations = Output._create_iterations(run_setup, return_dict)
+
+        # time series cross executors
+        series = TimeSeries.merge([response.series.dump() for response in return_dict.values() if response and response.exception is None and response.series])
+        steady = Output._create_steady_state(run_setup, series, percentile_summaries[1].executors)
+        percentile_summaries[1].steady = steady[0] if steady else None
 
         # A2A form
         out = {}
-        out[FileMarker.PRF_TYPE] =  FileMarker.PRF_CORE_TYPE
-        out[FileMarker.PRF_CORE_PLAN_EXECUTOR_ALL] = processes * threads
-        out[FileMarker.PRF_CORE_PLAN_EXECUTOR] = [processes, threads]
+        out[FileMarker.PRF_TYPE] =  FileMarker.PRF_CORE_TYPE if trial is None else FileMarker.PRF_TRIAL_TYPE
+        if trial is not None:
+            out[FileMarker.PRF_TRIAL_TYPE] = trial
+        out[FileMarker.PRF_CORE_PLAN_EXECUTOR_ALL] = processes * threads * tasks
+        out[FileMarker.PRF_CORE_PLAN_EXECUTOR] = [processes, threads] if tasks == 1 else [processes, threads, tasks]
         out[FileMarker.PRF_CORE_REAL_EXECUTOR] = percentile_summaries[1].executors #executors
         out[FileMarker.PRF_CORE_GROUP] = group
-        for result in percentile_summaries.values():
-            suffix = f"_{int(result.percentile * 100)}" if result.percentile < 1 else ""
-            out[FileMarker.PRF_CORE_TOTAL_CALL + suffix] = result.count                         # ok
-            out[FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC_RAW + suffix] = result.call_per_sec_raw  # ok
-            out[FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC + suffix] = result.call_per_sec          # ok
-            out[FileMarker.PRF_CORE_AVRG_TIME + suffix] = result.avrg                           # ok
-            out[FileMarker.PRF_CORE_STD_DEVIATION + suffix] = result.std                        # ok
-            out[FileMarker.PRF_CORE_MIN + suffix] = result.min                                  # ok
-            out[FileMarker.PRF_CORE_MAX + suffix] = result.max                                  # ok
+        Output._summary_dump(out, percentile_summaries.values(), percentile = run_setup["percentile"])
+        if percentile_summaries[1].start_skew is not None:
+            out[FileMarker.PRF_CORE_START_SKEW] = percentile_summaries[1].start_skew
+        if percentile_summaries[1].startup is not None:
+            out[FileMarker.PRF_CORE_STARTUP] = percentile_summaries[1].startup
+        if timeouts > 0:
+            out[FileMarker.PRF_CORE_TIMEOUTS] = timeouts
+        if percentile_summaries[1].full_window:
+            out[FileMarker.PRF_CORE_WINDOW] = percentile_summaries[1].full_window
+        if percentile_summaries[1].adaptive:
+            out[FileMarker.PRF_CORE_ADAPTIVE] = percentile_summaries[1].adaptive
+        if percentile_summaries[1].iterations:
+            out[FileMarker.PRF_CORE_ITERATIONS] = percentile_summaries[1].iterations
+        if percentile_summaries[1].uncorrected:
+            out[FileMarker.PRF_CORE_UNCORRECTED] = Output._summary_dump({}, [summary.uncorrected for summary in percentile_summaries.values() if summary.uncorrected])
+        if overhead is not None:
+            out[FileMarker.PRF_CORE_OVERHEAD] = overhead
+        if series:
+            out[FileMarker.PRF_CORE_SERIES] = series
+        if steady:
+            out[FileMarker.PRF_CORE_STEADY] = Output._summary_dump({FileMarker.PRF_CORE_STEADY_FIRST: steady[1],
+                                                                   FileMarker.PRF_CORE_STEADY_LAST: steady[2]}, [steady[0]])
         out[FileMarker.PRF_CORE_TIME_END] = datetime.utcnow().isoformat(' ')
 
         # human-readable form
         readable_out = {}
-        readable_out[FileMarker.HM_PRF_CORE_PLAN_EXECUTOR_ALL] = f"{processes * threads} [{processes},{threads}]"
+        if trial is not None:
+            readable_out[FileMarker.PRF_TRIAL_TYPE] = trial
+        readable_out[FileMarker.HM_PRF_CORE_PLAN_EXECUTOR_ALL] = f"{processes * threads} [{processes},{threads}]" if tasks == 1 else \
+            f"{processes * threads * tasks} [{processes},{threads},{tasks}]"
         readable_out[FileMarker.HM_PRF_CORE_REAL_EXECUTOR] = percentile_summaries[1].executors # executors
         readable_out[FileMarker.HM_PRF_CORE_GROUP] = group
-        for result in percentile_summaries.values():
-            suffix = f"_{int(result.percentile * 100)}" if result.percentile < 1 else ""
-            readable_out[FileMarker.HM_PRF_CORE_TOTAL_CALL + suffix] = result.count
-            if result.call_per_sec_raw == result.call_per_sec:
-                call_readable = f"{round(result.call_per_sec_raw, OutputSetup().human_precision)}"
-            else:
-                call_readable = f"{round(result.call_per_sec_raw, OutputSetup().human_precision)}/{round(result.call_per_sec, OutputSetup().human_precision)}"
-            readable_out[FileMarker.HM_PRF_CORE_TOTAL_CALL_PER_SEC + suffix] = call_readable
-            readable_out[FileMarker.HM_PRF_CORE_AVRG_TIME + suffix] =  round(result.avrg, OutputSetup().human_precision)
-            readable_out[FileMarker.HM_PRF_CORE_STD_DEVIATION + suffix] = round(result.std, OutputSetup().human_precision)
-            readable_out[FileMarker.PRF_CORE_MIN + suffix] = round(result.min, OutputSetup().human_precision)
-            readable_out[FileMarker.PRF_CORE_MAX + suffix] = round(result.max, OutputSetup().human_precision)
+        Output._summary_dump(readable_out, percentile_summaries.values(), True)
+        if percentile_summaries[1].start_skew is not None:
+            readable_out[FileMarker.HM_PRF_CORE_START_SKEW] = round(percentile_summaries[1].start_skew, OutputSetup().human_precision)
+        if percentile_summaries[1].startup is not None:
+            readable_out[FileMarker.PRF_CORE_STARTUP] = round(percentile_summaries[1].startup, OutputSetup().human_precision)
+        if timeouts > 0:
+            readable_out[FileMarker.PRF_CORE_TIMEOUTS] = timeouts
+        if percentile_summaries[1].full_window:
+            readable_out[FileMarker.PRF_CORE_WINDOW] = {key: round(value, OutputSetup().human_precision) for key, value in percentile_summaries[1].full_window.items()}
+        if percentile_summaries[1].adaptive:
+            readable_out[FileMarker.PRF_CORE_ADAPTIVE] = {key: round(value, OutputSetup().human_precision) if value is not None else None
+                                                          for key, value in percentile_summaries[1].adaptive.items()}
+        if percentile_summaries[1].iterations:
+            readable_out[FileMarker.PRF_CORE_ITERATIONS] = {key: round(value, OutputSetup().human_precision)
+                                                            for key, value in percentile_summaries[1].iterations.items()}
+        if percentile_summaries[1].uncorrected:
+            readable_out[FileMarker.HM_PRF_CORE_UNCORRECTED] = Output._summary_dump({}, [summary.uncorrected for summary in percentile_summaries.values() if summary.uncorrected], True)
+        if overhead is not None:
+            readable_out[FileMarker.HM_PRF_CORE_OVERHEAD] = round(overhead, OutputSetup().human_precision)
+        if series:
+            readable_out[FileMarker.PRF_CORE_SERIES] = series["calls"]
+        if steady:
+            readable_out[FileMarker.PRF_CORE_STEADY] = Output._summary_dump({FileMarker.PRF_CORE_STEADY_FIRST: steady[1],
+                                                                            FileMarker.PRF_CORE_STEADY_LAST: steady[2]}, [steady[0]], True)
+
+        # final dump
+        self.print(f"  {dumps(out, separators = OutputSetup().json_separator)}",
+                    f"  {dumps(readable_out, separators = OutputSetup().human_json_separator)}")
+
+        return percentile_summaries
+
+    @staticmethod
+    def _create_trials(values: list) -> dict:
+        """
+        Mean, standard deviation (sample) and 95% confidence interval (Student's t-distribution)
+
+        :param values:  values from trials (e.g. calls per second)
+        :return:        statistics cross trials
+        """
+        mean, std, low, high = Helper.confidence_interval(values)
+        return {FileMarker.PRF_CORE_TRIALS_COUNT: len(values),
+                FileMarker.PRF_CORE_TRIALS_MEAN: mean,
+                FileMarker.PRF_CORE_TRIALS_STD: std,
+                FileMarker.PRF_CORE_TRIALS_CI_LOW: low,
+                FileMarker.PRF_CORE_TRIALS_CI_HIGH: high}
+
+    def print_trials(self, run_setup: RunSetup, results: list, processes, threads, group='', tasks = 1):
+        """
+        Print summary cross repeated trials of the same executors (the summary of calls cross trials and
+        statistics of throughput cross trials with 95% confidence interval)
+
+        :param run_setup:       Setting for executors
+        :param results:         Performance results from each trial
+        :param processes:       Number of processes
+        :param threads:         Number of threads
+        :param group:           Name of group
+        :param tasks:           Number of tasks in event loop (for each thread)
+        :return:                Summary for each percentile
+        """
+        percentile_summaries = {}
+        for percentile in sorted(set(key for result in results for key in result.percentiles.keys())):
+            summaries = [result[percentile] for result in results if percentile in result.percentiles and result[percentile].count > 0]
+            summary = PercentileSummary(percentile, 0, 0, 0, 0, 0, 0, 0, 0)
+            if summaries:
+                # call-weighted average and pooled variance (combination of M2 from trials)
+                m2 = 0
+                for itm in summaries:
+                    count = summary.count + itm.count
+                    delta = itm.avrg - summary.avrg
+                    summary.avrg += delta * itm.count / count
+                    m2 += itm.std * itm.std * itm.count + delta * delta * summary.count * itm.count / count
+                    summary.count = count
+                summary.std = sqrt(m2 / summary.count)
+                summary.min = min(itm.min for itm in summaries)
+                summary.max = max(itm.max for itm in summaries)
+                # the degraded trial (with less executors) is not hidden
+                summary.executors = min(itm.executors for itm in summaries)
+
+                # throughput as mean cross trials
+                summary.call_per_sec_raw = sum(itm.call_per_sec_raw for itm in summaries) / len(summaries)
+                summary.call_per_sec = sum(itm.call_per_sec for itm in summaries) / len(summaries)
+                walls = [itm.call_per_sec_wall for itm in summaries if itm.call_per_sec_wall is not None]
+                if walls:
+                    summary.call_per_sec_wall_raw = sum(itm.call_per_sec_wall_raw for itm in summaries if itm.call_per_sec_wall_raw is not None) / len(walls)
+                    summary.call_per_sec_wall = sum(walls) / len(walls)
+                summary.trials = Output._create_trials([itm.call_per_sec for itm in summaries])
+            percentile_summaries[percentile] = summary
+
+        # A2A form
+        trials_executors = [result[1].executors if 1 in result.percentiles else 0 for result in results]
+        out = {}
+        out[FileMarker.PRF_TYPE] =  FileMarker.PRF_CORE_TYPE
+        out[FileMarker.PRF_CORE_PLAN_EXECUTOR_ALL] = processes * threads * tasks
+        out[FileMarker.PRF_CORE_PLAN_EXECUTOR] = [processes, threads] if tasks == 1 else [processes, threads, tasks]
+        out[FileMarker.PRF_CORE_REAL_EXECUTOR] = percentile_summaries[1].executors
+        if len(set(trials_executors)) > 1:
+            # the trials with different amount of executors (the real executors are minimum)
+            out[FileMarker.PRF_CORE_TRIALS_EXECUTORS] = trials_executors
+        out[FileMarker.PRF_CORE_GROUP] = group
+        Output._summary_dump(out, percentile_summaries.values(), percentile = run_setup["percentile"])
+        if percentile_summaries[1].trials:
+            out[FileMarker.PRF_CORE_TRIALS] = percentile_summaries[1].trials
+        out[FileMarker.PRF_CORE_TIME_END] = datetime.utcnow().isoformat(' ')
+
+        # human-readable form
+        readable_out = {}
+        readable_out[FileMarker.HM_PRF_CORE_PLAN_EXECUTOR_ALL] = f"{processes * threads} [{processes},{threads}]" if tasks == 1 else \
+            f"{processes * threads * tasks} [{processes},{threads},{tasks}]"
+        readable_out[FileMarker.HM_PRF_CORE_REAL_EXECUTOR] = percentile_summaries[1].executors
+        if len(set(trials_executors)) > 1:
+            readable_out[FileMarker.PRF_CORE_TRIALS_EXECUTORS] = trials_executors
+        readable_out[FileMarker.HM_PRF_CORE_GROUP] = group
+        Output._summary_dump(readable_out, percentile_summaries.values(), True)
+        if percentile_summaries[1].trials:
+            readable_out[FileMarker.PRF_CORE_TRIALS] = {key: round(value, OutputSetup().human_precision)
+                                                        for key, value in percentile_summaries[1].trials.items()}
 
         # final dump
         self.print(f"  {dumps(out, separators = OutputSetup().json_separator)}",
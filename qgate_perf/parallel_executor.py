@@ -1,15 +1,19 @@
-import concurrent.futures
-import multiprocessing
 import os.path
 import gc
+import multiprocessing
+import random
+import asyncio
+import inspect
+import importlib
 from time import sleep
 from qgate_perf.run_setup import RunSetup
 from qgate_perf.helper import GraphScope
 from qgate_perf.parallel_probe import ParallelProbe
 from qgate_perf.run_return import RunReturn
-from platform import python_version
-from packaging import version
+from qgate_perf.executor_pool import ExecutorPool
+from qgate_perf.cpu_affinity import CpuAffinity
 from qgate_perf.output_result import PerfResult, PerfResults, Output
+from qgate_perf.latency_histogram import LatencyHistogram
 
 
 def _executor_wrapper(func, run_return: RunReturn, run_setup: RunSetup):
@@ -27,6 +31,23 @@ def _executor_wrapper(func, run_return: RunReturn, run_setup: RunSetup):
     except Exception as ex:
         run_return.probe=ParallelProbe(None, f"{type(ex).__name__}: {str(ex)}")
 
+async def _async_executor_wrapper(func, run_return: RunReturn, run_setup: RunSetup):
+    """
+    Lightweight internal wrapper for exception handling in async executor (one task in event loop)
+
+    :param func:        original call function in format 'async def my_func(run_setup) -> ParallelProbe'
+    :param run_return:  return object
+    :param run_setup:   setup for run
+    """
+    try:
+        if not func:
+            raise ValueError("Missing function for performance tests, update this code 'ParallelExecutor(null)'.")
+        if not inspect.iscoroutinefunction(func):
+            raise ValueError("Function for executor with tasks has to be in format 'async def my_func(run_setup)'.")
+        run_return.probe=await func(run_setup)
+    except Exception as ex:
+        run_return.probe=ParallelProbe(None, f"{type(ex).__name__}: {str(ex)}")
+
 class ParallelExecutor:
     """ Helper for parallel execution of defined function (via start new process with aim to avoid GIL) """
 
@@ -35,88 +56,255 @@ class ParallelExecutor:
                  label = None,
                  detail_output = True,
                  output_file = None,
-                 init_each_bulk = False):
+                 init_each_bulk = False,
+                 pooled = False,
+                 process_init = None,
+                 process_finish = None,
+                 start_method = None,
+                 preload = None,
+                 group_size = None,
+                 affinity = None):
         """ Setting of execution
 
         :param func:            function for parallel run in format see 'def my_func(run_setup: RunSetup) -> ParallelProbe:'
+                                or 'async def my_func(run_setup: RunSetup) -> ParallelProbe:' (for executors with tasks)
         :param label:           text label for parallel run
         :param detail_output:   provide detailed output from visualization of time, when executor was started
                                 see usage in method create_graph_exec, default is True
         :param output_file:     output to the file, default is without file
         :param init_each_bulk:  call 'init_run' before each bulk (useful e.g. change amount of columns in target),
                                 default is False
+        :param pooled:          executor processes are started only once and kept warm for all steps
+                                in run_executor/run_bulk_executor (saving of time for process start and imports
+                                in each step), default is False (new processes for each step)
+        :param process_init:    function 'def my_init(run_setup: RunSetup) -> object' called once in each process
+                                before start of executors (threads/tasks), the return value (e.g. connection pool)
+                                is shared by all executors in the process via 'run_setup.shared', default is None
+        :param process_finish:  function 'def my_finish(run_setup: RunSetup)' called once in each process after
+                                the end of executors (e.g. close of connection pool), default is None
+        :param start_method:    start method of executor processes 'fork', 'spawn' or 'forkserver', default is None
+                                (the default method of platform)
+        :param preload:         list of module names or functions, called once in current process before start of
+                                the first executor process, the executors started via 'fork' inherit the warmed state
+                                (the modules are also preloaded in server process for 'forkserver'), default is None
+        :param group_size:      hierarchical launch for huge amount of processes, max. amount of processes started
+                                by one sub-coordinator (the sub-coordinators start own groups in parallel and send
+                                return values from the group in one message), default is None (all processes
+                                are started directly)
+        :param affinity:        pinning of executor processes to the CPU cores (via 'os.sched_setaffinity'), the policy
+                                'compact' (one core for each process, neighbour cores), 'spread' (one core for each
+                                process, round-robin cross NUMA nodes), 'numa' (all cores of one NUMA node for each
+                                process), list of cores e.g. [0, 2, 4] or list of lists e.g. [[0, 1], [2, 3]]
+                                (the process N uses item N % length), default is None (without pinning)
         """
         self._func = func
         self._func_wrapper = _executor_wrapper
+        self._async_func_wrapper = _async_executor_wrapper
         self._init_each_bulk = init_each_bulk
+        self._process_init = process_init
+        self._process_finish = process_finish
+        self._start_method = start_method
+        self._preload = preload
+        self._preloaded = False
+        self._group_size = group_size
+        self._affinity = CpuAffinity.plan(affinity)
+        self._pool = ExecutorPool(func, _executor_wrapper, _async_executor_wrapper, process_init, process_finish,
+                                  start_method, self._preload_modules(), group_size, self._affinity) if pooled else None
 
         self._label = label
         self._detail_output = detail_output
         self._output_file = output_file
 
-        # Technical point, how to close Process
-        #   in python >= 3.7 Close() as soft closing
-        #   in python < 3.7 Terminate() as hard closing (the Close method does not exist in python lower versions)
-        self._process_close=True if version.parse(python_version()) >= version.parse("3.7") else False
-
     # region CORE
 
-    def _coreThreadClassPool(self, threads, return_key, return_dict, run_setup: RunSetup):
-        try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-                features = []
-                for threadKey in range(threads):
-                    run_return=RunReturn(f"{return_key}x{threadKey}", return_dict)
-                    features.append(
-                        executor.submit(self._func_wrapper, self._func, run_return, run_setup))
-
-                for future in concurrent.futures.as_completed(features):
-                    future.result()
-        except Exception as ex:
-            print(f"SYSTEM ERROR in '_coreThreadClassPool': {type(ex).__name__} - '{str(ex)}'")
+    @staticmethod
+    def _executor_setting(executors):
+        """
+        Parse one item from executor list, supported formats are [processes, threads, 'label']
+        and [processes, threads, tasks, 'label'] (label is optional)
 
-    def _executeCore(self, run_setup: RunSetup, return_dict, processes=2, threads=2):
+        :param executors:   item from executor list
+        :return:            processes, threads, tasks, label
+        """
+        processes, threads, tasks, group = executors[0], executors[1], 1, ''
+        if len(executors) > 2:
+            if isinstance(executors[2], int):
+                tasks = executors[2]
+                group = '' if len(executors) <= 3 else executors[3]
+            else:
+                group = executors[2]
+        return processes, threads, tasks, group
+
+    def _preload_modules(self) -> list:
+        """Module names from preload (for server process in 'forkserver' start method)"""
+        return [item for item in self._preload if isinstance(item, str)] if self._preload else None
+
+    def _preload_run(self):
+        """Preload of modules and call of functions in current process (only once, before start of executor processes)"""
+        if self._preloaded or not self._preload:
+            return
+        self._preloaded = True
+        for item in self._preload:
+            if callable(item):
+                item()
+            else:
+                importlib.import_module(item)
 
-        proc = []
-        # define synch time for run of all executors
-        run_setup.set_start_time()
+    def _pool_open(self, executor_list) -> bool:
+        """
+        Open pool of warm processes (only in pooled mode)
+
+        :param executor_list:   list of executors, the pool will start max. amount of requested processes
+        :return:                True - pool was opened in this call (the caller is responsible for close)
+        """
+        if self._pool is None or self._pool.is_open:
+            return False
+        self._preload_run()
+        self._pool.open(max([executors[0] for executors in executor_list]))
+        return True
+
+    def _pool_close(self, opened: bool):
+        """Close pool of warm processes, only in case that the pool was opened by caller"""
+        if opened:
+            self._pool.close()
+
+    def _executeCore(self, run_setup: RunSetup, processes=2, threads=2, tasks=1) -> dict:
+        """
+        Execute one step (processes x threads x tasks) with new processes or with warm processes from pool
+
+        :param run_setup:   setup of execution
+        :param processes:   amount of processes
+        :param threads:     amount of threads
+        :param tasks:       amount of tasks in event loop (for each thread)
+        :return:            return values from executors (with error of execution, if the executors were
+                            not executed)
+        """
+        return_dict = {}
+        pool = self._pool if self._pool else ExecutorPool(self._func, self._func_wrapper, self._async_func_wrapper,
+                                                          self._process_init, self._process_finish,
+                                                          self._start_method, self._preload_modules(), self._group_size,
+                                                          self._affinity)
 
         try:
-            if threads == 1:
-                for process_key in range(processes):
-                    run_return = RunReturn(process_key, return_dict)
-                    p = multiprocessing.Process(target=self._func_wrapper,
-                                args=(self._func, run_return, run_setup))
-                    proc.append(p)
-            else:
-                for process_key in range(processes):
-                    p = multiprocessing.Process(target=self._coreThreadClassPool,
-                                args=(threads, process_key, return_dict, run_setup))
-                    proc.append(p)
-
-            # start all
-            for p in proc:
-                p.start()
-
-            # wait for finish
-            for p in proc:
-                p.join()
-                if self._process_close:
-                    p.close()       # soft close
-                else:
-                    p.terminate()   # hard close
+            # define synch time for run of all executors
+            run_setup.set_start_time()
+            run_setup.set_executors(processes * threads * tasks)
+
+            if not pool.is_open:
+                self._preload_run()
+                pool.open(processes)
+            return_dict = pool.execute(run_setup, processes, threads, tasks)
         except Exception as ex:
             print(f"SYSTEM ERROR in '_executeCore': '{str(ex)}'")
+            # the error is part of return values (the step is not valid)
+            if not return_dict:
+                return_dict = {0: ParallelProbe(None, f"SYSTEM ERROR in '_executeCore': {type(ex).__name__} - '{str(ex)}'")}
+        finally:
+            # new processes for each step (without pool)
+            if pool is not self._pool:
+                pool.close()
+        return return_dict
+
+    def _run_step(self, output: Output, run_setup: RunSetup, processes, threads, tasks = 1, group = '', trial = None) -> PerfResult:
+        """
+        Execute one step (processes x threads x tasks) and print outputs
+
+        :param output:      output for print of details
+        :param run_setup:   setup of execution
+        :param processes:   amount of processes
+        :param threads:     amount of threads
+        :param tasks:       amount of tasks in event loop (for each thread)
+        :param group:       label for group of executors
+        :param trial:       index of trial (None - without repeated trials)
+        :return:            performance result for the step
+        """
+        return_dict = self._executeCore(run_setup, processes, threads, tasks)
+        percentile_list = output.print_detail(run_setup,
+                                              return_dict,
+                                              processes,
+                                              threads,
+                                              group,
+                                              tasks,
+                                              trial)
+
+        # check state
+        result = PerfResult(self._get_summary_state(return_dict, processes * threads * tasks),
+                            run_setup.bulk_row,
+                            run_setup.bulk_col,
+                            processes,
+                            threads,
+                            percentile_list,
+                            tasks)
+
+        # memory clean
+        del return_dict
+        gc.collect(generation = 2)
+        return result
+
+    @staticmethod
+    def _trial_plan(executors, trials, order = None) -> list:
+        """
+        Order of executions for repeated trials
+
+        :param executors:   amount of items in executor list
+        :param trials:      amount of trials for each item
+        :param order:       'interleaved' (all executors in each trial, the drift is spread cross
+                            executors), 'random' (random order of all executions) or None (sequential,
+                            all trials for executors and then the next executors)
+        :return:            list of executions [(index of executors, index of trial), ...]
+        """
+        if order == "interleaved":
+            return [(index, trial) for trial in range(trials) for index in range(executors)]
+        plan = [(index, trial) for index in range(executors) for trial in range(trials)]
+        if order == "random":
+            random.shuffle(plan)
+        elif order:
+            raise ValueError(f"Invalid order of trials '{order}', accepted values are 'interleaved', 'random' or None.")
+        return plan
+
+    @staticmethod
+    def _search(value, limit, accept, precision = None):
+        """
+        Search of the highest accepted value, the value is doubled till it is accepted and
+        then the interval between the last accepted and the first refused value is bisected
+
+        :param value:       start value
+        :param limit:       max. value (None - without limit)
+        :param accept:      function accept(step, best) -> bool, the test of next step against the best value
+        :param precision:   relative precision of bisection for float values (None - integer values)
+        :return:            the highest accepted value
+        """
+        # doubling
+        best, upper = value, None
+        while limit is None or best < limit:
+            step = best * 2 if limit is None else min(best * 2, limit)
+            if accept(step, best):
+                best = step
+            else:
+                upper = step
+                break
+
+        # bisection
+        while upper and upper - best > (1 if precision is None else best * precision):
+            step = (best + upper) // 2 if precision is None else (best + upper) / 2
+            if accept(step, best):
+                best = step
+            else:
+                upper = step
+        return best
 
     # endregion CORE
 
-    def _get_summary_state(self, return_dict):
+    def _get_summary_state(self, return_dict, executors = None):
         """
         Check, if the processing was fine based on check exception in each executor
 
         :param return_dict:     Outputs from executors
-        :return:                True - all is fine, False - some exception
+        :param executors:       Amount of planned executors (None - without check of amount)
+        :return:                True - all is fine, False - some exception or missing executors
         """
+        if not return_dict or (executors is not None and len(return_dict) < executors):
+            return False
         for return_key in return_dict:
             parallel_ret = return_dict[return_key]
             if parallel_ret is None:
@@ -137,6 +325,7 @@ class ParallelExecutor:
 
         :param bulk_list:           list of bulks for execution in format [[rows, columns], ...]
         :param executor_list:       list of executors for execution in format [[processes, threads, 'label'], ...]
+                                    or [[processes, threads, tasks, 'label'], ...] for 'async def' function
         :param run_setup:           setup of execution
         :param sleep_between_bulks: sleep between bulks
         :param performance_detail:  add to the return also performance details or only state info (default is False - only state info)
@@ -146,23 +335,28 @@ class ParallelExecutor:
         performance = PerfResults()
         count = 0
 
-        for bulk in bulk_list:
+        # warm processes for all bulks (only in pooled mode)
+        pool_opened = self._pool_open(executor_list)
+        try:
+            for bulk in bulk_list:
 
-            # sleep before other bulk
-            count += 1
-            if count>1:
-                sleep(sleep_between_bulks)
+                # sleep before other bulk
+                count += 1
+                if count>1:
+                    sleep(sleep_between_bulks)
 
-            # execute
-            run_setup.set_bulk(bulk[0], bulk[1])
-            bulk_performance = self.run_executor(executor_list, run_setup, performance_detail)
-            if performance_detail:
-                performance.append(bulk_performance)
-            else:
-                performance.add_state(bulk_performance.state)
+                # execute
+                run_setup.set_bulk(bulk[0], bulk[1])
+                bulk_performance = self.run_executor(executor_list, run_setup, performance_detail)
+                if performance_detail:
+                    performance.append(bulk_performance)
+                else:
+                    performance.add_state(bulk_performance.state)
 
-            # memory clean
-            gc.collect(generation = 2)
+                # memory clean
+                gc.collect(generation = 2)
+        finally:
+            self._pool_close(pool_opened)
 
         return performance
 
@@ -172,6 +366,7 @@ class ParallelExecutor:
         """ Run executor sequences
 
         :param executor_list:       list of executors for execution in format [[processes, threads, 'label'], ...]
+                                    or [[processes, threads, tasks, 'label'], ...] for 'async def' function
         :param run_setup:           setup of execution
         :param performance_detail:  add to the return also performance details or only state info (default is False - only state info)
         :return:                    return performance results (see the param 'performance_detail') with key information about the 'state'.
@@ -179,6 +374,7 @@ class ParallelExecutor:
         """
         performance = PerfResults()
         output = None
+        pool_opened = False
 
         print('Execution...')
 
@@ -190,31 +386,37 @@ class ParallelExecutor:
             output.open()
             output.print_header(run_setup)
 
-            for executors in executor_list:
-                # execution
-                with multiprocessing.Manager() as manager:
-                    return_dict = manager.dict()
-                    self._executeCore(run_setup, return_dict, executors[0], executors[1])
-                    percentile_list = output.print_detail(run_setup,
-                                                          return_dict,
-                                                          executors[0],
-                                                          executors[1],
-                                                          '' if len(executors) <= 2 else executors[2])
-
-                    # check state
-                    state = self._get_summary_state(return_dict)
-                    if performance_detail:
-                        performance.append(PerfResult(state,
-                                                      run_setup.bulk_row,
-                                                      run_setup.bulk_col,
-                                                      executors[0],
-                                                      executors[1],
-                                                      percentile_list))
-                    else:
-                        performance.add_state(state)
+            # warm processes for all executors (only in pooled mode)
+            pool_opened = self._pool_open(executor_list)
 
-                # memory clean
-                gc.collect(generation = 2)
+            # repeated trials for each executors (in order sequential, interleaved or random)
+            trials = run_setup["trials"] if run_setup["trials"] else 1
+            plan = ParallelExecutor._trial_plan(len(executor_list), trials, run_setup["trials_order"])
+            trial_results = [[] for executors in executor_list]
+            results = {}
+
+            for index, trial in plan:
+                processes, threads, tasks, group = ParallelExecutor._executor_setting(executor_list[index])
+
+                # execution
+                trial_results[index].append(self._run_step(output, run_setup, processes, threads, tasks, group,
+                                                           trial if trials > 1 else None))
+                if trials > 1 and len(trial_results[index]) == trials:
+                    # summary cross all trials (right after the last trial of the executors)
+                    results[index] = PerfResult(all(trial.state for trial in trial_results[index]),
+                                                run_setup.bulk_row,
+                                                run_setup.bulk_col,
+                                                processes,
+                                                threads,
+                                                output.print_trials(run_setup, trial_results[index], processes, threads, group, tasks),
+                                                tasks)
+
+            for index, executors in enumerate(executor_list):
+                result = results[index] if trials > 1 else trial_results[index][0]
+                if performance_detail:
+                    performance.append(result)
+                else:
+                    performance.add_state(result.state)
 
             output.print_footer(performance.state)
 
@@ -222,23 +424,203 @@ class ParallelExecutor:
             output.print(f"SYSTEM ERROR in 'run_executor': {type(ex).__name__} - '{str(ex) if ex is not None else '!! Noname exception !!'}'")
             performance.add_state(False)
         finally:
+            self._pool_close(pool_opened)
             if output:
                 output.close()
 
         return performance
 
-    def run(self, processes = 2, threads = 2, run_setup: RunSetup = None, performance_detail = False) -> PerfResults:
+    def run_saturation(self,
+                       run_setup: RunSetup = None,
+                       max_processes = None,
+                       max_threads = 1,
+                       tasks = 1,
+                       min_gain = 0.05,
+                       latency_limit = None) -> PerfResults:
+        """ Search of executors with max. throughput (saturation point). The amount of processes is doubled
+        till the throughput grows (at least about 'min_gain') and the latency is under limit, then the interval
+        between the last improvement and the first failure is bisected. The same search is repeated for
+        threads (with the best amount of processes).
+
+        :param run_setup:       setup of execution
+        :param max_processes:   max. amount of processes (default is amount of CPU)
+        :param max_threads:     max. amount of threads (default is 1, without search of threads)
+        :param tasks:           how much tasks in event loop will be used for each thread (for 'async def' function)
+        :param min_gain:        min. relative gain of throughput for next step (default is 0.05 = 5%)
+        :param latency_limit:   max. ratio of average latency to the latency of the first step
+                                (e.g. 2 = max. two times slower calls), default is None (without limit)
+        :return:                performance results for all explored executors (in order of execution),
+                                the best executors are in 'best'. The state True - all executions was without
+                                exceptions/errors, False - some exceptions.
+        """
+        performance = PerfResults()
+        output = None
+        pool_opened = False
+        max_processes = max_processes if max_processes else multiprocessing.cpu_count()
+        explored = {}
+
+        def measure(processes, threads) -> PerfResult:
+            if explored.get((processes, threads), None) is None:
+                explored[(processes, threads)] = self._run_step(output, run_setup, processes, threads, tasks, "saturation")
+                performance.append(explored[(processes, threads)])
+            return explored[(processes, threads)]
+
+        def better(result: PerfResult, best: PerfResult) -> bool:
+            if not result.state:
+                return False
+            if latency_limit and result[1].avrg > explored[(1, 1)][1].avrg * latency_limit:
+                return False
+            return result[1].call_per_sec > best[1].call_per_sec * (1 + min_gain)
+
+        def search(limit, create) -> int:
+            def accept(step, best) -> bool:
+                best_result = measure(*create(best))
+                return better(measure(*create(step)), best_result)
+            return ParallelExecutor._search(1, limit, accept)
+
+        print('Execution...')
+
+        try:
+            if self._init_each_bulk:
+                self.init_run(run_setup)
+
+            output = Output(self._label, self._detail_output, self._output_file)
+            output.open()
+            output.print_header(run_setup)
+
+            # warm processes for all steps (only in pooled mode)
+            pool_opened = self._pool_open([[max_processes, max_threads]])
+
+            # the start value is measured always (the search without steps e.g. for max_processes = 1)
+            measure(1, 1)
+            processes = search(max_processes, lambda step: (step, 1))
+            threads = search(max_threads, lambda step: (processes, step))
+            performance.best = explored[(processes, threads)]
+
+            output.print(f"############### Saturation: {processes}x{threads}x{tasks} executors, "
+                         f"{performance.best[1].call_per_sec} calls/sec ###############")
+            output.print_footer(performance.state)
+
+        except Exception as ex:
+            output.print(f"SYSTEM ERROR in 'run_saturation': {type(ex).__name__} - '{str(ex) if ex is not None else '!! Noname exception !!'}'")
+            performance.add_state(False)
+        finally:
+            self._pool_close(pool_opened)
+            if output:
+                output.close()
+
+        return performance
+
+    def run_capacity(self,
+                     run_setup: RunSetup = None,
+                     slo = 0.05,
+                     percentile = None,
+                     max_processes = None,
+                     threads = 1,
+                     tasks = 1,
+                     max_arrival_rate = None,
+                     precision = 0.05) -> PerfResults:
+        """ Search of capacity under SLO, the max. load, where the latency in percentile stays below
+        the bound (the knee point). The load is amount of processes (the closed loop) or arrival rate
+        cross all executors (the open-loop mode, with parameter 'arrival_rate' or 'arrival_rate_total'
+        in run setup). The load is doubled till the SLO is valid and then the interval between the
+        last valid and the first invalid load is bisected. The knee point and the curve of latency
+        vs throughput are in the output file.
+
+        :param run_setup:           setup of execution, with requested 'percentile'
+        :param slo:                 max. latency in seconds for the percentile (default is 0.05 = 50 ms)
+        :param percentile:          percentile for SLO, it has to be in run setup (default is the first
+                                    percentile from run setup)
+        :param max_processes:       max. amount of processes for search (in open-loop mode the fixed
+                                    amount of processes), default is amount of CPU
+        :param threads:             how much threads will be used for each process
+        :param tasks:               how much tasks in event loop will be used for each thread (for 'async def' function)
+        :param max_arrival_rate:    max. arrival rate for search in open-loop mode (default is None, without limit)
+        :param precision:           relative precision of arrival rate for search in open-loop mode (default is 0.05 = 5%)
+        :return:                    performance results for all explored loads (in order of execution), the knee
+                                    point is in 'best' (None - the SLO is not valid for the min. load). The state
+                                    True - all executions was without exceptions/errors, False - some exceptions.
+        """
+        if not run_setup.exist("percentile"):
+            raise ValueError("Capacity under SLO requires parameter 'percentile' in run setup.")
+        percentiles = LatencyHistogram.percentile_list(run_setup["percentile"])
+        percentile = percentile if percentile else percentiles[0]
+        if percentile not in percentiles:
+            raise ValueError(f"Percentile '{percentile}' for SLO is not in run setup, the available percentiles are {percentiles}.")
+
+        performance = PerfResults()
+        output = None
+        pool_opened = False
+        max_processes = max_processes if max_processes else multiprocessing.cpu_count()
+        open_loop = run_setup.exist("arrival_rate") or run_setup.exist("arrival_rate_total")
+        explored = {}
+
+        def measure(load) -> PerfResult:
+            if explored.get(load, None) is None:
+                if open_loop:
+                    setup = run_setup.parameter_copy({"arrival_rate": None, "arrival_rate_total": load})
+                    explored[load] = self._run_step(output, setup, max_processes, threads, tasks, "capacity")
+                else:
+                    explored[load] = self._run_step(output, run_setup, load, threads, tasks, "capacity")
+                performance.append(explored[load])
+            return explored[load]
+
+        def valid(load) -> bool:
+            result = measure(load)
+            return result.state and result[1].count > 0 and result[percentile].max <= slo
+
+        print('Execution...')
+
+        try:
+            if self._init_each_bulk:
+                self.init_run(run_setup)
+
+            output = Output(self._label, self._detail_output, self._output_file)
+            output.open()
+            output.print_header(run_setup)
+
+            # warm processes for all steps (only in pooled mode)
+            pool_opened = self._pool_open([[max_processes, threads]])
+
+            # the min. load has to be valid
+            knee = None
+            start = 1
+            if open_loop:
+                start = run_setup["arrival_rate_total"] if run_setup["arrival_rate_total"] else run_setup["arrival_rate"] * max_processes * threads * tasks
+            if valid(start):
+                if open_loop:
+                    knee = ParallelExecutor._search(start, max_arrival_rate, lambda step, best: valid(step), precision)
+                else:
+                    knee = ParallelExecutor._search(start, max_processes, lambda step, best: valid(step))
+            performance.best = explored[knee] if knee is not None else None
+
+            output.print_capacity(slo, percentile, knee, explored, open_loop)
+            output.print_footer(performance.state)
+
+        except Exception as ex:
+            output.print(f"SYSTEM ERROR in 'run_capacity': {type(ex).__name__} - '{str(ex) if ex is not None else '!! Noname exception !!'}'")
+            performance.add_state(False)
+        finally:
+            self._pool_close(pool_opened)
+            if output:
+                output.close()
+
+        return performance
+
+    def run(self, processes = 2, threads = 2, run_setup: RunSetup = None, performance_detail = False, tasks = 1) -> PerfResults:
         """ Run execution of parallel call
 
         :param processes:       how much processes will be used
         :param threads:         how much threads will be used
         :param run_setup:       setup of execution
         :param performance_detail:  add to the return also performance details or only state info (default is False - only state info)
+        :param tasks:           how much tasks in event loop will be used for each thread (for 'async def' function)
         :return:                    return performance results (see the param 'performance_detail') with key information about the 'state'.
                                     The state True - all executions was without exceptions/errors, False - some exceptions.
         """
         performance = PerfResults()
         output = None
+        pool_opened = False
 
         print('Execution...')
 
@@ -254,23 +636,24 @@ class ParallelExecutor:
             output.print_header(run_setup)
 
             # Execution
-            with multiprocessing.Manager() as manager:
-                return_dict = manager.dict()
-                self._executeCore(run_setup, return_dict, processes, threads)
-                percentile_list = output.print_detail(run_setup, return_dict, processes, threads)
+            pool_opened = self._pool_open([[processes, threads]])
+            return_dict = self._executeCore(run_setup, processes, threads, tasks)
+            percentile_list = output.print_detail(run_setup, return_dict, processes, threads, tasks = tasks)
 
-                # check state
-                state = self._get_summary_state(return_dict)
-                if performance_detail:
-                    performance.append(PerfResult(state,
-                                                  run_setup.bulk_row,
-                                                  run_setup.bulk_col,
-                                                  processes,
-                                                  threads,
-                                                  percentile_list))
-                else:
-                    performance.add_state(state)
+            # check state
+            state = self._get_summary_state(return_dict, processes * threads * tasks)
+            if performance_detail:
+                performance.append(PerfResult(state,
+                                              run_setup.bulk_row,
+                                              run_setup.bulk_col,
+                                              processes,
+                                              threads,
+                                              percentile_list,
+                                              tasks))
+            else:
+                performance.add_state(state)
 
+            del return_dict
             gc.collect(generation = 2)
             output.print_footer(performance.state)
 
@@ -278,6 +661,7 @@ class ParallelExecutor:
             output.print(f"SYSTEM ERROR in 'run': '{str(e) if e is not None else '!! Noname exception !!'}'")
             performance.add_state(False)
         finally:
+            self._pool_close(pool_opened)
             if output:
                 output.close()
 
@@ -344,8 +728,21 @@ class ParallelExecutor:
             run_setup = RunSetup(duration_second=0, start_delay=0)
         run_setup.set_start_time()
 
-        # test call
-        self._func_wrapper(self._func, run_return, run_setup)
+        # test call (with process init and finish in current process)
+        try:
+            run_setup.set_shared(self._process_init(run_setup) if self._process_init else None)
+        except Exception as ex:
+            run_return.probe = ParallelProbe(None, f"{type(ex).__name__}: {str(ex)}")
+        else:
+            try:
+                if inspect.iscoroutinefunction(self._func):
+                    asyncio.run(self._async_func_wrapper(self._func, run_return, run_setup))
+                else:
+                    self._func_wrapper(self._func, run_return, run_setup)
+            finally:
+                if self._process_finish:
+                    self._process_finish(run_setup)
+                run_setup.set_shared(None)
 
         # return output
         ret = dictionary[key]
@@ -1,13 +1,19 @@
 import os
+import asyncio
 from json import dumps
-from time import time, sleep, perf_counter
+from time import time, sleep, perf_counter, perf_counter_ns
+from array import array
+import numpy
+from random import random
 from datetime import datetime
 from qgate_perf.standard_deviation import StandardDeviation
 from qgate_perf.file_marker import FileMarker
 from qgate_perf.run_setup import RunSetup
 from qgate_perf.output_setup import OutputSetup
 from math import nan
-from qgate_perf.percentile_heap import PercentileHeap
+from qgate_perf.latency_histogram import LatencyHistogram
+from qgate_perf.time_series import TimeSeries
+from qgate_perf.executor_sync import ExecutorSync
 from sys import float_info
 
 
@@ -22,11 +28,146 @@ class PercentileItem:
         self.max = max
         self.std = std
 
-class ParallelProbe:
-    """ Provider probe for parallel test tuning """
+class ProbeStatistics:
+    """ Incremental statistics for one series of durations (calls, total, min, max, std and percentiles) """
 
     MIN_DURATION = float_info.max
 
+    def __init__(self, percentile = None, precision = None):
+        """
+        Init of statistics
+
+        :param percentile:      requested percentile or list of percentiles e.g. 0.99 or [0.5, 0.9, 0.99, 0.999]
+                                (None - without percentile calculation)
+        :param precision:       relative precision of histogram for percentile calculation (default is 0.01 = 1%)
+        """
+        self.counter = 0
+        self.total_duration = 0
+        self.min_duration = ProbeStatistics.MIN_DURATION
+        self.max_duration = 0
+        self.standard_deviation = 0
+
+        # for percentile calculation
+        self.percentile_results = []
+        if percentile is not None:
+            # log-bucketed histogram (fixed memory, all statistics are calculated from histogram)
+            self.percentiles = LatencyHistogram.percentile_list(percentile)
+            self.histogram = LatencyHistogram(precision if precision else LatencyHistogram.PRECISION)
+            self.call_fn = self.histogram.record
+            self.batch_fn = self.histogram.record_batch
+            self.repeat_fn = self.histogram.record_repeated
+        else:
+            # init incremental calculation of standard deviation
+            self.stddev = StandardDeviation(ddof = 0)
+            self.histogram = None
+            self.call_fn = self._core_calc
+            self.batch_fn = self._core_calc_batch
+            self.repeat_fn = self._core_calc_repeated
+        self.close_fn = self._core_close
+
+    @property
+    def calls(self):
+        """Amount of measured calls (the counter is updated from histogram only at the end)"""
+        return self.histogram.count if self.histogram else self.counter
+
+    def _core_calc(self, duration_one_shot):
+        """Core for calculation (and simulation)"""
+
+        self.counter += 1
+        self.total_duration += duration_one_shot
+
+        # calc standard deviation incrementally
+        self.stddev.include(duration_one_shot)
+
+        # setup new min
+        if duration_one_shot < self.min_duration:
+            self.min_duration = duration_one_shot
+
+        # setup new max
+        if duration_one_shot > self.max_duration:
+            self.max_duration = duration_one_shot
+
+    def _core_calc_batch(self, durations):
+        """Core for calculation of more values (numpy array)"""
+        if len(durations) == 0:
+            return
+
+        count = len(durations)
+        total = float(durations.sum())
+        self.counter += count
+        self.total_duration += total
+
+        # calc standard deviation for batch
+        self.stddev.include_batch(count, total / count, float(numpy.square(durations - total / count).sum()))
+
+        # setup new min, max
+        self.min_duration = min(self.min_duration, float(durations.min()))
+        self.max_duration = max(self.max_duration, float(durations.max()))
+
+    def _core_calc_repeated(self, duration_one_shot, count):
+        """Core for calculation of the same value more times"""
+
+        self.counter += count
+        self.total_duration += duration_one_shot * count
+
+        # calc standard deviation (all values are the same)
+        self.stddev.include_batch(count, duration_one_shot, 0.0)
+
+        # setup new min, max
+        if duration_one_shot < self.min_duration:
+            self.min_duration = duration_one_shot
+        if duration_one_shot > self.max_duration:
+            self.max_duration = duration_one_shot
+
+    def _core_close(self):
+
+        if self.histogram:
+            # Store all values for each percentile (from histogram)
+            for percentile in self.percentiles:
+                self.percentile_results.append(PercentileItem(percentile, *self.histogram.summary(percentile)))
+            (self.counter, self.total_duration, self.standard_deviation,
+             self.min_duration, self.max_duration) = self.histogram.summary(1)
+        else:
+            # calc standard deviation
+            self.standard_deviation = self.stddev.std
+            del self.stddev
+
+        self.percentile_results.append(PercentileItem(1,
+                                              self.counter,
+                                              self.total_duration,
+                                              self.standard_deviation,
+                                              self.min_duration,
+                                              self.max_duration))
+
+    def _percentile_dump(self, data, readable = False):
+        """Add values for each percentile to the data (in file or in readable form)"""
+
+        for result in self.percentile_results:
+            suffix = LatencyHistogram.percentile_suffix(result.percentile)
+            if readable:
+                data[FileMarker.HR_PRF_DETAIL_CALLS + suffix] = result.count
+                data[FileMarker.HR_PRF_DETAIL_AVRG + suffix] = nan if result.count == 0 else round(result.total_duration / result.count, OutputSetup().human_precision)
+                data[FileMarker.PRF_DETAIL_MIN + suffix] = round(result.min, OutputSetup().human_precision)
+                data[FileMarker.PRF_DETAIL_MAX + suffix] = round(result.max, OutputSetup().human_precision)
+                data[FileMarker.HR_PRF_DETAIL_STDEV + suffix] = round(result.std, OutputSetup().human_precision)
+                data[FileMarker.HR_PRF_DETAIL_TOTAL + suffix] = round(result.total_duration, OutputSetup().human_precision)
+            else:
+                data[FileMarker.PRF_DETAIL_CALLS + suffix] = result.count               # for perf graph
+                data[FileMarker.PRF_DETAIL_AVRG + suffix] = nan if result.count == 0 else result.total_duration / result.count
+                data[FileMarker.PRF_DETAIL_MIN + suffix] = result.min                   # info
+                data[FileMarker.PRF_DETAIL_MAX + suffix] = result.max                   # info
+                data[FileMarker.PRF_DETAIL_STDEV + suffix] = result.std                 # for perf graph
+                data[FileMarker.PRF_DETAIL_TOTAL + suffix] = result.total_duration      # for perf graph
+        return data
+
+class ParallelProbe(ProbeStatistics):
+    """ Provider probe for parallel test tuning """
+
+    MIN_DURATION = ProbeStatistics.MIN_DURATION
+    FAST_CHECK_INTERVAL = 0.01          # target interval (in seconds) between checks of deadline in fast-path mode
+    FAST_CHECK_MAX = 4096               # max. amount of calls between checks of deadline in fast-path mode
+    BATCH_SIZE_MAX = 2 ** 30            # max. amount of operations in one sample in batch mode
+
     def __init__(self, run_setup: RunSetup, exception=None):
         """
         Init for parallel run & procedure for executor synchronization
@@ -37,6 +178,22 @@ class ParallelProbe:
         self.counter = 0
         self.pid = os.getpid()
         self.exception = exception
+        self.uncorrected = None
+        self.arrival_interval = None
+        self.overhead = None
+        self.batch_size = 1
+        self.series = None
+        self.release_time = None
+        self.end_time = None
+        self._sync = None
+        self._sync_owner = True
+        self._calls_slot = None
+        self.calls_limit = None
+        self.startup = None
+        self.cores = None
+        self.timeout = False
+        self._global = False
+        self._watch_slot = None
 
         if exception is None:
             self.total_duration = 0
@@ -45,32 +202,80 @@ class ParallelProbe:
             self.standard_deviation = 0
             self.track_init = datetime.utcnow()
             if run_setup:
-                # init incremental calculation of standard deviation
-                self.stddev = StandardDeviation(ddof = 0)
+                # init incremental calculation of standard deviation and percentiles
+                super().__init__(run_setup["percentile"], run_setup["percentile_precision"])
+
+                # global stop from coordinator via shared memory (not for warm-up based on amount of calls
+                # and not for fixed iterations)
+                global_stop = run_setup.sync is not None and not run_setup["warmup_calls"] and not run_setup["total_calls"]
+
+                # fixed-iteration mode (the executor stops after own share of total calls)
+                self.calls_limit = run_setup.calls_share
+
+                # open-loop mode (calls are scheduled based on arrival rate)
+                self.arrival_interval = ParallelProbe._arrival_interval(run_setup)
+                if self.arrival_interval:
+                    # durations measured from the actual start (without correction of coordinated omission)
+                    self.uncorrected = ProbeStatistics(run_setup["percentile"], run_setup["percentile_precision"])
+                    self.schedule_time = None
+                    self.start = self._open_loop_start
+                    self.stop = self._open_loop_stop
+                elif run_setup["batch_duration"]:
+                    # batch mode (one sample contains 'batch_size' operations, statistics are for one operation)
+                    self.batch_duration = run_setup["batch_duration"]
+                    self.batch_calibration = True
+                    self.stop = self._batch_stop
+                elif run_setup["fast_probe"]:
+                    # fast-path mode (integer timer, durations in buffer, deadline is checked only each N calls)
+                    self.buffer = array('q')
+                    self.check_size = 1
+                    self.start = self._fast_start
+                    self.stop = self._fast_stop
+                elif self.calls_limit is not None:
+                    self.stop = self._calls_stop
+                elif global_stop:
+                    self.stop = self._adaptive_stop if run_setup["adaptive_precision"] else self._global_stop
 
                 # wait for other executors
-                ParallelProbe._wait_for_others(run_setup.when_start)
+                watchdog = run_setup.sync is not None and run_setup["watchdog"]
+                self._sync = ParallelProbe._wait_for_start(run_setup, global_stop or watchdog, sync = run_setup.sync_access)
+                self._sync_owner = run_setup.sync_access is None
+                self._sync_values = self._sync.values if self._sync else None
+                self._global = global_stop
+                if self._sync and run_setup["adaptive_precision"] and global_stop:
+                    # amount of calls for adaptive duration (the coordinator reads it from shared memory)
+                    self._calls_slot = self._sync.calls_slot(run_setup.executor_index)
+                self.release_time = time()
 
                 self.duration_second = run_setup.duration_second
 
                 # key part of init timer (import for stop parallel run)
                 self.init_time = time()
+                self.check_time = self.init_time
+                self.loop_time = perf_counter()
                 self.track_start = datetime.utcnow()
                 self.track_end = datetime(1970, 1, 1)
 
-                # for percentile calculation
-                self.percentile_results = []
-                if run_setup.exist("percentile"):
-                    self.heap = PercentileHeap(self._core_calc,
-                                               self._core_close,
-                                               run_setup["percentile"],
-                                               run_setup["heap_init_size"] if run_setup["heap_init_size"] else 127)
-                    self.call_fn = self.heap.call
-                    self.close_fn = self.heap.close
-                else:
-                    self.heap = None
-                    self.call_fn = self._core_calc
-                    self.close_fn = self._core_close
+                # time series (calls and durations for each interval), it is needed also for detection of steady state
+                if run_setup["time_series"] or run_setup["steady_state"]:
+                    self.series = TimeSeries(self.loop_time,
+                                             run_setup["time_series"] if run_setup["time_series"] else 1,
+                                             run_setup["time_series_size"] if run_setup["time_series_size"] else 3600)
+                    self._series_call_fn, self._series_batch_fn, self._series_repeat_fn = self.call_fn, self.batch_fn, self.repeat_fn
+                    self.call_fn, self.batch_fn, self.repeat_fn = self._series_call, self._series_batch, self._series_repeat
+
+                # partial statistics in shared memory (the watchdog reports them for hung executor)
+                if watchdog:
+                    self._watch_slot = self._sync.slot(run_setup.executor_index)
+                    self._watch_call_fn, self._watch_batch_fn, self._watch_repeat_fn = self.call_fn, self.batch_fn, self.repeat_fn
+                    self.call_fn, self.batch_fn, self.repeat_fn = self._watch_call, self._watch_batch, self._watch_repeat
+
+                # warm-up (the function is called, but the values are not included in statistics)
+                if run_setup["warmup_duration"] or run_setup["warmup_calls"]:
+                    self.warmup_end = self.init_time + (run_setup["warmup_duration"] if run_setup["warmup_duration"] else 0)
+                    self.warmup_calls = run_setup["warmup_calls"] if run_setup["warmup_calls"] else 0
+                    self._measure_stop, self.stop = self.stop, self._warmup_stop
+                    self._measure_partly_finish, self.partly_finish = self.partly_finish, self._warmup_partly_finish
 
     # region MAIN measurement (start, stop)
 
@@ -93,6 +298,68 @@ class ParallelProbe:
             self.close_fn()
             return True
         return False
+
+    def _global_stop(self) -> bool:
+        """Test, if it is possible to stop execution, based on global stop from coordinator
+
+        :return:   True - stop execution, False - continue in execution
+        """
+        stop_time_one_shot = perf_counter()
+
+        duration_one_shot = stop_time_one_shot - self.start_time_one_shot
+        self.call_fn(duration_one_shot)
+
+        # Is it possible to end performance testing?
+        if self._sync_values[ExecutorSync.HEADER_STOP]:
+            self.close_fn()
+            return True
+        return False
+
+    def _adaptive_stop(self) -> bool:
+        """Test, if it is possible to stop execution, based on global stop from coordinator (the amount
+        of calls is shared with coordinator for adaptive duration)
+
+        :return:   True - stop execution, False - continue in execution
+        """
+        stop_time_one_shot = perf_counter()
+
+        duration_one_shot = stop_time_one_shot - self.start_time_one_shot
+        self.call_fn(duration_one_shot)
+        self._sync_values[self._calls_slot] = self.calls
+
+        # Is it possible to end performance testing?
+        if self._sync_values[ExecutorSync.HEADER_STOP]:
+            self.close_fn()
+            return True
+        return False
+
+    def _calls_stop(self) -> bool:
+        """Test, if it is possible to stop execution, based on amount of calls (fixed-iteration mode).
+        The call over the limit is not included in statistics (e.g. for executor with zero share).
+
+        :return:   True - stop execution, False - continue in execution
+        """
+        stop_time_one_shot = perf_counter()
+
+        if self.calls < self.calls_limit:
+            self.call_fn(stop_time_one_shot - self.start_time_one_shot)
+
+        # Is it possible to end performance testing?
+        if self.calls >= self.calls_limit:
+            self.close_fn()
+            return True
+        return False
+
+    def _end(self) -> bool:
+        """The end of measurement, based on amount of calls, global stop from coordinator or based on duration of test"""
+        if self.calls_limit is not None:
+            return self.calls >= self.calls_limit
+        if self._global:
+            if self._calls_slot is not None:
+                self._sync_values[self._calls_slot] = self.calls
+            return self._sync_values[ExecutorSync.HEADER_STOP] != 0
+        return (time() - self.init_time) >= self.duration_second
+
     # endregion
 
     #region PARTLY measurement (init, start, stop, finish)
@@ -114,50 +381,277 @@ class ParallelProbe:
         self.call_fn(self.total_partly_time)
 
         # Is it possible to end performance testing?
-        if (time() - self.init_time) >= self.duration_second:
+        if self._end():
             self.close_fn()
             return True
         return False
 
     # endregion
 
-    def _core_calc(self, duration_one_shot):
-        """Core for calculation (and simulation)"""
+    # region OPEN-LOOP measurement (start, stop)
 
-        self.counter += 1
-        self.total_duration += duration_one_shot
+    @staticmethod
+    def _arrival_interval(run_setup: RunSetup):
+        """
+        Interval between intended starts of calls in open-loop mode
 
-        # calc standard deviation incrementally
-        self.stddev.include(duration_one_shot)
+        :param run_setup:   setup with 'arrival_rate' (calls per second for each executor) or
+                            'arrival_rate_total' (calls per second cross all executors)
+        :return:            interval in seconds or None (closed-loop mode)
+        """
+        arrival_rate = run_setup["arrival_rate"]
+        if run_setup["arrival_rate_total"]:
+            arrival_rate = run_setup["arrival_rate_total"] / run_setup.executors
+        return 1 / arrival_rate if arrival_rate else None
+
+    async def async_start(self):
+        """ Start measurement each test in 'async def' function, the waiting for intended start time
+        (open-loop mode) does not block other tasks in event loop"""
+        if self.arrival_interval:
+            pause = self._open_loop_pause()
+            if pause > 0:
+                await asyncio.sleep(pause)
+        self.start()
+
+    def _open_loop_pause(self):
+        """Time in seconds till intended start time of next call (based on arrival rate)"""
+        now = perf_counter()
+        if self.schedule_time is None:
+            # random phase of the first call (avoid synchronized bursts cross executors)
+            self.schedule_time = now + random() * self.arrival_interval
+        return self.schedule_time - now
+
+    def _open_loop_start(self):
+        """ Start measurement each test, wait for intended start time based on arrival rate"""
+        pause = self._open_loop_pause()
+        if pause > 0:
+            sleep(pause)
+        now = perf_counter()
+
+        self.intended_time_one_shot = self.schedule_time
+        self.schedule_time += self.arrival_interval
+        self.start_time_one_shot = now
+
+    def _open_loop_stop(self) -> bool:
+        """Test, if it is possible to stop execution, based on duration of test. The duration
+        is measured from intended start time (correction of coordinated omission) and also
+        from the actual start time (without correction). The call over the limit (fixed-iteration
+        mode) is not included in statistics (e.g. for executor with zero share).
 
-        # setup new min
-        if duration_one_shot < self.min_duration:
-            self.min_duration = duration_one_shot
+        :return:   True - stop execution, False - continue in execution
+        """
+        stop_time_one_shot = perf_counter()
 
-        # setup new max
-        if duration_one_shot > self.max_duration:
-            self.max_duration = duration_one_shot
+        if self.calls_limit is None or self.calls < self.calls_limit:
+            self.uncorrected.call_fn(stop_time_one_shot - self.start_time_one_shot)
+            self.call_fn(stop_time_one_shot - self.intended_time_one_shot)
+
+        # Is it possible to end performance testing?
+        if self._end():
+            self.uncorrected.close_fn()
+            self.close_fn()
+            return True
+        return False
+
+    # endregion
+
+    # region FAST-PATH measurement (start, stop)
+
+    def _fast_start(self):
+        """ Start measurement each test (integer timer)"""
+        self.start_time_one_shot = perf_counter_ns()
+
+    def _fast_stop(self) -> bool:
+        """Store duration to the buffer, the test of duration is only each N calls
+
+        :return:   True - stop execution, False - continue in execution
+        """
+        self.buffer.append(perf_counter_ns() - self.start_time_one_shot)
+        if len(self.buffer) < self.check_size:
+            return False
+        return self._fast_check()
+
+    def _fast_check(self) -> bool:
+        """Move durations from buffer to statistics and test, if it is possible to stop execution.
+        The amount of calls between checks is adapted to the interval FAST_CHECK_INTERVAL.
 
-    def _core_close(self, percentile = 1):
+        :return:   True - stop execution, False - continue in execution
+        """
+        self.batch_fn(numpy.frombuffer(self.buffer, dtype = numpy.int64) / 1e9)
+        del self.buffer[:]
+
+        now = time()
+        if (now - self.check_time) < ParallelProbe.FAST_CHECK_INTERVAL:
+            self.check_size = min(self.check_size * 2, ParallelProbe.FAST_CHECK_MAX)
+        else:
+            self.check_size = max(self.check_size // 2, 1)
+        if self.calls_limit is not None:
+            # without calls over the limit (fixed-iteration mode)
+            self.check_size = max(min(self.check_size, self.calls_limit - self.calls), 1)
+        self.check_time = now
+
+        # Is it possible to end performance testing?
+        if self._end():
+            self.close_fn()
+            return True
+        return False
+
+    # endregion
+
+    # region BATCH measurement (stop)
+
+    def _batch_stop(self) -> bool:
+        """Test, if it is possible to stop execution, based on duration of test. The sample
+        contains 'batch_size' operations and the duration is split to the operations. The size
+        of batch is calibrated (doubled) till the sample takes at least 'batch_duration'.
+
+        :return:   True - stop execution, False - continue in execution
+        """
+        stop_time_one_shot = perf_counter()
+        duration_one_shot = stop_time_one_shot - self.start_time_one_shot
+        end = self._end()
+        batch_max = ParallelProbe.BATCH_SIZE_MAX if self.calls_limit is None else min(self.calls_limit, ParallelProbe.BATCH_SIZE_MAX)
+
+        if self.batch_calibration and duration_one_shot < self.batch_duration and self.batch_size < batch_max and not end:
+            # calibration, the sample is too short (it is not included in statistics)
+            self.batch_size = min(self.batch_size * 2, batch_max)
+        else:
+            self.batch_calibration = False
+            self.repeat_fn(duration_one_shot / self.batch_size, self.batch_size)
+            if self.calls_limit is not None:
+                # without operations over the limit (fixed-iteration mode)
+                self.batch_size = max(min(self.batch_size, self.calls_limit - self.calls), 1)
+                end = self._end()
+
+        # Is it possible to end performance testing?
+        if end:
+            self.close_fn()
+            return True
+        return False
+
+    # endregion
+
+    # region WARM-UP (stop, partly finish)
+
+    def _warmup_stop(self) -> bool:
+        """The value is ignored during warm-up, the measurement starts after warm-up
+
+        :return:   False - continue in execution
+        """
+        self.warmup_calls -= 1
+        if self.warmup_calls <= 0 and time() >= self.warmup_end:
+            self.stop = self._measure_stop
+            self.partly_finish = self._measure_partly_finish
+            self._restart()
+        return False
+
+    def _warmup_partly_finish(self) -> bool:
+        """The value is ignored during warm-up, the measurement starts after warm-up
+
+        :return:   False - continue in execution
+        """
+        return self._warmup_stop()
+
+    def _restart(self):
+        """Start of measurement (after warm-up)"""
+        self.init_time = time()
+        self.check_time = self.init_time
+        self.loop_time = perf_counter()
+        self.track_start = datetime.utcnow()
+        if self.series:
+            self.series.start = self.loop_time
+
+    # endregion
+
+    # region TIME SERIES (add values to the interval and to the statistics)
+
+    def _series_call(self, duration_one_shot):
+        self.series.record(perf_counter(), duration_one_shot)
+        self._series_call_fn(duration_one_shot)
+
+    def _series_batch(self, durations):
+        self.series.record_batch(perf_counter(), durations)
+        self._series_batch_fn(durations)
+
+    def _series_repeat(self, duration_one_shot, count):
+        self.series.record(perf_counter(), duration_one_shot, count)
+        self._series_repeat_fn(duration_one_shot, count)
+
+    # endregion
+
+    # region WATCHDOG (add values to the statistics and to the shared memory)
+
+    def _publish(self, total, min_duration, max_duration):
+        """Publish partial statistics to the shared memory"""
+        values, slot = self._sync_values, self._watch_slot
+        values[slot + ExecutorSync.SLOT_CALLS] = self.calls
+        values[slot + ExecutorSync.SLOT_TOTAL] += total
+        if values[slot + ExecutorSync.SLOT_MIN] == 0 or min_duration < values[slot + ExecutorSync.SLOT_MIN]:
+            values[slot + ExecutorSync.SLOT_MIN] = min_duration
+        if max_duration > values[slot + ExecutorSync.SLOT_MAX]:
+            values[slot + ExecutorSync.SLOT_MAX] = max_duration
+
+    def _watch_call(self, duration_one_shot):
+        self._watch_call_fn(duration_one_shot)
+        self._publish(duration_one_shot, duration_one_shot, duration_one_shot)
+
+    def _watch_batch(self, durations):
+        self._watch_batch_fn(durations)
+        if len(durations) > 0:
+            self._publish(float(durations.sum()), float(durations.min()), float(durations.max()))
+
+    def _watch_repeat(self, duration_one_shot, count):
+        self._watch_repeat_fn(duration_one_shot, count)
+        self._publish(duration_one_shot * count, duration_one_shot, duration_one_shot)
+
+    # endregion
+
+    def _core_close(self):
 
         # write time
         self.track_end = datetime.utcnow()
-        # calc standard deviation
-        self.standard_deviation = self.stddev.std
+        self.end_time = time()
+        if self._sync:
+            # release shared memory for global stop
+            self._sync_values = None
+            if self._sync_owner:
+                self._sync.close()
+            self._sync = None
+        loop_duration = perf_counter() - self.loop_time
+        super()._core_close()
+
+        # time per call outside of measured part (probe overhead and loop), without open-loop waiting
+        if self.counter > 0 and not self.arrival_interval:
+            self.overhead = max(loop_duration - self.total_duration, 0) / self.counter
 
-        # Store all values for each percentile
-        self.percentile_results.append(PercentileItem(percentile,
-                                              self.counter,
-                                              self.total_duration,
-                                              self.standard_deviation,
-                                              self.min_duration,
-                                              self.max_duration))
-
-        if percentile == 1:  # clean sources
-            #   standard deviation calculation
-            del self.stddev
-            #   percentile heap
-            del self.heap
+    @staticmethod
+    def _wait_for_start(run_setup: RunSetup, keep = False, tasks = 1, sync = None) -> ExecutorSync:
+        """ Waiting for other executors, the start barrier via shared memory (all executors are
+            released at once, when the last executor is ready) or waiting till start time
+
+            :param run_setup:   setup with name of shared memory for synchronization and start time
+            :param keep:        keep access to the shared memory (e.g. for global stop)
+            :param tasks:       amount of executors (tasks in event loop) from 'run_setup.executor_index',
+                                which are ready together
+            :param sync:        existing access to the shared memory, it is not closed (None - new access)
+            :return:            access to the shared memory (only for keep=True)
+        """
+        if run_setup.sync:
+            owner = sync is None
+            if owner:
+                sync = ExecutorSync(name = run_setup.sync)
+            try:
+                for task_key in range(tasks):
+                    sync.ready(run_setup.executor_index + task_key)
+                # fallback, if the coordinator does not release executors
+                timeout = (run_setup.when_start.timestamp() if run_setup.when_start else time()) + 1
+                sync.wait_for_release(timeout)
+            finally:
+                if owner and not keep:
+                    sync.close()
+            return sync if keep else None
+        ParallelProbe._wait_for_others(run_setup.when_start)
+        return None
 
     @staticmethod
     def _wait_for_others(when_start, tolerance=0.1):
@@ -174,6 +668,14 @@ class ParallelProbe:
         if sleep_time > tolerance:
             sleep(sleep_time)
 
+    def __getstate__(self):
+        """Access to the shared memory is not part of return value"""
+        state = self.__dict__.copy()
+        state["_sync"] = None
+        state["_sync_owner"] = True
+        state["_sync_values"] = None
+        return state
+
     def __str__(self):
         """ Provider view to return value """
 
@@ -181,20 +683,34 @@ class ParallelProbe:
             data = {}
             data[FileMarker.PRF_TYPE] = FileMarker.PRF_DETAIL_TYPE
             data[FileMarker.PRF_DETAIL_PROCESSID] = self.pid                            # info
-
-            for result in self.percentile_results:
-                suffix = f"_{int(result.percentile * 100)}" if result.percentile < 1 else ""
-                data[FileMarker.PRF_DETAIL_CALLS + suffix] = result.count               # for perf graph
-                data[FileMarker.PRF_DETAIL_AVRG + suffix] = nan if result.count == 0 else result.total_duration / result.count
-                data[FileMarker.PRF_DETAIL_MIN + suffix] = result.min                   # info
-                data[FileMarker.PRF_DETAIL_MAX + suffix] = result.max                   # info
-                data[FileMarker.PRF_DETAIL_STDEV + suffix] = result.std                 # for perf graph
-                data[FileMarker.PRF_DETAIL_TOTAL + suffix] = result.total_duration      # for perf graph
+            self._percentile_dump(data)
+            if self.uncorrected:
+                data[FileMarker.PRF_DETAIL_UNCORRECTED] = self.uncorrected._percentile_dump({})
+            if self.overhead is not None:
+                data[FileMarker.PRF_DETAIL_OVERHEAD] = self.overhead                    # info
+            if self.series:
+                data[FileMarker.PRF_DETAIL_SERIES] = self.series.dump()                 # for time series graph
+            if self.startup is not None:
+                data[FileMarker.PRF_DETAIL_STARTUP] = self.startup                      # info
+            if self.cores is not None:
+                data[FileMarker.PRF_DETAIL_CORES] = self.cores                          # info
 
             data[FileMarker.PRF_DETAIL_TIME_INIT] = self.track_init.isoformat(' ')      # for executor graph
             data[FileMarker.PRF_DETAIL_TIME_START] = self.track_start.isoformat(' ')    # for executor graph
             data[FileMarker.PRF_DETAIL_TIME_END] = self.track_end.isoformat(' ')        # for executor graph
             return dumps(data, separators = OutputSetup().json_separator)
+        elif self.timeout:
+            return dumps({
+                FileMarker.PRF_TYPE: FileMarker.PRF_DETAIL_TYPE,
+                FileMarker.PRF_DETAIL_PROCESSID: self.pid,
+                FileMarker.PRF_DETAIL_CALLS: self.counter,
+                FileMarker.PRF_DETAIL_AVRG: nan if self.counter == 0 else self.total_duration / self.counter,
+                FileMarker.PRF_DETAIL_MIN: self.min_duration,
+                FileMarker.PRF_DETAIL_MAX: self.max_duration,
+                FileMarker.PRF_DETAIL_TOTAL: self.total_duration,
+                FileMarker.PRF_DETAIL_TIMEOUT: True,
+                FileMarker.PRF_DETAIL_ERR: str(self.exception)
+            }, separators = OutputSetup().json_separator)
         else:
             return ParallelProbe.dump_error(self.exception, self.pid, self.counter)
 
@@ -202,19 +718,51 @@ class ParallelProbe:
         """Provide view to return value in readable and shorter form (for human check)"""
 
         if self.exception is None:
-            data = {}
-            for result in self.percentile_results:
-                suffix = f"_{int(result.percentile * 100)}" if result.percentile < 1 else ""
-                data[FileMarker.HR_PRF_DETAIL_CALLS + suffix] = result.count
-                data[FileMarker.HR_PRF_DETAIL_AVRG + suffix] = nan if result.count == 0 else round(result.total_duration / result.count, OutputSetup().human_precision)
-                data[FileMarker.PRF_DETAIL_MIN + suffix] = round(result.min, OutputSetup().human_precision)
-                data[FileMarker.PRF_DETAIL_MAX + suffix] = round(result.max, OutputSetup().human_precision)
-                data[FileMarker.HR_PRF_DETAIL_STDEV + suffix] = round(result.std, OutputSetup().human_precision)
-                data[FileMarker.HR_PRF_DETAIL_TOTAL + suffix] = round(result.total_duration, OutputSetup().human_precision)
+            data = self._percentile_dump({}, True)
+            if self.uncorrected:
+                data[FileMarker.HR_PRF_DETAIL_UNCORRECTED] = self.uncorrected._percentile_dump({}, True)
+            if self.overhead is not None:
+                data[FileMarker.HR_PRF_DETAIL_OVERHEAD] = round(self.overhead, OutputSetup().human_precision)
+            if self.series:
+                data[FileMarker.PRF_DETAIL_SERIES] = self.series.dump()["calls"]
+            if self.startup is not None:
+                data[FileMarker.PRF_DETAIL_STARTUP] = round(self.startup, OutputSetup().human_precision)
+            if self.cores is not None:
+                data[FileMarker.PRF_DETAIL_CORES] = self.cores
             return dumps(data, separators = OutputSetup().human_json_separator if compact_form else (', ', ': '))
+        elif self.timeout:
+            return dumps({
+                FileMarker.HR_PRF_DETAIL_CALLS: self.counter,
+                FileMarker.HR_PRF_DETAIL_AVRG: nan if self.counter == 0 else round(self.total_duration / self.counter, OutputSetup().human_precision),
+                FileMarker.PRF_DETAIL_MAX: round(self.max_duration, OutputSetup().human_precision),
+                FileMarker.PRF_DETAIL_TIMEOUT: True,
+                FileMarker.PRF_DETAIL_ERR: str(self.exception)
+            }, separators = OutputSetup().human_json_separator)
         else:
             return ParallelProbe.readable_dump_error(self.exception, self.pid, self.counter)
 
+    @staticmethod
+    def timed_out(exception, pid, counter, total_duration, min_duration, max_duration):
+        """
+        Probe for executor terminated by watchdog (with partial statistics from shared memory)
+
+        :param exception:       reason of termination
+        :param pid:             process id of executor
+        :param counter:         amount of calls till termination
+        :param total_duration:  total duration of calls
+        :param min_duration:    min. duration of call
+        :param max_duration:    max. duration of call
+        :return:                probe with exception and partial statistics
+        """
+        probe = ParallelProbe(None, exception)
+        probe.pid = pid
+        probe.timeout = True
+        probe.counter = counter
+        probe.total_duration = total_duration
+        probe.min_duration = min_duration
+        probe.max_duration = max_duration
+        return probe
+
     @staticmethod
     def dump_error(exception, pid = 0, counter = 0):
         return dumps({
@@ -0,0 +1,208 @@
+import sys
+import click
+from math import sqrt
+from qgate_perf.output_result import PerfResult, PerfResults, Output
+from qgate_perf.latency_histogram import LatencyHistogram
+from qgate_perf.file_marker import FileMarker
+from qgate_perf.helper import Helper
+
+
+class PerfCompare:
+    """
+    Comparison of performance results between baseline and current runs (matched by label, bulk
+    and executors). The change is a regression/improvement only, if the relative change is higher
+    than threshold and the difference is statistically significant (Welch's t-test, Student's
+    t-distribution with Welch-Satterthwaite degrees of freedom), the effect size is Cohen's d. The test is based on variance cross runs (repeated
+    runs of the same configuration or trials), the variance of calls inside one run is not used.
+    Without variance cross runs (e.g. one baseline and one current run without trials), the test
+    is skipped (p-value and effect size are None) and the verdict is based only on threshold.
+    """
+
+    REGRESSION = "regression"
+    IMPROVEMENT = "improvement"
+    SAME = "same"
+
+    def __init__(self, threshold = 0.05, alpha = 0.01):
+        """
+        Setup of comparison
+
+        :param threshold:   min. relative change for regression/improvement (default is 0.05 = 5%)
+        :param alpha:       significance level of statistical test (default is 0.01)
+        """
+        self.threshold = threshold
+        self.alpha = alpha
+
+    @staticmethod
+    def _sample(values: list) -> tuple:
+        """Mean, standard deviation and amount of values from runs"""
+        mean, std, _, _ = Helper.confidence_interval(values)
+        return mean, std, len(values)
+
+    @staticmethod
+    def _throughput(summaries: list) -> tuple:
+        """Throughput from runs, the statistics cross trials are used for one run with trials"""
+        if len(summaries) == 1 and summaries[0].trials:
+            trials = summaries[0].trials
+            return trials[FileMarker.PRF_CORE_TRIALS_MEAN], trials[FileMarker.PRF_CORE_TRIALS_STD], trials[FileMarker.PRF_CORE_TRIALS_COUNT]
+        return PerfCompare._sample([summary.call_per_sec for summary in summaries])
+
+    @staticmethod
+    def _test(baseline, current):
+        """
+        Welch's t-test (p-value from Student's t-distribution with Welch-Satterthwaite degrees of
+        freedom) and Cohen's d, the variance of one side is used for both sides, if the other side
+        is only one run (degrees of freedom only from the side with variance)
+
+        :param baseline:    mean, standard deviation and amount of baseline runs
+        :param current:     mean, standard deviation and amount of current runs
+        :return:            p-value, effect size (None, None - without variance cross runs)
+        """
+        baseline_mean, baseline_std, baseline_count = baseline
+        current_mean, current_std, current_count = current
+        if baseline_count < 2 and current_count < 2:
+            return None, None
+        if baseline_count < 2:
+            baseline_std = current_std
+        elif current_count < 2:
+            current_std = baseline_std
+        diff = current_mean - baseline_mean
+        baseline_var = baseline_std * baseline_std / baseline_count
+        current_var = current_std * current_std / current_count
+        error = sqrt(baseline_var + current_var)
+        if error > 0:
+            if baseline_count < 2 or current_count < 2:
+                # the variance is estimated only from the other side
+                df = max(baseline_count, current_count) - 1
+            else:
+                # Welch-Satterthwaite
+                df = (baseline_var + current_var) ** 2 / (baseline_var * baseline_var / (baseline_count - 1) +
+                                                          current_var * current_var / (current_count - 1))
+            p_value = Helper.t_p_value(diff / error, df)
+        else:
+            p_value = 0 if diff != 0 else 1
+        pooled = sqrt((baseline_std * baseline_std + current_std * current_std) / 2)
+        return p_value, diff / pooled if pooled > 0 else 0
+
+    def _finding(self, metric, baseline, current, higher_better = False) -> dict:
+        p_value, effect = PerfCompare._test(baseline, current)
+        baseline_value, current_value = baseline[0], current[0]
+        change = (current_value - baseline_value) / baseline_value if baseline_value else 0
+        verdict = PerfCompare.SAME
+        if (p_value is None or p_value < self.alpha) and abs(change) >= self.threshold:
+            verdict = PerfCompare.IMPROVEMENT if (change > 0) == higher_better else PerfCompare.REGRESSION
+        return {FileMarker.PRF_COMPARE_METRIC: metric,
+                FileMarker.PRF_COMPARE_BASELINE: baseline_value,
+                FileMarker.PRF_COMPARE_CURRENT: current_value,
+                FileMarker.PRF_COMPARE_CHANGE: change,
+                FileMarker.PRF_COMPARE_EFFECT: effect,
+                FileMarker.PRF_COMPARE_P_VALUE: p_value,
+                FileMarker.PRF_COMPARE_VERDICT: verdict}
+
+    def compare(self, baseline, current) -> list:
+        """
+        Comparison of throughput, average latency and latency in percentiles (the values are means
+        cross runs, the variance of throughput is also from trials)
+
+        :param baseline:    baseline result or list of results from repeated runs
+        :param current:     current result or list of results from repeated runs
+        :return:            list of findings for each metric
+        """
+        baseline = baseline if isinstance(baseline, list) else [baseline]
+        current = current if isinstance(current, list) else [current]
+        findings = []
+        base = [result.percentiles[1] for result in baseline if result.percentiles.get(1, None)]
+        curr = [result.percentiles[1] for result in current if result.percentiles.get(1, None)]
+        if not base or not curr:
+            return findings
+
+        # throughput and average latency
+        findings.append(self._finding(FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC, PerfCompare._throughput(base),
+                                      PerfCompare._throughput(curr), True))
+        findings.append(self._finding(FileMarker.PRF_CORE_AVRG_TIME, PerfCompare._sample([itm.avrg for itm in base]),
+                                      PerfCompare._sample([itm.avrg for itm in curr])))
+
+        # latency in percentiles (the test is based on the same value cross runs)
+        percentiles = set.intersection(*[set(result.percentiles.keys()) for result in baseline + current])
+        for percentile in sorted(percentiles):
+            if percentile < 1:
+                findings.append(self._finding(f"{FileMarker.PRF_CORE_MAX}{LatencyHistogram.percentile_suffix(percentile)}",
+                                              PerfCompare._sample([result[percentile].max for result in baseline]),
+                                              PerfCompare._sample([result[percentile].max for result in current])))
+        return findings
+
+    @staticmethod
+    def _configurations(runs: list) -> dict:
+        """Results for each configuration (label, bulk and executors) in order of runs"""
+        configurations = {}
+        for run in runs:
+            for result in run.results:
+                key = (run.label, result.bundle_row, result.bundle_col, result.executors)
+                configurations.setdefault(key, []).append(result)
+        return configurations
+
+    def compare_runs(self, baseline_runs: list, current_runs: list = None) -> list:
+        """
+        Comparison of runs, matched by label, bulk and executors (all results for each configuration
+        are compared, the repeated runs are source of variance cross runs)
+
+        :param baseline_runs:   baseline runs (list of PerfResults with label)
+        :param current_runs:    current runs (default is None, the last result for each configuration
+                                in baseline runs is compared with previous results)
+        :return:                list of comparisons for each configuration
+        """
+        baseline = PerfCompare._configurations(baseline_runs)
+        if current_runs is None:
+            pairs = {key: (results[:-1], results[-1:]) for key, results in baseline.items() if len(results) >= 2}
+        else:
+            current = PerfCompare._configurations(current_runs)
+            pairs = {key: (baseline[key], results) for key, results in current.items() if key in baseline}
+
+        comparisons = []
+        for (label, row, col, executors), (base, curr) in pairs.items():
+            comparisons.append({FileMarker.PRF_HDR_LABEL: label,
+                                FileMarker.PRF_HDR_BULK: [row, col],
+                                FileMarker.PRF_COMPARE_EXECUTORS: executors,
+                                FileMarker.PRF_COMPARE_METRICS: self.compare(base, curr)})
+        return comparisons
+
+    def compare_files(self, baseline_file, current_file = None) -> list:
+        """
+        Comparison of runs from output files
+
+        :param baseline_file:   output file with baseline runs
+        :param current_file:    output file with current runs (default is None, the last run for each
+                                configuration in baseline file is compared with previous runs)
+        :return:                list of comparisons for each configuration
+        """
+        return self.compare_runs(PerfResults.load(baseline_file),
+                                 PerfResults.load(current_file) if current_file else None)
+
+    @staticmethod
+    def regressions(comparisons: list) -> int:
+        """Amount of regressions in comparisons"""
+        return sum(1 for comparison in comparisons for finding in comparison[FileMarker.PRF_COMPARE_METRICS]
+                   if finding[FileMarker.PRF_COMPARE_VERDICT] == PerfCompare.REGRESSION)
+
+
+@click.command()
+@click.option("--baseline", help="output file with baseline runs", required=True)
+@click.option("--current", help="output file with current runs (default is without file, the last run "
+                                "in baseline file is compared with previous runs)", default=None)
+@click.option("--threshold", help="min. relative change for regression/improvement (default is 0.05)", default=0.05)
+@click.option("--alpha", help="significance level of statistical test (default is 0.01)", default=0.01)
+@click.option("--output", help="output file for comparison (default is without file)", default=None)
+def main(baseline, current, threshold, alpha, output):
+    """Compare performance runs, the exit code is 0 (without regression) or 1 (some regressions)."""
+    comparisons = PerfCompare(threshold, alpha).compare_files(baseline, current)
+    report = Output("Comparison", output_file = output)
+    try:
+        report.open()
+        for comparison in comparisons:
+            report.print_compare(comparison)
+    finally:
+        report.close()
+    sys.exit(1 if PerfCompare.regressions(comparisons) > 0 else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+import json
+import sys
+import click
+from qgate_perf.output_result import PerfResult, PerfResults, Output
+from qgate_perf.latency_histogram import LatencyHistogram
+from qgate_perf.file_marker import FileMarker
+
+
+class PerfGate:
+    """
+    Quality gate with performance thresholds for results of executors (all or only specific
+    configuration of executors), the result out of thresholds is not valid (state False).
+    """
+
+    def __init__(self,
+                 min_call_per_sec = None,
+                 max_avrg = None,
+                 max_std = None,
+                 max_percentile: dict = None,
+                 executors = None,
+                 bulk = None):
+        """
+        Definition of quality gate
+
+        :param min_call_per_sec:    min. calls per second (total, cross all executors)
+        :param max_avrg:            max. average time for one call in seconds
+        :param max_std:             max. standard deviation in seconds
+        :param max_percentile:      max. latency in seconds for percentiles e.g. {0.99: 0.05, 0.999: 0.1}
+                                    (the percentiles have to be measured, see parameter 'percentile' in run setup)
+        :param executors:           the gate is only for this configuration of executors in format
+                                    [processes, threads] or [processes, threads, tasks] (default is None, all executors)
+        :param bulk:                the gate is only for this bulk in format [rows, columns]
+                                    (default is None, all bulks)
+        """
+        self.min_call_per_sec = min_call_per_sec
+        self.max_avrg = max_avrg
+        self.max_std = max_std
+        self.max_percentile = {float(key): value for key, value in max_percentile.items()} if max_percentile else {}
+        self.executors = list(executors) if executors else None
+        self.bulk = list(bulk) if bulk else None
+
+    @staticmethod
+    def from_dict(gate: dict):
+        """Quality gate from dictionary with the same keys as the parameters (e.g. from JSON)"""
+        return PerfGate(**gate)
+
+    def match(self, result: PerfResult) -> bool:
+        """The gate is relevant for the result (based on executors and bulk)"""
+        if self.executors:
+            executors = [result.executor_process, result.executor_thread, result.executor_task]
+            if executors[:len(self.executors)] != self.executors or (len(self.executors) == 2 and result.executor_task != 1):
+                return False
+        if self.bulk and [result.bundle_row, result.bundle_col] != self.bulk:
+            return False
+        return True
+
+    def check(self, result: PerfResult) -> list:
+        """
+        Check of thresholds for the result
+
+        :param result:  result of one performance test
+        :return:        list of reasons, why the result is not valid (empty list - the result is valid)
+        """
+        reasons = []
+        summary = result.percentiles.get(1, None)
+        if summary is None or summary.executors == 0:
+            return ["without valid executors"]
+
+        if self.min_call_per_sec is not None and summary.call_per_sec < self.min_call_per_sec:
+            reasons.append(f"{FileMarker.PRF_CORE_TOTAL_CALL_PER_SEC} {summary.call_per_sec} < {self.min_call_per_sec}")
+        if self.max_avrg is not None and summary.avrg > self.max_avrg:
+            reasons.append(f"{FileMarker.PRF_CORE_AVRG_TIME} {summary.avrg} > {self.max_avrg}")
+        if self.max_std is not None and summary.std > self.max_std:
+            reasons.append(f"{FileMarker.PRF_CORE_STD_DEVIATION} {summary.std} > {self.max_std}")
+        for percentile, limit in sorted(self.max_percentile.items()):
+            key = f"{FileMarker.PRF_CORE_MAX}{LatencyHistogram.percentile_suffix(percentile)}"
+            if result.percentiles.get(percentile, None) is None:
+                reasons.append(f"{key} is not measured")
+            elif result[percentile].max > limit:
+                reasons.append(f"{key} {result[percentile].max} > {limit}")
+        return reasons
+
+    @staticmethod
+    def evaluate(performance: PerfResults, gates: list, output_file = None, label = None) -> bool:
+        """
+        Evaluation of quality gates, the results out of thresholds are not valid (state False with
+        reasons in 'PerfResult.reasons') and the verdict is written to the output file
+
+        :param performance:     performance results (with performance detail)
+        :param gates:           list of quality gates
+        :param output_file:     output file for verdict (default is None, only to the console)
+        :param label:           text label for verdict
+        :return:                final state, True - all results are valid, False - some results are not valid
+        """
+        reasons = []
+        for result in performance.results:
+            for gate in gates:
+                if gate.match(result):
+                    for reason in gate.check(result):
+                        result.state = False
+                        result.reasons.append(reason)
+                        reasons.append(f"bundle ({result.bundle_row}x{result.bundle_col}), executor ({result.executors}): {reason}")
+        performance.refresh_state()
+
+        output = Output(label, output_file = output_file)
+        try:
+            output.open()
+            output.print_verdict(performance.state, performance.count_states, performance.count_false_states, reasons)
+        finally:
+            output.close()
+        return performance.state
+
+    @staticmethod
+    def load(input_file) -> PerfResults:
+        """
+        Load performance results from output file (the summary from 'core' lines of all runs)
+
+        :param input_file:  output file from performance tests
+        :return:            performance results
+        """
+        performance = PerfResults()
+        for run in PerfResults.load(input_file):
+            performance.append(run)
+        return performance
+
+
+@click.command()
+@click.option("--input", help="output file from performance tests", required=True)
+@click.option("--gates", help="JSON file with list of quality gates, e.g. [{\"min_call_per_sec\": 100, \"max_percentile\": {\"0.99\": 0.05}}]", required=True)
+@click.option("--output", help="output file for verdict (default is without file)", default=None)
+def main(input, gates, output):
+    """Evaluate quality gates for performance results, the exit code is 0 (valid) or 1 (not valid)."""
+    with open(gates, "r") as file:
+        gate_list = [PerfGate.from_dict(gate) for gate in json.load(file)]
+    performance = PerfGate.load(input)
+    state = PerfGate.evaluate(performance, gate_list, output, "Quality gates") and performance.count_states > 0
+    sys.exit(0 if state else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from copy import copy
 
 
 class RunSetup:
@@ -11,13 +12,51 @@ class RunSetup:
         :param start_delay:         maximal time in seconds for waiting to the all executors,
                                     after this time all executors will continue in run. It is usefull
                                     parameter for executor synchronization, value 0 = without synchronization
-        :param parameters:          addition parameters for execution
+        :param parameters:          addition parameters for execution, the parameters with impact
+                                    to the probe are e.g.:
+                                      'percentile' - requested percentile or list of percentiles
+                                                     (e.g. 0.99 or [0.5, 0.9, 0.99, 0.999])
+                                      'percentile_precision' - relative precision of histogram for percentiles
+                                                     (default is 0.01 = 1%)
+                                      'arrival_rate' - open-loop mode, calls per second for each executor
+                                      'arrival_rate_total' - open-loop mode, calls per second cross all executors
+                                      'batch_duration' - batch mode, min. duration of one sample in seconds (the sample
+                                                     contains 'probe.batch_size' operations)
+                                      'fast_probe' - fast-path mode for short calls (integer timer, deadline
+                                                     is checked only each N calls)
+                                      'time_series' - interval in seconds for time series of calls, total
+                                                     and max duration (e.g. 1)
+                                      'time_series_size' - max. amount of intervals in time series (default is 3600)
+                                      'warmup_duration' - warm-up in seconds, the calls are not included in statistics
+                                      'warmup_calls' - warm-up in amount of calls, the calls are not included in statistics
+                                      'steady_state' - detection of steady state based on time series, the tolerance
+                                                     of calls in interval from median (e.g. 0.1 or True)
+                                      'trials' - amount of repeated trials for each executors in run_executor (the summary
+                                                     contains mean, std and 95% confidence interval of throughput)
+                                      'trials_order' - order of trials 'interleaved', 'random' or None (sequential)
+                                      'adaptive_precision' - adaptive duration, the run is stopped, when the relative
+                                                     half-width of 95% confidence interval of throughput is under
+                                                     the value (e.g. 0.02), the 'duration_second' is max. duration
+                                      'adaptive_min_duration' - min. duration in seconds for adaptive duration (default is 1)
+                                      'total_calls' - fixed-iteration mode, total amount of calls cross all executors
+                                                     (split evenly to the executors), the run ends when all calls
+                                                     are done and the 'duration_second' is ignored
+                                      'watchdog' - grace time in seconds after planned end of executors (start, warm-up
+                                                     and duration), the hung executors are terminated after the deadline
+                                                     and reported as timed-out with partial statistics (for
+                                                     'total_calls' it is time budget in seconds after start and warm-up)
         """
         self._duration_second = duration_second
         self._bulk_row = 1
         self._bulk_col = 1
         self._start_delay = start_delay
         self._when_start = None
+        self._executors = 1
+        self._sync = None
+        self._sync_access = None
+        self._executor_index = 0
+        self._adaptive = None
+        self._shared = None
 
         # collection of specific keys for project such as project_name, feature_set_name, etc.
         self._parameters=parameters
@@ -30,6 +69,44 @@ class RunSetup:
     def bulk_col(self):
         return self._bulk_col
 
+    @property
+    def executors(self):
+        """Amount of executors (processes x threads x tasks) in current execution"""
+        return self._executors
+
+    @property
+    def sync(self):
+        """Name of shared memory for synchronization of executors (None - without shared memory)"""
+        return self._sync
+
+    @property
+    def sync_access(self):
+        """Access to the shared memory, shared by executors in the thread (None - the probe attaches own access)"""
+        return self._sync_access
+
+    @property
+    def adaptive(self):
+        """Summary of adaptive duration from the last execution (None - without adaptive duration)"""
+        return self._adaptive
+
+    @property
+    def shared(self):
+        """Value from 'process_init', shared by all executors in the process (None - without process init)"""
+        return self._shared
+
+    @property
+    def executor_index(self):
+        """Index of executor in current execution (from 0 to executors - 1)"""
+        return self._executor_index
+
+    @property
+    def calls_share(self):
+        """Amount of calls for the executor in fixed-iteration mode (None - without fixed iterations)"""
+        total_calls = self.param("total_calls")
+        if not total_calls:
+            return None
+        return total_calls // self._executors + (1 if self._executor_index < total_calls % self._executors else 0)
+
     @property
     def when_start(self):
         return self._when_start
@@ -71,6 +148,39 @@ class RunSetup:
         """Define unique start time for all executors. The time has to be setup before executor start."""
         self._when_start = datetime.now() + timedelta(seconds=self._start_delay)
 
+    def set_executors(self, executors):
+        """Setup amount of executors (processes x threads x tasks) for current execution."""
+        self._executors = executors if executors > 0 else 1
+
+    def set_sync(self, sync):
+        """Setup name of shared memory for synchronization of executors."""
+        self._sync = sync
+
+    def set_sync_access(self, sync_access):
+        """Setup access to the shared memory for executors in the thread."""
+        self._sync_access = sync_access
+
+    def set_adaptive(self, adaptive):
+        """Setup summary of adaptive duration (duration, samples and reached precision)."""
+        self._adaptive = adaptive
+
+    def set_shared(self, shared):
+        """Setup value shared by all executors in the process."""
+        self._shared = shared
+
+    def executor_copy(self, executor_index):
+        """Copy of setup for specific executor (the parameters are shared)."""
+        setup = copy(self)
+        setup._executor_index = executor_index
+        return setup
+
+    def parameter_copy(self, parameters: dict):
+        """Copy of setup with changed parameters (the value None removes the parameter)."""
+        setup = copy(self)
+        setup._parameters = {key: value for key, value in {**(self._parameters if self._parameters else {}), **parameters}.items()
+                             if value is not None}
+        return setup
+
     def set_bulk(self, bulk_row, bulk_column):
         """Setup bulk size (amount of rows and columns)."""
         self._bulk_row = bulk_row if bulk_row > 0 else 1
@@ -13,9 +13,18 @@ class StandardDeviation:
     def include(self, data):
         """Add new value to the (stream) calculation"""
         self.n += 1
-        self.delta = data - self.mean
-        self.mean += self.delta / self.n
-        self.M2 += self.delta * (data - self.mean)
+        delta = data - self.mean
+        self.mean += delta / self.n
+        self.M2 += delta * (data - self.mean)
+
+    def include_batch(self, n, mean, M2):
+        """Add summary of more values (amount, mean and sum of squares of differences from mean)
+        to the calculation, Chan's parallel alg."""
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.M2 += M2 + delta * delta * self.n * n / total
+        self.n = total
 
     @property
     def variance(self):
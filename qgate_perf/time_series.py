@@ -0,0 +1,172 @@
+from array import array
+from math import sqrt
+import numpy
+
+
+class TimeSeries:
+    """
+    Ring of per-interval buckets (calls, total, sum of squares, min and max of durations) with fixed size,
+    the ring keeps only the last 'size' intervals (the memory does not grow with duration of the run).
+    """
+
+    def __init__(self, start, interval = 1, size = 3600):
+        """
+        Init of time series
+
+        :param start:       start time of the series (in seconds, from perf_counter)
+        :param interval:    interval in seconds for one bucket (default is 1 second)
+        :param size:        max. amount of intervals in the ring (default is 3600)
+        """
+        if interval <= 0 or size <= 0:
+            raise Exception(f"Invalid value for time series, interval '{interval}' and size '{size}' have to be > 0.")
+        self.start = start
+        self.interval = interval
+        self.size = size
+        self.calls = array('q', [0]) * size
+        self.totals = array('d', [0.0]) * size
+        self.totals_sq = array('d', [0.0]) * size
+        self.mins = array('d', [0.0]) * size
+        self.maxs = array('d', [0.0]) * size
+        self.last = 0
+
+    def _move(self, index):
+        """Move the ring to the new interval (the old values in reused buckets are cleaned)"""
+        for clean in range(max(self.last + 1, index - self.size + 1), index + 1):
+            slot = clean % self.size
+            self.calls[slot] = 0
+            self.totals[slot] = 0.0
+            self.totals_sq[slot] = 0.0
+            self.mins[slot] = 0.0
+            self.maxs[slot] = 0.0
+        self.last = index
+
+    def record(self, now, duration, count = 1):
+        """
+        Add duration to the interval
+
+        :param now:         current time (in seconds, from perf_counter)
+        :param duration:    duration of one call
+        :param count:       amount of calls with the duration
+        """
+        index = int((now - self.start) / self.interval)
+        if index > self.last:
+            self._move(index)
+        slot = index % self.size
+        if self.calls[slot] == 0 or duration < self.mins[slot]:
+            self.mins[slot] = duration
+        if duration > self.maxs[slot]:
+            self.maxs[slot] = duration
+        self.calls[slot] += count
+        self.totals[slot] += duration * count
+        self.totals_sq[slot] += duration * duration * count
+
+    def record_batch(self, now, durations):
+        """
+        Add more durations to the interval (numpy array)
+
+        :param now:         current time (in seconds, from perf_counter)
+        :param durations:   durations of calls
+        """
+        if len(durations) == 0:
+            return
+        index = int((now - self.start) / self.interval)
+        if index > self.last:
+            self._move(index)
+        slot = index % self.size
+        if self.calls[slot] == 0:
+            self.mins[slot] = float(durations.min())
+        else:
+            self.mins[slot] = min(self.mins[slot], float(durations.min()))
+        self.maxs[slot] = max(self.maxs[slot], float(durations.max()))
+        self.calls[slot] += len(durations)
+        self.totals[slot] += float(durations.sum())
+        self.totals_sq[slot] += float(numpy.square(durations).sum())
+
+    @property
+    def first(self):
+        """Index of the first interval in the ring"""
+        return max(self.last - self.size + 1, 0)
+
+    def dump(self) -> dict:
+        """Intervals from the ring in order of time"""
+        slots = [index % self.size for index in range(self.first, self.last + 1)]
+        return {"interval": self.interval,
+                "first": self.first,
+                "calls": [self.calls[slot] for slot in slots],
+                "total": [self.totals[slot] for slot in slots],
+                "total_sq": [self.totals_sq[slot] for slot in slots],
+                "min": [self.mins[slot] for slot in slots],
+                "max": [self.maxs[slot] for slot in slots]}
+
+    @staticmethod
+    def merge(dumps: list) -> dict:
+        """
+        Summary of intervals cross more series (aligned by interval index from start of each series)
+
+        :param dumps:   outputs from method dump
+        :return:        merged intervals (calls and totals are summed, min and max cross series)
+        """
+        if not dumps:
+            return None
+        first = min(itm["first"] for itm in dumps)
+        last = max(itm["first"] + len(itm["calls"]) - 1 for itm in dumps)
+        merged = {"interval": dumps[0]["interval"],
+                  "first": first,
+                  "calls": [0] * (last - first + 1),
+                  "total": [0.0] * (last - first + 1),
+                  "total_sq": [0.0] * (last - first + 1),
+                  "min": [0.0] * (last - first + 1),
+                  "max": [0.0] * (last - first + 1)}
+        for itm in dumps:
+            for position in range(len(itm["calls"])):
+                if itm["calls"][position] == 0:
+                    continue
+                index = itm["first"] - first + position
+                if merged["calls"][index] == 0 or itm["min"][position] < merged["min"][index]:
+                    merged["min"][index] = itm["min"][position]
+                merged["max"][index] = max(merged["max"][index], itm["max"][position])
+                merged["calls"][index] += itm["calls"][position]
+                merged["total"][index] += itm["total"][position]
+                merged["total_sq"][index] += itm["total_sq"][position]
+        return merged
+
+    @staticmethod
+    def steady_state(dump: dict, tolerance = 0.1):
+        """
+        Detection of steady state, the ramp-up and ramp-down intervals (with amount of calls out
+        of tolerance from median) are trimmed
+
+        :param dump:        output from method dump or merge
+        :param tolerance:   relative tolerance of calls in interval from median (default is 0.1 = 10%)
+        :return:            positions of the first and the last interval in steady state or None
+        """
+        calls = dump["calls"] if dump else []
+        if not calls:
+            return None
+        median = sorted(calls)[len(calls) // 2]
+        steady = [position for position, value in enumerate(calls) if abs(value - median) <= tolerance * median]
+        if not steady or median == 0:
+            return None
+        return steady[0], steady[-1]
+
+    @staticmethod
+    def summary(dump: dict, first, last):
+        """
+        Summary for intervals between positions first and last (incl.)
+
+        :param dump:        output from method dump or merge
+        :param first:       position of the first interval
+        :param last:        position of the last interval
+        :return:            count, total, std (population), min, max
+        """
+        positions = [position for position in range(first, last + 1) if dump["calls"][position] > 0]
+        count = sum(dump["calls"][position] for position in positions)
+        if count == 0:
+            return 0, 0, 0, 0, 0
+        total = sum(dump["total"][position] for position in positions)
+        total_sq = sum(dump["total_sq"][position] for position in positions)
+        return (count,
+                total,
+                sqrt(max(total_sq / count - (total / count) ** 2, 0)),
+                min(dump["min"][position] for position in positions),
+                max(dump["max"][position] for position in positions))
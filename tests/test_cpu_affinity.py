@@ -0,0 +1,130 @@
+import unittest
+import json
+import os
+from qgate_perf.cpu_affinity import CpuAffinity
+from qgate_perf.parallel_executor import ParallelExecutor, _executor_wrapper, _async_executor_wrapper
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.executor_pool import ExecutorPool
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+
+def prf_pinned(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+    probe.affinity = sorted(os.sched_getaffinity(0))
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCaseCpuAffinity(unittest.TestCase):
+    """Placement of executor processes to the CPU cores"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCaseCpuAffinity.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_parse_list(self):
+        self.assertEqual(CpuAffinity.parse_list("0-3,8,10-11\n"), [0, 1, 2, 3, 8, 10, 11])
+        self.assertEqual(CpuAffinity.parse_list(""), [])
+
+    def test_plan(self):
+        cores = [0, 1, 2, 3, 4, 5]
+        nodes = [[0, 1, 2], [3, 4, 5]]
+        self.assertEqual(CpuAffinity.plan("compact", cores, nodes), [[0], [1], [2], [3], [4], [5]])
+        self.assertEqual(CpuAffinity.plan("spread", cores, nodes), [[0], [3], [1], [4], [2], [5]])
+        self.assertEqual(CpuAffinity.plan("numa", cores, nodes), [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(CpuAffinity.plan([1, 3], cores, nodes), [[1], [3]])
+        self.assertEqual(CpuAffinity.plan([[0, 1], [2, 3]], cores, nodes), [[0, 1], [2, 3]])
+        self.assertIsNone(CpuAffinity.plan(None))
+        with self.assertRaises(ValueError):
+            CpuAffinity.plan("unknown", cores, nodes)
+
+        # the cores are not available
+        with self.assertRaises(ValueError):
+            CpuAffinity.plan([1, 999], cores, nodes)
+        with self.assertRaises(ValueError):
+            CpuAffinity.plan([[0], []], cores, nodes)
+        with self.assertRaises(ValueError):
+            ParallelExecutor(prf_pinned, affinity=[999])
+
+    def test_cores(self):
+        plan = [[0], [3], [1]]
+        self.assertEqual([CpuAffinity.cores(plan, key) for key in range(5)], [[0], [3], [1], [0], [3]])
+        self.assertIsNone(CpuAffinity.cores(None, 1))
+
+    def test_nodes(self):
+        cores = sorted(os.sched_getaffinity(0))
+        nodes = CpuAffinity.nodes()
+        self.assertEqual(sorted(core for node in nodes for core in node), cores)
+
+    def test_pool_pinned(self):
+        core = max(os.sched_getaffinity(0))
+        pool = ExecutorPool(prf_pinned, _executor_wrapper, _async_executor_wrapper, affinity=[[core]])
+        pool.open(2)
+        try:
+            setup = RunSetup(duration_second=0, start_delay=0)
+            setup.set_start_time()
+            return_dict = pool.execute(setup, 2, 2)
+        finally:
+            pool.close()
+        self.assertTrue(all(probe.affinity == [core] and probe.cores == [core] for probe in return_dict.values()))
+
+    def test_pool_pin_error(self):
+        # the plan without check of available cores, the pinning fails in each executor
+        pool = ExecutorPool(prf_pinned, _executor_wrapper, _async_executor_wrapper, affinity=[[999]])
+        pool.open(2)
+        try:
+            setup = RunSetup(duration_second=0, start_delay=0)
+            setup.set_start_time()
+            return_dict = pool.execute(setup, 2, 2)
+        finally:
+            pool.close()
+        self.assertEqual(sorted(return_dict.keys()), ["0x0", "0x1", "1x0", "1x1"])
+        self.assertTrue(all(probe.exception.startswith("OSError") for probe in return_dict.values()))
+
+    def test_run_pin_error(self):
+        generator = ParallelExecutor(prf_pinned,
+                                     label="Affinity error",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_affinity_test.txt"))
+        generator._affinity = [[999]]
+        setup = RunSetup(duration_second=0.2, start_delay=1)
+        self.assertFalse(generator.run_executor([[2, 1]], setup).state)
+
+    def test_run_compact(self):
+        output_file = path.join(self.OUTPUT_ADR, "perf_affinity_test.txt")
+        generator = ParallelExecutor(prf_pinned,
+                                     label="Affinity",
+                                     detail_output=True,
+                                     output_file=output_file,
+                                     affinity="compact")
+        setup = RunSetup(duration_second=0.2, start_delay=1)
+        self.assertTrue(generator.run_executor([[2, 1], [1, 2]], setup).state)
+
+        cores = sorted(os.sched_getaffinity(0))
+        with open(output_file) as file:
+            details = [json.loads(line) for line in file if '"type":"detail"' in line]
+        self.assertEqual(len(details), 4)
+        self.assertTrue(all(len(detail["cores"]) == 1 and detail["cores"][0] in cores for detail in details))
@@ -209,6 +209,19 @@ class TestCaseGraph(unittest.TestCase):
         output=generator.create_graph_perf(self.OUTPUT_ADR)
         self.assertTrue(len(output)==2)
 
+    def test_graph_percentile_precise(self):
+
+        generator = ParallelExecutor(prf_test,
+                                     label="test_percentile_precise",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_test_percentile_precise.txt"))
+
+        # the keys for header percentile are also in format of graphs (e.g. '_99' for 0.999)
+        setup=RunSetup(duration_second=1, start_delay=0, parameters={"percentile": [0.999, 0.5]})
+        generator.run_executor([[1, 1], [2, 1]], setup)
+        output=generator.create_graph_perf(path.join(self.OUTPUT_ADR, "precise"))
+        self.assertTrue(len(output)==1)
+
     def test_graph_onlynew(self):
 
         generator = ParallelExecutor(prf_test,
@@ -0,0 +1,131 @@
+import unittest
+from qgate_perf.latency_histogram import LatencyHistogram
+from qgate_perf.helper import Helper
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.output_result import Output
+from qgate_perf.run_setup import RunSetup
+from numpy import std, sort, array
+
+
+class TestCaseHistogram(unittest.TestCase):
+    """Log-bucketed histogram for percentiles"""
+
+    def _values(self, amount = 10000):
+        generator = Helper.get_rnd_generator()
+        return list(generator.lognormal(-6, 1, amount))
+
+    def test_value_at(self):
+        values = self._values()
+        histogram = LatencyHistogram(0.01)
+        for value in values:
+            histogram.record(value)
+
+        self.assertEqual(histogram.count, len(values))
+        for percentile in [0.5, 0.9, 0.99, 0.999]:
+            expected = sorted(values)[round(len(values) * percentile) - 1]
+            # error is limited by width of one bucket
+            self.assertAlmostEqual(histogram.value_at(percentile) / expected, 1, delta = 0.025)
+        self.assertEqual(histogram.value_at(1), max(values))
+
+    def test_summary(self):
+        values = self._values()
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        # all values are exact
+        count, total, deviation, min_value, max_value = histogram.summary(1)
+        self.assertEqual(count, len(values))
+        self.assertAlmostEqual(total, sum(values), 9)
+        self.assertAlmostEqual(deviation, std(values), 9)
+        self.assertEqual(min_value, min(values))
+        self.assertEqual(max_value, max(values))
+
+        # values till percentile are in precision of histogram
+        trimmed = sort(values)[:int((len(values) + 1) * 0.9)]
+        count, total, deviation, min_value, max_value = histogram.summary(0.9)
+        self.assertEqual(count, len(trimmed))
+        self.assertAlmostEqual(total / sum(trimmed), 1, delta = 0.01)
+        self.assertAlmostEqual(deviation / std(trimmed), 1, delta = 0.02)
+        self.assertAlmostEqual(max_value / trimmed[-1], 1, delta = 0.02)
+
+    def test_record_batch(self):
+        values = self._values()
+        histogram, batch = LatencyHistogram(), LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        batch.record_batch(array(values[:5000]))
+        batch.record_batch(array(values[5000:]))
+
+        self.assertEqual(batch.count, histogram.count)
+        for expected, current in zip(histogram.summary(0.99), batch.summary(0.99)):
+            self.assertAlmostEqual(expected, current, 9)
+        self.assertEqual(batch.value_at(1), histogram.value_at(1))
+
+    def test_merge(self):
+        values = self._values()
+        histogram, part1, part2 = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for index, value in enumerate(values):
+            histogram.record(value)
+            (part1 if index % 2 else part2).record(value)
+        part1.merge(part2)
+
+        self.assertEqual(part1.count, histogram.count)
+        for percentile in [0.5, 0.99, 1]:
+            self.assertEqual(part1.value_at(percentile), histogram.value_at(percentile))
+
+        with self.assertRaises(Exception):
+            part1.merge(LatencyHistogram(0.05))
+
+    def test_fixed_memory(self):
+        histogram = LatencyHistogram(0.01)
+        for value in [0, 1e-12, 1e-9, 1, 1e9, 1e12]:
+            histogram.record(value)
+        self.assertLessEqual(len(histogram), histogram.max_buckets)
+        self.assertEqual(len(histogram), 3)
+
+    def test_invalid_params(self):
+        with self.assertRaises(Exception):
+            LatencyHistogram(0)
+        with self.assertRaises(Exception):
+            LatencyHistogram(1)
+        with self.assertRaises(Exception):
+            LatencyHistogram.percentile_list([0.5, 1])
+        self.assertEqual(LatencyHistogram.percentile_list([0.99, 0.5, 0.99]), [0.5, 0.99])
+
+    def test_percentile_suffix(self):
+        self.assertEqual(LatencyHistogram.percentile_suffix(0.99), "_99")
+        self.assertEqual(LatencyHistogram.percentile_suffix(0.999), "_999")
+        self.assertEqual(LatencyHistogram.percentile_suffix(0.5), "_50")
+        self.assertEqual(LatencyHistogram.percentile_suffix(1), "")
+        self.assertEqual(LatencyHistogram.graph_suffix(0.999), "_99")
+        self.assertEqual(LatencyHistogram.graph_suffix(0.975), "_97")
+        self.assertEqual(LatencyHistogram.graph_suffix(1), "")
+
+    def _probe(self, setup, durations):
+        probe = ParallelProbe(setup)
+        for duration in durations:
+            probe.call_fn(duration)
+        probe.close_fn()
+        return probe
+
+    def test_global_percentiles(self):
+        setup = RunSetup(duration_second=0, start_delay=0, parameters={"percentile": 0.99})
+        setup.set_start_time()
+
+        # uneven executors (one fast and one slow)
+        return_dict = {0: self._probe(setup, [0.001] * 1000), 1: self._probe(setup, [0.1] * 10)}
+        summaries = Output()._create_percentile_list(setup, return_dict)
+
+        # call-weighted average and pooled standard deviation
+        values = [0.001] * 1000 + [0.1] * 10
+        self.assertEqual(summaries[1].count, 1010)
+        self.assertAlmostEqual(summaries[1].avrg, sum(values) / len(values), 9)
+        self.assertAlmostEqual(summaries[1].std, std(values), 9)
+        self.assertEqual(summaries[1].executors, 2)
+
+        # global percentile (the slowest 1% of all calls is excluded)
+        self.assertEqual(summaries[0.99].count, 1000)
+        self.assertAlmostEqual(summaries[0.99].max, 0.001, 9)
+        self.assertAlmostEqual(summaries[0.99].avrg, 0.001, 9)
+        self.assertAlmostEqual(summaries[1].histogram.value_at(0.995), 0.1, 9)
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 from qgate_perf.parallel_executor import ParallelExecutor
 from qgate_perf.parallel_probe import ParallelProbe
 from qgate_perf.run_setup import RunSetup
@@ -38,6 +39,25 @@ class TestCaseInternal(unittest.TestCase):
         print(str(setup))
         self.assertIsNotNone(str(setup))
 
+    def test_summary_state(self):
+        generator = ParallelExecutor(None, output_file=None)
+        self.assertFalse(generator._get_summary_state({}))
+        self.assertFalse(generator._get_summary_state({0: ParallelProbe(None, "error")}))
+        self.assertTrue(generator._get_summary_state({0: ParallelProbe(None)}))
+
+        # missing executors
+        self.assertFalse(generator._get_summary_state({0: ParallelProbe(None)}, 2))
+
+    def test_execute_core_error(self):
+        # the error of execution is part of return values
+        pool = mock.Mock(is_open=True)
+        pool.execute.side_effect = FileNotFoundError("No such file or directory: '/psm_test'")
+        generator = ParallelExecutor(None, output_file=None)
+        generator._pool = pool
+        return_dict = generator._executeCore(RunSetup(duration_second=0, start_delay=0), 1, 1)
+        self.assertFalse(generator._get_summary_state(return_dict, 1))
+        self.assertIn("FileNotFoundError", return_dict[0].exception)
+
     def test_size(self):
         import sys
 
@@ -0,0 +1,102 @@
+import unittest
+import json
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+from qgate_perf.helper import Helper
+import time
+from os import path
+import shutil
+
+
+def prf_stable(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, with stable duration of calls"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.001)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfAdaptive(unittest.TestCase):
+    """Adaptive duration based on stable throughput"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfAdaptive.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_adaptive_stable(self):
+        output_file = path.join(self.OUTPUT_ADR, "perf_adaptive_test.txt")
+        generator = ParallelExecutor(prf_stable,
+                                     label="Adaptive stable",
+                                     detail_output=True,
+                                     output_file=output_file)
+
+        # stable throughput, the run is stopped before max. duration
+        setup=RunSetup(duration_second=20, start_delay=0.5, parameters={"adaptive_precision": 0.1, "adaptive_min_duration": 0.5})
+        begin = time.time()
+        perf = generator.run_executor([[2, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertLess(time.time() - begin, 10)
+
+        adaptive = perf[0][1].adaptive
+        self.assertGreaterEqual(adaptive["duration"], 0.5)
+        self.assertLess(adaptive["duration"], 10)
+        self.assertGreaterEqual(adaptive["samples"], 5)
+        self.assertLessEqual(adaptive["precision"], 0.1)
+
+        with open(output_file) as file:
+            core = [json.loads(line) for line in file if '"type":"core"' in line][-1]
+        self.assertEqual(core["adaptive"]["samples"], adaptive["samples"])
+
+    def test_adaptive_percentile(self):
+        generator = ParallelExecutor(prf_stable,
+                                     label="Adaptive percentile",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_adaptive_percentile_test.txt"))
+
+        # calls are counted in histogram (for percentiles)
+        setup=RunSetup(duration_second=20, start_delay=0.5, parameters={"adaptive_precision": 0.1, "adaptive_min_duration": 0.5, "percentile": 0.9})
+        perf = generator.run_executor([[2, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertLess(perf[0][1].adaptive["duration"], 10)
+        self.assertIsNotNone(perf[0][0.9])
+
+    def test_adaptive_max(self):
+        generator = ParallelExecutor(prf_stable,
+                                     label="Adaptive max",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_adaptive_max_test.txt"))
+
+        # unreachable precision, the run is stopped after max. duration
+        setup=RunSetup(duration_second=1, start_delay=0.5, parameters={"adaptive_precision": 0.000001, "adaptive_min_duration": 0.5})
+        perf = generator.run_executor([[1, 2]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        adaptive = perf[0][1].adaptive
+        self.assertGreaterEqual(adaptive["duration"], 1)
+        self.assertLess(adaptive["duration"], 1.5)
+
+    def test_confidence_interval(self):
+        mean, std, low, high = Helper.confidence_interval([10, 12, 14])
+        self.assertEqual(mean, 12)
+        self.assertEqual(std, 2)
+        self.assertAlmostEqual(high - mean, 4.303 * 2 / 3 ** 0.5)
+        self.assertAlmostEqual(mean - low, high - mean)
+        self.assertEqual(Helper.confidence_interval([5]), (5, 0, 5, 5))
@@ -0,0 +1,171 @@
+import unittest
+import asyncio
+from unittest import mock
+from qgate_perf.parallel_executor import ParallelExecutor, _executor_wrapper, _async_executor_wrapper
+from qgate_perf.executor_pool import _task_executor
+from qgate_perf.executor_sync import ExecutorSync
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+
+async def prf_async(run_setup: RunSetup) -> ParallelProbe:
+    """ Async function for performance testing (one task in event loop)"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        await asyncio.sleep(0.01)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    if run_setup.param("generate_error"):
+        raise Exception('Simulated error')
+
+    # return outputs
+    return probe
+
+async def prf_async_open_loop(run_setup: RunSetup) -> ParallelProbe:
+    """ Async function for performance testing in open-loop mode"""
+
+    probe = ParallelProbe(run_setup)
+    while (True):
+        await probe.async_start()
+        await asyncio.sleep(0.01)
+        if probe.stop():
+            break
+    return probe
+
+def prf_sync(run_setup: RunSetup) -> ParallelProbe:
+    """ Sync function for performance testing"""
+
+    probe = ParallelProbe(run_setup)
+    while (True):
+        probe.start()
+        time.sleep(0.01)
+        if probe.stop():
+            break
+    return probe
+
+
+class TestCasePerfAsync(unittest.TestCase):
+    """Execution in level processes x threads x tasks (in event loop)"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfAsync.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_testrun_async(self):
+        generator = ParallelExecutor(prf_async,
+                                     label="Async",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_async_test.txt"))
+
+        self.assertTrue(generator.test_run(print_output=True))
+        self.assertTrue(generator.init_run())
+
+    def test_run_executor_tasks(self):
+        generator = ParallelExecutor(prf_async,
+                                     label="Async",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_async_test.txt"))
+
+        setup=RunSetup(duration_second=1, start_delay=0)
+        perf = generator.run_executor([[1, 1, '1x thread'], [1, 1, 20, '20x task'], [2, 2, 10, '10x task']],
+                                      setup,
+                                      performance_detail=True)
+        self.assertTrue(perf.state)
+
+        # real executors = processes x threads x tasks
+        self.assertEqual(perf[0][1].executors, 1)
+        self.assertEqual(perf[1][1].executors, 20)
+        self.assertEqual(perf[2][1].executors, 40)
+        self.assertEqual(perf[2].executor_task, 10)
+
+        # the calls in event loop are concurrent (20 tasks ~ 20x more calls than one task)
+        self.assertTrue(perf[1][1].count > perf[0][1].count * 10)
+
+    def test_run_tasks(self):
+        generator = ParallelExecutor(prf_async,
+                                     label="Async",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_async_test.txt"),
+                                     pooled=True)
+
+        setup=RunSetup(duration_second=1, start_delay=0)
+        self.assertTrue(generator.run(2, 1, setup, tasks=50).state)
+
+    def test_run_tasks_exception(self):
+        generator = ParallelExecutor(prf_async,
+                                     label="Async",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_async_test.txt"))
+
+        setup=RunSetup(duration_second=0, start_delay=0, parameters={"generate_error": "yes"})
+        self.assertFalse(generator.run_executor([[1, 2, 5]], setup).state)
+
+    def test_run_tasks_sync_function(self):
+        generator = ParallelExecutor(prf_sync,
+                                     label="Async",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_async_test.txt"))
+
+        # tasks need 'async def' function
+        setup=RunSetup(duration_second=0, start_delay=0)
+        self.assertFalse(generator.run_executor([[1, 1, 5]], setup).state)
+
+    def test_run_tasks_barrier(self):
+        generator = ParallelExecutor(prf_async,
+                                     label="Async",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_async_test.txt"))
+
+        # the start barrier does not block event loop (all tasks are released without waiting for start delay)
+        setup=RunSetup(duration_second=0.5, start_delay=4)
+        begin = time.time()
+        self.assertTrue(generator.run_executor([[1, 1, 4]], setup).state)
+        self.assertLess(time.time() - begin, 3.5)
+
+    def test_open_loop_tasks(self):
+        # the waiting for intended start time does not block other tasks in event loop
+        setup = RunSetup(duration_second=1, start_delay=0, parameters={"arrival_rate": 50})
+        setup.set_start_time()
+
+        async def run_tasks():
+            return await asyncio.gather(*[prf_async_open_loop(setup) for _ in range(4)])
+
+        for probe in asyncio.run(run_tasks()):
+            self.assertTrue(45 <= probe.counter <= 52)
+            self.assertLess(probe.total_duration / probe.counter, 0.02)
+
+    def test_tasks_sync_access(self):
+        # one access to the shared memory for all tasks in the thread
+        sync = ExecutorSync(200)
+        try:
+            setup = RunSetup(duration_second=0, start_delay=0, parameters={"total_calls": 2000})
+            setup.set_start_time()
+            setup.set_executors(200)
+            setup.set_sync(sync.name)
+            sync.release()
+            return_dict = {}
+            with mock.patch.object(ExecutorSync, "_attach", wraps=ExecutorSync._attach) as attach:
+                _task_executor(prf_async, _executor_wrapper, _async_executor_wrapper, 0, return_dict, setup, 200)
+            self.assertEqual(attach.call_count, 1)
+        finally:
+            sync.close()
+        self.assertEqual(len(return_dict), 200)
+        self.assertTrue(all(probe.exception is None and probe.counter == 10 for probe in return_dict.values()))
@@ -0,0 +1,106 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.executor_sync import ExecutorSync
+from qgate_perf.output_result import Output
+from qgate_perf.run_setup import RunSetup
+import time
+from types import SimpleNamespace
+from os import path
+import shutil
+
+
+def prf_barrier(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, with slow init of executor"""
+
+    # slow init of some executors (before ready state)
+    time.sleep(0.5 if run_setup.executor_index % 2 else 0)
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.001)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfBarrier(unittest.TestCase):
+    """Start barrier for all executors via shared memory"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfBarrier.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_sync(self):
+        sync = ExecutorSync(2)
+        try:
+            executor = ExecutorSync(name = sync.name)
+            executor.ready(1)
+            self.assertEqual(sync.ready_executors(2), 1)
+            self.assertFalse(executor.wait_for_release(time.time() + 0.01))
+
+            sync.release()
+            self.assertTrue(executor.wait_for_release(time.time() + 0.01))
+            executor.close()
+        finally:
+            sync.close()
+
+    def test_run_executor_barrier(self):
+        generator = ParallelExecutor(prf_barrier,
+                                     label="Barrier",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_barrier_test.txt"))
+
+        # all executors start at once (after the slowest init), without waiting for the whole start delay
+        setup=RunSetup(duration_second=1, start_delay=5, parameters={})
+        start = time.time()
+        perf = generator.run_executor([[2, 2], [4, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertLess(time.time() - start, 8)
+        for result in perf.results:
+            self.assertLess(result[1].start_skew, 0.05)
+
+    def test_run_executor_global_stop(self):
+        generator = ParallelExecutor(prf_barrier,
+                                     label="Global stop",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_barrier_test.txt"))
+
+        # all executors finish together, the full concurrency window is close to the duration
+        setup=RunSetup(duration_second=1, start_delay=1, parameters={"time_series": 0.1})
+        perf = generator.run_executor([[2, 2]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        window = perf[0][1].full_window
+        self.assertGreater(window["duration"], 0.9)
+        self.assertLess(window["duration"], 1.1)
+        self.assertLessEqual(window["calls"], perf[0][1].count)
+        self.assertGreater(window["call_per_sec"], 0)
+        self.assertEqual(window["executors"], 4)
+
+    def test_full_window_error(self):
+        # the window is based on successful executors (the failed executor is skipped)
+        return_dict = {0: SimpleNamespace(exception=None, init_time=10, end_time=12, counter=200, series=None),
+                       1: SimpleNamespace(exception=None, init_time=11, end_time=13, counter=100, series=None),
+                       2: ParallelProbe(None, "Exception: simulated error"),
+                       3: None}
+        window = Output._create_full_window(return_dict)
+        self.assertEqual(window["duration"], 1)
+        self.assertEqual(window["calls"], 150)
+        self.assertEqual(window["call_per_sec"], 150)
+        self.assertEqual(window["executors"], 2)
+        self.assertIsNone(Output._create_full_window({0: None}))
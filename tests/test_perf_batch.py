@@ -0,0 +1,78 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+from os import path
+import shutil
+
+
+def prf_batch(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing (very fast operation in batch)"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        for i in range(probe.batch_size):
+            abs(i)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfBatch(unittest.TestCase):
+    """Batch mode, one sample contains more operations"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfBatch.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_batch_calibration(self):
+        setup = RunSetup(duration_second=1, start_delay=0, parameters={"batch_duration": 0.001})
+        setup.set_start_time()
+        probe = prf_batch(setup)
+
+        # batch size is calibrated for sample with min. 1 ms
+        self.assertGreater(probe.batch_size, 100)
+        self.assertEqual(probe.counter % probe.batch_size, 0)
+
+        # statistics are for one operation
+        self.assertLess(probe.total_duration / probe.counter, 0.0001)
+        self.assertLessEqual(probe.max_duration, 0.001)
+
+    def test_batch_percentile(self):
+        setup = RunSetup(duration_second=1, start_delay=0, parameters={"batch_duration": 0.001, "percentile": 0.99})
+        setup.set_start_time()
+        probe = prf_batch(setup)
+        self.assertEqual(probe.histogram.count, probe.counter)
+        self.assertEqual(probe.percentile_results[-1].count, probe.counter)
+
+    def test_zero_duration(self):
+        setup = RunSetup(duration_second=0, start_delay=0, parameters={"batch_duration": 0.001})
+        setup.set_start_time()
+        probe = prf_batch(setup)
+        self.assertEqual(probe.counter, 1)
+
+    def test_run_executor_batch(self):
+        generator = ParallelExecutor(prf_batch,
+                                     label="Batch",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_batch_test.txt"))
+
+        setup=RunSetup(duration_second=1, start_delay=0, parameters={"batch_duration": 0.001})
+        perf = generator.run_executor([[1, 1], [2, 2]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertGreater(perf[0][1].call_per_sec, 100000)
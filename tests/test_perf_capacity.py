@@ -0,0 +1,93 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+
+def prf_latency(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, the latency grows with amount of executors"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.001 * run_setup.executors)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfCapacity(unittest.TestCase):
+    """Search of capacity under SLO"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfCapacity.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_capacity_processes(self):
+        generator = ParallelExecutor(prf_latency,
+                                     label="Capacity processes",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_capacity_test.txt"))
+
+        # p50 under 3.6 ms, valid only for 1-3 executors
+        setup=RunSetup(duration_second=0.5, start_delay=0.5, parameters={"percentile": 0.5})
+        perf = generator.run_capacity(setup, slo=0.0036, max_processes=8)
+        self.assertTrue(perf.state)
+        self.assertEqual(perf.best.executor_process, 3)
+        self.assertEqual([result.executor_process for result in perf.results], [1, 2, 4, 3])
+
+    def test_capacity_invalid(self):
+        generator = ParallelExecutor(prf_latency,
+                                     label="Capacity invalid",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_capacity_test.txt"))
+
+        setup=RunSetup(duration_second=0.5, start_delay=0.5, parameters={"percentile": [0.5, 0.99]})
+        perf = generator.run_capacity(setup, slo=0.0001, percentile=0.5, max_processes=4)
+        self.assertTrue(perf.state)
+        self.assertIsNone(perf.best)
+        self.assertEqual(len(perf.results), 1)
+
+    def test_capacity_percentile(self):
+        generator = ParallelExecutor(prf_latency,
+                                     label="Capacity percentile",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_capacity_test.txt"))
+
+        with self.assertRaises(ValueError):
+            generator.run_capacity(RunSetup(duration_second=0.5, start_delay=0.5), slo=0.01)
+        with self.assertRaises(ValueError):
+            generator.run_capacity(RunSetup(duration_second=0.5, start_delay=0.5, parameters={"percentile": 0.99}),
+                                   slo=0.01,
+                                   percentile=0.9)
+
+    def test_capacity_open_loop(self):
+        generator = ParallelExecutor(prf_latency,
+                                     label="Capacity open-loop",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_capacity_test.txt"))
+
+        # one executor with 1 ms per call, the latency grows over ~1000 calls per second (queue)
+        setup=RunSetup(duration_second=0.5, start_delay=0.5, parameters={"percentile": 0.9, "arrival_rate_total": 100})
+        perf = generator.run_capacity(setup, slo=0.01, max_processes=1, max_arrival_rate=3200, precision=0.1)
+        self.assertTrue(perf.state)
+        self.assertIsNotNone(perf.best)
+        self.assertLess(perf.best[1].count, 1100 * 0.5)
+        self.assertGreater(perf.best[1].count, 200 * 0.5)
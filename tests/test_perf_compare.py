@@ -0,0 +1,153 @@
+import unittest
+from click.testing import CliRunner
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.perf_compare import PerfCompare, main
+from qgate_perf.output_result import PerfResults, PerfResult, PercentileSummary
+from qgate_perf.run_setup import RunSetup
+from qgate_perf.helper import Helper
+import time
+from os import path
+import shutil
+
+
+def prf_sleep(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, with duration of call from parameters"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(run_setup["sleep"])
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfCompare(unittest.TestCase):
+    """Comparison of runs between baseline and current run"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    BASELINE_FILE = path.join(OUTPUT_ADR, "perf_compare_baseline.txt")
+    CURRENT_FILE = path.join(OUTPUT_ADR, "perf_compare_current.txt")
+
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfCompare.OUTPUT_ADR, True)
+
+        # baseline with 1 ms, current run with 2 ms and the same run with 2 ms
+        for output_file, sleep in [(TestCasePerfCompare.BASELINE_FILE, 0.001),
+                                   (TestCasePerfCompare.BASELINE_FILE, 0.002),
+                                   (TestCasePerfCompare.CURRENT_FILE, 0.002)]:
+            generator = ParallelExecutor(prf_sleep,
+                                         label="Compare",
+                                         detail_output=False,
+                                         output_file=output_file)
+            setup = RunSetup(duration_second=0.5, start_delay=0.5, parameters={"sleep": sleep, "percentile": 0.9})
+            generator.run_executor([[1, 1], [2, 1]], setup)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_compare_regression(self):
+        comparisons = PerfCompare().compare_files(self.BASELINE_FILE)
+        self.assertEqual(len(comparisons), 2)
+        self.assertEqual(comparisons[0]["executors"], "1x1")
+        self.assertEqual(comparisons[0]["bulk"], [1, 1])
+
+        findings = {finding["metric"]: finding for finding in comparisons[0]["metrics"]}
+        self.assertEqual(findings["total_call_per_sec"]["verdict"], PerfCompare.REGRESSION)
+        self.assertEqual(findings["avrg_time"]["verdict"], PerfCompare.REGRESSION)
+        self.assertEqual(findings["max_90"]["verdict"], PerfCompare.REGRESSION)
+        self.assertLess(findings["total_call_per_sec"]["change"], -0.3)
+        self.assertEqual(PerfCompare.regressions(comparisons), 6)
+
+        # one baseline and one current run, without variance cross runs (only threshold)
+        self.assertIsNone(findings["avrg_time"]["p_value"])
+        self.assertIsNone(findings["avrg_time"]["effect"])
+
+    def test_compare_improvement(self):
+        # the reverse order of runs
+        runs = PerfResults.load(self.BASELINE_FILE)
+        comparisons = PerfCompare().compare_runs([runs[1]], [runs[0]])
+        self.assertEqual(PerfCompare.regressions(comparisons), 0)
+        for finding in comparisons[0]["metrics"]:
+            self.assertEqual(finding["verdict"], PerfCompare.IMPROVEMENT)
+
+    @staticmethod
+    def _result(call_per_sec, trials = None) -> PerfResult:
+        summary = PercentileSummary(1, 1000, call_per_sec, call_per_sec, 2 / call_per_sec, 0.0002, 0.0005, 0.002, 2)
+        summary.trials = trials
+        return PerfResult(True, 1, 1, 2, 1, {1: summary})
+
+    def test_compare_same(self):
+        # the change under threshold
+        findings = PerfCompare().compare(self._result(2000), self._result(1960))
+        self.assertEqual([finding["verdict"] for finding in findings], [PerfCompare.SAME, PerfCompare.SAME])
+
+        # the change over threshold, but without statistical significance (high noise cross runs)
+        findings = PerfCompare().compare([self._result(value) for value in [2000, 2400, 1600]],
+                                         [self._result(value) for value in [1800, 2200, 1400]])
+        self.assertEqual([finding["verdict"] for finding in findings], [PerfCompare.SAME, PerfCompare.SAME])
+        self.assertGreater(findings[0]["p_value"], 0.01)
+
+        # the same run
+        comparisons = PerfCompare().compare_files(self.CURRENT_FILE, self.CURRENT_FILE)
+        self.assertEqual(len(comparisons), 2)
+        self.assertEqual(PerfCompare.regressions(comparisons), 0)
+
+    def test_compare_repeated(self):
+        # low noise cross repeated runs, the change is significant
+        findings = PerfCompare().compare([self._result(value) for value in [2000, 2010, 1990]],
+                                         [self._result(value) for value in [1800, 1810, 1790]])
+        self.assertEqual([finding["verdict"] for finding in findings], [PerfCompare.REGRESSION, PerfCompare.REGRESSION])
+        self.assertLess(findings[0]["p_value"], 0.01)
+        self.assertLess(findings[0]["effect"], -1)
+
+        # variance from baseline runs for one current run
+        findings = PerfCompare().compare([self._result(value) for value in [2000, 2010, 1990]], self._result(1800))
+        self.assertEqual(findings[0]["verdict"], PerfCompare.REGRESSION)
+        self.assertLess(findings[0]["p_value"], 0.01)
+
+    def test_compare_small_runs(self):
+        # quantiles of Student's t-distribution for 95% confidence interval
+        for df, t in enumerate(Helper.T_975, start = 1):
+            self.assertAlmostEqual(Helper.t_p_value(t, df), 0.05, places = 3)
+
+        # two runs on each side, the normal approximation (p-value ~0.01) is anti-conservative
+        p_value, _ = PerfCompare._test((2000, 20, 2), (1950, 20, 2))
+        self.assertGreater(p_value, 0.05)
+        findings = PerfCompare().compare([self._result(value) for value in [2000, 2030]],
+                                         [self._result(value) for value in [1880, 1910]])
+        self.assertEqual(findings[0]["verdict"], PerfCompare.SAME)
+
+    def test_compare_trials(self):
+        # variance of throughput from trials (the average latency is without test)
+        baseline = self._result(2000, {"count": 5, "mean": 2000, "std": 20})
+        findings = PerfCompare().compare(baseline, self._result(1800, {"count": 5, "mean": 1800, "std": 20}))
+        self.assertEqual(findings[0]["verdict"], PerfCompare.REGRESSION)
+        self.assertLess(findings[0]["p_value"], 0.01)
+        self.assertIsNone(findings[1]["p_value"])
+
+        findings = PerfCompare().compare(baseline, self._result(1800, {"count": 5, "mean": 1800, "std": 400}))
+        self.assertEqual(findings[0]["verdict"], PerfCompare.SAME)
+
+    def test_compare_cli(self):
+        runner = CliRunner()
+        result = runner.invoke(main, ["--baseline", self.BASELINE_FILE])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("regression", result.output)
+
+        result = runner.invoke(main, ["--baseline", self.CURRENT_FILE, "--current", self.CURRENT_FILE, "--threshold", "0.1",
+                                      "--output", path.join(self.OUTPUT_ADR, "perf_compare_report.txt")])
+        self.assertEqual(result.exit_code, 0)
+        self.assertTrue(path.exists(path.join(self.OUTPUT_ADR, "perf_compare_report.txt")))
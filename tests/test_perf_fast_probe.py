@@ -0,0 +1,79 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+from os import path
+import shutil
+
+
+def prf_short(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing (very short call)"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        sum(range(10))
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfFastProbe(unittest.TestCase):
+    """Fast-path mode of probe for very short calls"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfFastProbe.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def _probe(self, parameters):
+        setup = RunSetup(duration_second=1, start_delay=0, parameters=parameters)
+        setup.set_start_time()
+        return prf_short(setup)
+
+    def test_fast_probe(self):
+        probe = self._probe({"fast_probe": True})
+        self.assertGreater(probe.counter, 0)
+        self.assertGreater(probe.total_duration, 0)
+        self.assertEqual(len(probe.buffer), 0)
+        self.assertIsNotNone(probe.overhead)
+
+    def test_fast_probe_percentile(self):
+        probe = self._probe({"fast_probe": True, "percentile": [0.5, 0.99]})
+        self.assertEqual(len(probe.percentile_results), 3)
+        self.assertEqual(probe.percentile_results[-1].count, probe.counter)
+        self.assertEqual(probe.histogram.count, probe.counter)
+
+    def test_fast_probe_overhead(self):
+        # the probe overhead per call is lower in fast-path mode (more calls in the same time)
+        standard = self._probe({})
+        fast = self._probe({"fast_probe": True})
+        self.assertLess(fast.overhead, standard.overhead)
+        self.assertGreater(fast.counter, standard.counter)
+
+    def test_zero_duration(self):
+        setup = RunSetup(duration_second=0, start_delay=0, parameters={"fast_probe": True})
+        setup.set_start_time()
+        self.assertEqual(prf_short(setup).counter, 1)
+
+    def test_run_executor_fast_probe(self):
+        generator = ParallelExecutor(prf_short,
+                                     label="Fast probe",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_fast_probe_test.txt"))
+
+        setup=RunSetup(duration_second=1, start_delay=0, parameters={"fast_probe": True, "percentile": 0.99})
+        self.assertTrue(generator.run_executor([[1, 1], [2, 2]], setup).state)
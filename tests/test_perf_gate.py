@@ -0,0 +1,108 @@
+import unittest
+import json
+from click.testing import CliRunner
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.perf_gate import PerfGate, main
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+
+def prf_gate(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.001)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfGate(unittest.TestCase):
+    """Quality gates for performance results"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    OUTPUT_FILE = path.join(OUTPUT_ADR, "perf_gate_test.txt")
+    performance = None
+
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfGate.OUTPUT_ADR, True)
+        generator = ParallelExecutor(prf_gate,
+                                     label="Quality gate",
+                                     detail_output=False,
+                                     output_file=TestCasePerfGate.OUTPUT_FILE)
+        setup = RunSetup(duration_second=0.5, start_delay=0.5, parameters={"percentile": 0.99})
+        TestCasePerfGate.performance = generator.run_executor([[1, 1], [2, 1]], setup, performance_detail=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def _performance(self):
+        # fresh copy of results (the evaluation changes states)
+        return PerfGate.load(TestCasePerfGate.OUTPUT_FILE)
+
+    def test_gate_valid(self):
+        self.assertTrue(TestCasePerfGate.performance.state)
+        state = PerfGate.evaluate(TestCasePerfGate.performance,
+                                  [PerfGate(min_call_per_sec=100, max_avrg=0.01, max_std=0.01, max_percentile={0.99: 0.5})])
+        self.assertTrue(state)
+
+    def test_gate_invalid(self):
+        performance = self._performance()
+        self.assertEqual(performance.count_states, 2)
+
+        state = PerfGate.evaluate(performance,
+                                  [PerfGate(min_call_per_sec=1000000), PerfGate(max_percentile={"0.99": 0.00001, 0.5: 1})],
+                                  path.join(self.OUTPUT_ADR, "perf_gate_verdict.txt"))
+        self.assertFalse(state)
+        self.assertEqual(performance.count_false_states, 2)
+        self.assertEqual(len(performance[0].reasons), 3)
+        self.assertTrue(performance[0].reasons[0].startswith("total_call_per_sec"))
+        self.assertEqual(performance[0].reasons[1], "max_50 is not measured")
+        self.assertTrue(performance[0].reasons[2].startswith("max_99"))
+
+        with open(path.join(self.OUTPUT_ADR, "perf_gate_verdict.txt")) as file:
+            verdict = json.loads(file.readlines()[-1])
+        self.assertEqual(verdict["type"], "verdict")
+        self.assertFalse(verdict["state"])
+        self.assertEqual(verdict["failed"], 2)
+        self.assertEqual(len(verdict["reasons"]), 6)
+
+    def test_gate_executors(self):
+        performance = self._performance()
+
+        # the gate only for two processes
+        state = PerfGate.evaluate(performance, [PerfGate(min_call_per_sec=1000000, executors=[2, 1])])
+        self.assertFalse(state)
+        self.assertTrue(performance[0].state)
+        self.assertFalse(performance[1].state)
+        self.assertEqual(performance.count_false_states, 1)
+
+    def test_gate_cli(self):
+        gates = path.join(self.OUTPUT_ADR, "perf_gates.json")
+        runner = CliRunner()
+
+        with open(gates, "w") as file:
+            json.dump([{"min_call_per_sec": 100, "max_percentile": {"0.99": 0.5}}], file)
+        result = runner.invoke(main, ["--input", TestCasePerfGate.OUTPUT_FILE, "--gates", gates])
+        self.assertEqual(result.exit_code, 0)
+
+        with open(gates, "w") as file:
+            json.dump([{"min_call_per_sec": 1000000, "executors": [1, 1]}], file)
+        result = runner.invoke(main, ["--input", TestCasePerfGate.OUTPUT_FILE, "--gates", gates])
+        self.assertEqual(result.exit_code, 1)
@@ -0,0 +1,102 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor, _executor_wrapper, _async_executor_wrapper
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.executor_pool import ExecutorPool
+from qgate_perf.run_setup import RunSetup
+import time
+import os
+from os import path
+import shutil
+
+
+def prf_group(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+    probe.executor_index = run_setup.executor_index
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+def prf_crash(run_setup: RunSetup) -> ParallelProbe:
+    """ Function with unexpected end of executor process"""
+    os._exit(1)
+
+
+class TestCasePerfGroup(unittest.TestCase):
+    """Hierarchical launch, the sub-coordinators start own groups of processes"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfGroup.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def _setup(self):
+        setup = RunSetup(duration_second=0, start_delay=1)
+        setup.set_start_time()
+        return setup
+
+    def test_units(self):
+        pool = ExecutorPool(prf_group, _executor_wrapper, _async_executor_wrapper, group_size=2)
+        self.assertEqual(pool._units(5), [(0, 2), (2, 2), (4, 1)])
+        self.assertEqual(pool._units(3, 4), [(4, 2), (6, 1)])
+        pool = ExecutorPool(prf_group, _executor_wrapper, _async_executor_wrapper)
+        self.assertEqual(pool._units(3), [(0, 1), (1, 1), (2, 1)])
+        with self.assertRaises(ValueError):
+            ExecutorPool(prf_group, _executor_wrapper, _async_executor_wrapper, group_size=0)
+
+    def test_pool_group(self):
+        pool = ExecutorPool(prf_group, _executor_wrapper, _async_executor_wrapper, group_size=2)
+        pool.open(5)
+        try:
+            self.assertEqual(pool.size, 3)
+            first = pool.execute(self._setup(), 5, 2)
+            second = pool.execute(self._setup(), 5, 1)
+        finally:
+            pool.close()
+
+        # all executors in order of keys with unique index, the processes are reused
+        self.assertEqual(list(first.keys()), [f"{process}x{thread}" for process in range(5) for thread in range(2)])
+        self.assertEqual(sorted(probe.executor_index for probe in first.values()), list(range(10)))
+        self.assertEqual(list(second.keys()), list(range(5)))
+        self.assertEqual(len(set(probe.pid for probe in first.values())), 5)
+        self.assertEqual(set(probe.pid for probe in first.values()), set(probe.pid for probe in second.values()))
+
+    def test_pool_group_crash(self):
+        pool = ExecutorPool(prf_crash, _executor_wrapper, _async_executor_wrapper, group_size=2)
+        pool.open(3)
+        try:
+            # return values are missing for crashed processes
+            return_dict = pool.execute(self._setup(), 3, 1)
+            self.assertEqual(list(return_dict.values()), [None, None, None])
+        finally:
+            pool.close()
+
+    def test_run_group(self):
+        generator = ParallelExecutor(prf_group,
+                                     label="Group",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_group_test.txt"),
+                                     group_size=2)
+
+        setup = RunSetup(duration_second=0.5, start_delay=2)
+        perf = generator.run_executor([[5, 1], [3, 2]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertEqual(perf[0][1].executors, 5)
+        self.assertEqual(perf[1][1].executors, 6)
@@ -0,0 +1,105 @@
+import unittest
+import time
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+from os import path
+import shutil
+
+
+def prf_short(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing (short call)"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        sum(range(10))
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+def prf_batch(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing (batch of operations in one sample)"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        for i in range(probe.batch_size):
+            sum(range(10))
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfIterations(unittest.TestCase):
+    """Fixed-iteration mode, total amount of calls cross executors"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfIterations.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def _probe(self, parameters, executors = 1, executor_index = 0, func = prf_short):
+        setup = RunSetup(duration_second=0, start_delay=0, parameters=parameters)
+        setup.set_executors(executors)
+        setup.set_start_time()
+        return func(setup.executor_copy(executor_index))
+
+    def test_calls_share(self):
+        setup = RunSetup(parameters={"total_calls": 10})
+        setup.set_executors(3)
+        self.assertEqual([setup.executor_copy(index).calls_share for index in range(3)], [4, 3, 3])
+        self.assertIsNone(RunSetup().calls_share)
+
+    def test_probe(self):
+        self.assertEqual(self._probe({"total_calls": 1000}).counter, 1000)
+        self.assertEqual(self._probe({"total_calls": 1000, "percentile": [0.5, 0.99]}).counter, 1000)
+        self.assertEqual(self._probe({"total_calls": 1000, "fast_probe": True}).counter, 1000)
+        self.assertEqual(self._probe({"total_calls": 1000, "warmup_calls": 100}).counter, 1000)
+        self.assertEqual(self._probe({"total_calls": 1000, "batch_duration": 0.001}, func = prf_batch).counter, 1000)
+
+        # executor without share
+        self.assertEqual(self._probe({"total_calls": 2}, 4, 3).counter, 0)
+
+    def test_run(self):
+        generator = ParallelExecutor(prf_short,
+                                     label="Fixed iterations",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_iterations_test.txt"))
+
+        # the duration is ignored, the run ends after all calls
+        setup = RunSetup(duration_second=100, start_delay=0.5, parameters={"total_calls": 100001})
+        begin = time.time()
+        perf = generator.run_executor([[2, 2]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertLess(time.time() - begin, 50)
+
+        self.assertEqual(perf[0][1].count, 100001)
+        iterations = perf[0][1].iterations
+        self.assertEqual(iterations["planned"], 100001)
+        self.assertEqual(iterations["calls"], 100001)
+        self.assertGreater(iterations["elapsed"], 0)
+        self.assertAlmostEqual(iterations["call_per_sec"], 100001 / iterations["elapsed"])
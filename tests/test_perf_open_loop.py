@@ -0,0 +1,94 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+
+def prf_open_loop(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(run_setup.param("sleep", 0))
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfOpenLoop(unittest.TestCase):
+    """Open-loop mode, calls are scheduled based on arrival rate (with correction of coordinated omission)"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfOpenLoop.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_arrival_rate(self):
+        setup = RunSetup(duration_second=1, start_delay=0, parameters={"arrival_rate": 50})
+        setup.set_start_time()
+        probe = prf_open_loop(setup)
+
+        # the amount of calls is based on arrival rate (not on speed of function)
+        self.assertTrue(45 <= probe.counter <= 52)
+        self.assertEqual(probe.counter, probe.uncorrected.counter)
+
+    def test_coordinated_omission(self):
+        # the function is slower (50 ms) than arrival interval (25 ms), the calls are waiting in queue
+        setup = RunSetup(duration_second=1, start_delay=0, parameters={"arrival_rate": 40, "sleep": 0.05})
+        setup.set_start_time()
+        probe = prf_open_loop(setup)
+
+        corrected = probe.percentile_results[-1]
+        uncorrected = probe.uncorrected.percentile_results[-1]
+        self.assertTrue(uncorrected.total_duration / uncorrected.count < 0.07)
+        self.assertTrue(corrected.total_duration / corrected.count > 0.1)
+        self.assertTrue(corrected.max > uncorrected.max)
+
+    def test_calls_limit(self):
+        # fixed-iteration mode, the executor with zero share does not record any call
+        setup = RunSetup(duration_second=0, start_delay=0, parameters={"arrival_rate": 100, "total_calls": 3})
+        setup.set_start_time()
+        setup.set_executors(4)
+        probes = [prf_open_loop(setup.executor_copy(index)) for index in range(4)]
+        self.assertEqual([probe.counter for probe in probes], [1, 1, 1, 0])
+        self.assertEqual([probe.uncorrected.counter for probe in probes], [1, 1, 1, 0])
+
+    def test_closed_loop(self):
+        setup = RunSetup(duration_second=0, start_delay=0)
+        setup.set_start_time()
+        probe = prf_open_loop(setup)
+        self.assertIsNone(probe.uncorrected)
+
+    def test_run_executor_arrival_rate_total(self):
+        generator = ParallelExecutor(prf_open_loop,
+                                     label="Open-loop",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_open_loop_test.txt"))
+
+        setup=RunSetup(duration_second=2, start_delay=0, parameters={"arrival_rate_total": 100, "percentile": 0.9})
+        perf = generator.run_executor([[2, 1], [2, 2]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+
+        for result in perf.results:
+            # global arrival rate is split cross all executors
+            self.assertTrue(170 <= result[1].count <= 210)
+            self.assertIsNotNone(result[1].uncorrected)
+            self.assertIsNotNone(result[0.9].uncorrected)
+            self.assertEqual(result[1].count, result[1].uncorrected.count)
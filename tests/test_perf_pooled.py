@@ -0,0 +1,157 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor, _executor_wrapper, _async_executor_wrapper
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.executor_pool import ExecutorPool
+from qgate_perf.run_setup import RunSetup
+import time
+import os
+import multiprocessing
+from os import path
+import shutil
+
+
+def prf_pooled(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        for r in range(run_setup.bulk_row * run_setup.bulk_col):
+            time.sleep(0)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    if run_setup.param("generate_error"):
+        raise Exception('Simulated error')
+
+    # return outputs
+    return probe
+
+def _child():
+    time.sleep(0)
+
+def prf_child_process(run_setup: RunSetup) -> ParallelProbe:
+    """ Function with own child process in each call"""
+
+    probe = ParallelProbe(run_setup)
+    while (True):
+        probe.start()
+
+        process = multiprocessing.Process(target=_child)
+        process.start()
+        process.join()
+
+        if probe.stop():
+            break
+    return probe
+
+def prf_crash(run_setup: RunSetup) -> ParallelProbe:
+    """ Function with unexpected end of executor process"""
+    os._exit(1)
+
+
+class TestCasePerfPooled(unittest.TestCase):
+    """Execution with warm processes, reused cross all steps"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfPooled.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_pool_reuse_processes(self):
+        pool = ExecutorPool(prf_pooled, _executor_wrapper, _async_executor_wrapper)
+        pool.open(2)
+        try:
+            setup = RunSetup(duration_second=0, start_delay=0)
+            setup.set_start_time()
+
+            pids = []
+            for threads in [1, 2]:
+                return_dict = pool.execute(setup, 2, threads)
+                pids.append(set([return_dict[key].pid for key in return_dict.keys()]))
+
+            # the same processes for both steps
+            self.assertEqual(len(pids[0]), 2)
+            self.assertEqual(pids[0], pids[1])
+            self.assertEqual(pool.size, 2)
+        finally:
+            pool.close()
+        self.assertFalse(pool.is_open)
+
+    def test_pool_crashed_process(self):
+        pool = ExecutorPool(prf_crash, _executor_wrapper, _async_executor_wrapper)
+        pool.open(2)
+        try:
+            setup = RunSetup(duration_second=0, start_delay=0)
+            setup.set_start_time()
+
+            # return values are missing for crashed processes and crashed processes are removed from pool
+            return_dict = pool.execute(setup, 2, 1)
+            self.assertEqual(list(return_dict.values()), [None, None])
+            self.assertEqual(pool.size, 0)
+        finally:
+            pool.close()
+
+    def test_run_crashed_process(self):
+        generator = ParallelExecutor(prf_crash,
+                                     label="Crash",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_pooled_test.txt"))
+
+        setup=RunSetup(duration_second=0, start_delay=0)
+        self.assertFalse(generator.run(2, 2, setup).state)
+
+    def test_run_bulk_executor_pooled(self):
+        generator = ParallelExecutor(prf_pooled,
+                                     label="Pooled",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_pooled_test.txt"),
+                                     init_each_bulk=True,
+                                     pooled=True)
+
+        setup=RunSetup(duration_second=1, start_delay=0)
+        self.assertTrue(generator.run_bulk_executor(bulk_list=[[1,2], [1,10]],
+                                                    executor_list=[[1,1], [2,2], [4,1]],
+                                                    run_setup=setup).state)
+
+    def test_run_executor_pooled_exception(self):
+        generator = ParallelExecutor(prf_pooled,
+                                     label="Pooled",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_pooled_test.txt"),
+                                     pooled=True)
+
+        setup=RunSetup(duration_second=0, start_delay=0, parameters={"generate_error": "yes"})
+        self.assertFalse(generator.run_executor([[1,1], [2,2]], setup).state)
+
+    def test_run_pooled(self):
+        generator = ParallelExecutor(prf_pooled,
+                                     label="Pooled",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_pooled_test.txt"),
+                                     pooled=True)
+
+        setup=RunSetup(duration_second=1, start_delay=1)
+        self.assertTrue(generator.run(2, 2, setup).state)
+
+    def test_run_pooled_child_process(self):
+        # the executors in pool are not daemon processes (the function can start own processes)
+        generator = ParallelExecutor(prf_child_process,
+                                     label="Pooled child",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_pooled_test.txt"),
+                                     pooled=True)
+
+        setup=RunSetup(duration_second=0, start_delay=0, parameters={"total_calls": 4})
+        self.assertTrue(generator.run_executor([[1,1], [2,1]], setup).state)
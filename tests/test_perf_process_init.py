@@ -0,0 +1,108 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor, _executor_wrapper, _async_executor_wrapper
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.executor_pool import ExecutorPool
+from qgate_perf.run_setup import RunSetup
+import time
+import os
+from os import path
+import shutil
+import uuid
+
+OUTPUT_ADR = "../output/test_perf/"
+FINISH_FILE = path.join(OUTPUT_ADR, "process_finish.txt")
+
+
+def process_init(run_setup: RunSetup):
+    """Init in each process, e.g. connection pool shared by all threads"""
+    if run_setup.param("generate_error"):
+        raise Exception('Simulated init error')
+    return {"pid": os.getpid(), "id": str(uuid.uuid4())}
+
+def process_finish(run_setup: RunSetup):
+    """Finish in each process, e.g. close of connection pool"""
+    with open(FINISH_FILE, "a") as file:
+        file.write(f"{run_setup.shared['id']}\n")
+
+def prf_shared(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing with shared value from process init"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+    probe.shared_id = run_setup.shared["id"] if run_setup.shared else None
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfProcessInit(unittest.TestCase):
+    """Init and finish once in each process, the value is shared by all executors in process"""
+
+    OUTPUT_ADR = OUTPUT_ADR
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfProcessInit.OUTPUT_ADR, True)
+        os.makedirs(TestCasePerfProcessInit.OUTPUT_ADR, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_pool_shared(self):
+        if path.exists(FINISH_FILE):
+            os.remove(FINISH_FILE)
+        pool = ExecutorPool(prf_shared, _executor_wrapper, _async_executor_wrapper, process_init, process_finish)
+        pool.open(2)
+        try:
+            setup = RunSetup(duration_second=0, start_delay=0)
+            setup.set_start_time()
+            return_dict = pool.execute(setup, 2, 3)
+        finally:
+            pool.close()
+
+        # one shared value for each process (all threads in process have the same value)
+        shared = {}
+        for probe in return_dict.values():
+            self.assertIsNotNone(probe.shared_id)
+            shared.setdefault(probe.pid, set()).add(probe.shared_id)
+        self.assertEqual(len(shared), 2)
+        self.assertTrue(all(len(values) == 1 for values in shared.values()))
+
+        # finish was called once in each process
+        with open(FINISH_FILE) as file:
+            finished = file.read().split()
+        self.assertEqual(sorted(finished), sorted(value for values in shared.values() for value in values))
+
+    def test_run(self):
+        generator = ParallelExecutor(prf_shared,
+                                     label="Process init",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_process_init_test.txt"),
+                                     process_init=process_init,
+                                     process_finish=process_finish)
+
+        setup = RunSetup(duration_second=0.5, start_delay=0.5)
+        self.assertTrue(generator.run_executor([[2, 2], [1, 3]], setup).state)
+        self.assertTrue(generator.init_run(setup))
+
+    def test_run_init_error(self):
+        generator = ParallelExecutor(prf_shared,
+                                     label="Process init error",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_process_init_test.txt"),
+                                     process_init=process_init)
+
+        setup = RunSetup(duration_second=0.5, start_delay=0.5, parameters={"generate_error": True})
+        self.assertFalse(generator.run(2, 2, setup).state)
+        self.assertFalse(generator.test_run(setup))
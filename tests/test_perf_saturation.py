@@ -0,0 +1,118 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+
+def prf_scale(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, the throughput grows with amount of executors"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.002)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+def prf_saturated(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, the throughput is the same for all amounts of executors"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.002 * run_setup.executors)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfSaturation(unittest.TestCase):
+    """Search of executors with max. throughput"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfSaturation.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_saturation_scale(self):
+        generator = ParallelExecutor(prf_scale,
+                                     label="Saturation scale",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_saturation_test.txt"),
+                                     pooled=True)
+
+        setup=RunSetup(duration_second=0.5, start_delay=0.5)
+        perf = generator.run_saturation(setup, max_processes=3, max_threads=2)
+        self.assertTrue(perf.state)
+
+        # explored 1, 2, 3 processes and 2 threads
+        self.assertEqual([(result.executor_process, result.executor_thread) for result in perf.results],
+                         [(1, 1), (2, 1), (3, 1), (3, 2)])
+        self.assertEqual(perf.best.executor_process, 3)
+        self.assertEqual(perf.best.executor_thread, 2)
+
+    def test_saturation_limit(self):
+        generator = ParallelExecutor(prf_saturated,
+                                     label="Saturation limit",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_saturation_test.txt"))
+
+        setup=RunSetup(duration_second=0.5, start_delay=0.5)
+        perf = generator.run_saturation(setup, max_processes=4, min_gain=0.2)
+        self.assertTrue(perf.state)
+
+        # without gain for more executors
+        self.assertEqual(len(perf.results), 2)
+        self.assertEqual(perf.best.executor_process, 1)
+
+    def test_saturation_latency(self):
+        generator = ParallelExecutor(prf_saturated,
+                                     label="Saturation latency",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_saturation_test.txt"))
+
+        # the throughput is the same, but the latency is over limit
+        setup=RunSetup(duration_second=0.5, start_delay=0.5)
+        perf = generator.run_saturation(setup, max_processes=2, min_gain=-1, latency_limit=1.5)
+        self.assertTrue(perf.state)
+        self.assertEqual(perf.best.executor_process, 1)
+
+    def test_saturation_single(self):
+        generator = ParallelExecutor(prf_scale,
+                                     label="Saturation single",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_saturation_test.txt"))
+
+        # without steps for search, only the start value is measured
+        setup=RunSetup(duration_second=0.5, start_delay=0.5)
+        perf = generator.run_saturation(setup, max_processes=1, max_threads=1)
+        self.assertTrue(perf.state)
+        self.assertEqual(len(perf.results), 1)
+        self.assertEqual(perf.best.executor_process, 1)
+        self.assertEqual(perf.best.executor_thread, 1)
@@ -0,0 +1,103 @@
+import unittest
+import json
+from qgate_perf.parallel_executor import ParallelExecutor, _executor_wrapper, _async_executor_wrapper
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.executor_pool import ExecutorPool
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+WARMED = {"state": False}
+
+
+def warm_up():
+    """Expensive init in parent process (inherited by executors via fork)"""
+    WARMED["state"] = True
+
+def prf_warmed(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+    probe.warmed = WARMED["state"]
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfStartMethod(unittest.TestCase):
+    """Start method of executor processes, preload in parent and startup time of processes"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfStartMethod.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def _setup(self):
+        setup = RunSetup(duration_second=0, start_delay=0)
+        setup.set_start_time()
+        return setup
+
+    def test_startup_pooled(self):
+        pool = ExecutorPool(prf_warmed, _executor_wrapper, _async_executor_wrapper)
+        pool.open(2)
+        try:
+            # startup time only for the first step (warm processes in next steps)
+            first = pool.execute(self._setup(), 2, 2)
+            second = pool.execute(self._setup(), 2, 2)
+        finally:
+            pool.close()
+        self.assertTrue(all(probe.startup is not None and probe.startup >= 0 for probe in first.values()))
+        self.assertTrue(all(probe.startup is None for probe in second.values()))
+
+    def test_preload_fork(self):
+        WARMED["state"] = False
+        generator = ParallelExecutor(prf_warmed, start_method="fork", preload=["json", warm_up])
+        return_dict = generator._executeCore(self._setup(), 2, 1)
+        self.assertEqual(len(return_dict), 2)
+        self.assertTrue(all(probe.warmed for probe in return_dict.values()))
+        self.assertTrue(WARMED["state"])
+
+    def test_spawn(self):
+        WARMED["state"] = False
+        generator = ParallelExecutor(prf_warmed, start_method="spawn", preload=[warm_up])
+        return_dict = generator._executeCore(self._setup(), 2, 1)
+
+        # the state from parent is not inherited with spawn
+        self.assertEqual(len(return_dict), 2)
+        self.assertTrue(all(not probe.warmed and probe.startup > 0 for probe in return_dict.values()))
+
+    def test_run_forkserver(self):
+        output_file = path.join(self.OUTPUT_ADR, "perf_start_method_test.txt")
+        generator = ParallelExecutor(prf_warmed,
+                                     label="Forkserver",
+                                     detail_output=True,
+                                     output_file=output_file,
+                                     start_method="forkserver",
+                                     preload=["numpy"])
+        setup = RunSetup(duration_second=0.2, start_delay=2)
+        self.assertTrue(generator.run_executor([[2, 1], [1, 2]], setup).state)
+
+        with open(output_file) as file:
+            lines = [json.loads(line) for line in file if '"type":"core"' in line or '"type":"detail"' in line]
+        self.assertTrue(all(line["startup"] >= 0 for line in lines))
+
+    def test_invalid_start_method(self):
+        with self.assertRaises(ValueError):
+            ExecutorPool(prf_warmed, _executor_wrapper, _async_executor_wrapper, start_method="unknown")
@@ -0,0 +1,147 @@
+import unittest
+import json
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.output_result import PerfResults, PerfResult, PercentileSummary, Output
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+
+def prf_trial(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.001)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfTrials(unittest.TestCase):
+    """Repeated trials for each executors"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfTrials.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def _lines(self, output_file, line_type):
+        with open(output_file) as file:
+            return [json.loads(line) for line in file if f'"type":"{line_type}"' in line]
+
+    def test_trials_sequential(self):
+        output_file = path.join(self.OUTPUT_ADR, "perf_trials_sequential.txt")
+        generator = ParallelExecutor(prf_trial,
+                                     label="Trials sequential",
+                                     detail_output=False,
+                                     output_file=output_file)
+
+        setup=RunSetup(duration_second=0.3, start_delay=0.3, parameters={"trials": 3, "percentile": 0.9})
+        perf = generator.run_executor([[1, 1], [2, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertEqual(len(perf.results), 2)
+
+        # trial lines in order of execution, one core line for each executors
+        trials = self._lines(output_file, "trial")
+        self.assertEqual([(line["trial"], line["plan_executors"]) for line in trials], [(0, 1), (1, 1), (2, 1), (0, 2), (1, 2), (2, 2)])
+        cores = self._lines(output_file, "core")
+        self.assertEqual(len(cores), 2)
+
+        statistics = perf[1][1].trials
+        self.assertEqual(statistics["count"], 3)
+        self.assertLessEqual(statistics["ci_low"], statistics["mean"])
+        self.assertGreaterEqual(statistics["ci_high"], statistics["mean"])
+        self.assertAlmostEqual(statistics["mean"], perf[1][1].call_per_sec)
+        self.assertAlmostEqual(cores[1]["trials"]["mean"], statistics["mean"])
+        self.assertEqual(perf[1][1].count, sum(line["total_calls"] for line in trials[3:]))
+
+        # only core lines are loaded
+        runs = PerfResults.load(output_file)
+        self.assertEqual(len(runs[0].results), 2)
+        self.assertEqual(runs[0].results[1][1].trials["count"], 3)
+
+    def test_trials_interleaved(self):
+        output_file = path.join(self.OUTPUT_ADR, "perf_trials_interleaved.txt")
+        generator = ParallelExecutor(prf_trial,
+                                     label="Trials interleaved",
+                                     detail_output=False,
+                                     output_file=output_file)
+
+        setup=RunSetup(duration_second=0.3, start_delay=0.3, parameters={"trials": 2, "trials_order": "interleaved"})
+        perf = generator.run_executor([[1, 1], [2, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+
+        trials = self._lines(output_file, "trial")
+        self.assertEqual([(line["trial"], line["plan_executors"]) for line in trials], [(0, 1), (0, 2), (1, 1), (1, 2)])
+
+    def test_trials_detail(self):
+        output_file = path.join(self.OUTPUT_ADR, "perf_trials_detail.txt")
+        generator = ParallelExecutor(prf_trial,
+                                     label="Trials detail",
+                                     detail_output=True,
+                                     output_file=output_file)
+
+        setup=RunSetup(duration_second=0.3, start_delay=0.3, parameters={"trials": 2, "trials_order": "interleaved"})
+        self.assertTrue(generator.run_executor([[1, 1], [2, 1]], setup).state)
+
+        # the details of trials are without relation to the core lines, the core line is after the last
+        # trial of the executors
+        with open(output_file) as file:
+            types = [(json.loads(line)["type"], json.loads(line).get("plan_executors")) for line in file if line.strip().startswith("{")]
+        self.assertNotIn("detail", [itm[0] for itm in types])
+        self.assertEqual(len([itm for itm in types if itm[0] == "trial_detail"]), 6)
+        self.assertEqual([itm for itm in types if itm[0] in ("trial", "core")],
+                         [("trial", 1), ("trial", 2), ("trial", 1), ("core", 1), ("trial", 2), ("core", 2)])
+
+    def test_trials_random(self):
+        generator = ParallelExecutor(prf_trial,
+                                     label="Trials random",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_trials_random.txt"))
+
+        setup=RunSetup(duration_second=0.3, start_delay=0.3, parameters={"trials": 2, "trials_order": "random"})
+        perf = generator.run_executor([[1, 1], [2, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertEqual([result.executor_process for result in perf.results], [1, 2])
+        self.assertEqual(perf[0][1].trials["count"], 2)
+
+    def test_trials_plan(self):
+        self.assertEqual(ParallelExecutor._trial_plan(2, 2), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(ParallelExecutor._trial_plan(2, 2, "interleaved"), [(0, 0), (1, 0), (0, 1), (1, 1)])
+        self.assertEqual(sorted(ParallelExecutor._trial_plan(2, 2, "random")), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        with self.assertRaises(ValueError):
+            ParallelExecutor._trial_plan(2, 2, "xxx")
+
+    def test_trials_degraded(self):
+        output_file = path.join(self.OUTPUT_ADR, "perf_trials_degraded.txt")
+        results = [PerfResult(True, 1, 1, 2, 2, {1: PercentileSummary(1, 1000, 2000, 2000, 0.002, 0.001, 0.004, 0.001, executors)})
+                   for executors in [4, 3, 4]]
+        output = Output(output_file = output_file)
+        output.open()
+        try:
+            summaries = output.print_trials(RunSetup(), results, 2, 2)
+        finally:
+            output.close()
+
+        # the degraded trial is visible in the core line
+        self.assertEqual(summaries[1].executors, 3)
+        core = self._lines(output_file, "core")[0]
+        self.assertEqual(core["real_executors"], 3)
+        self.assertEqual(core["trials_executors"], [4, 3, 4])
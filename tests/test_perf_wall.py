@@ -0,0 +1,72 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+import time
+from os import path
+import shutil
+
+
+def prf_think_time(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, with think time outside of measured part"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # think time (not measured)
+        time.sleep(0.002)
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.001)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfWall(unittest.TestCase):
+    """Throughput based on wall-clock (calls / active window)"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfWall.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_run_wall_throughput(self):
+        generator = ParallelExecutor(prf_think_time,
+                                     label="Wall throughput",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_wall_test.txt"))
+
+        setup=RunSetup(duration_second=1, start_delay=0.5)
+        perf = generator.run_executor([[2, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+
+        # the think time is not visible in raw throughput (based on average latency), only in wall throughput
+        summary = perf[0][1]
+        self.assertIsNotNone(summary.call_per_sec_wall_raw)
+        self.assertLess(summary.call_per_sec_wall_raw, summary.call_per_sec_raw * 0.7)
+        self.assertEqual(summary.call_per_sec_wall_raw, summary.call_per_sec_wall)
+
+    def test_run_wall_bulk(self):
+        generator = ParallelExecutor(prf_think_time,
+                                     label="Wall throughput bulk",
+                                     detail_output=False,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_wall_test.txt"))
+
+        setup=RunSetup(duration_second=0.5, start_delay=0.5)
+        setup.set_bulk(10, 1)
+        perf = generator.run_executor([[1, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertAlmostEqual(perf[0][1].call_per_sec_wall, perf[0][1].call_per_sec_wall_raw * 10)
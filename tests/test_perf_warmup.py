@@ -0,0 +1,86 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+from qgate_perf.time_series import TimeSeries
+import time
+from os import path
+import shutil
+
+
+def prf_warmup(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, the first calls are slower (simulation of warm-up)"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+    calls = 0
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.05 if calls < run_setup.param("slow_calls", 0) else 0.001)
+        calls += 1
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfWarmup(unittest.TestCase):
+    """Warm-up exclusion and detection of steady state"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfWarmup.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def _probe(self, parameters):
+        setup = RunSetup(duration_second=1, start_delay=0, parameters=parameters)
+        setup.set_start_time()
+        return prf_warmup(setup)
+
+    def test_warmup_calls(self):
+        probe = self._probe({"slow_calls": 5, "warmup_calls": 5})
+        self.assertLess(probe.max_duration, 0.05)
+
+        probe = self._probe({"slow_calls": 5})
+        self.assertGreaterEqual(probe.max_duration, 0.05)
+
+    def test_warmup_duration(self):
+        start = time.time()
+        probe = self._probe({"slow_calls": 5, "warmup_duration": 0.5})
+        self.assertLess(probe.max_duration, 0.05)
+
+        # the measurement starts after warm-up
+        self.assertGreaterEqual(time.time() - start, 1.5)
+
+    def test_steady_state(self):
+        series = {"first": 0, "calls": [10, 95, 100, 102, 98, 30],
+                  "total": [1] * 6, "total_sq": [1] * 6, "min": [0.1] * 6, "max": [0.2] * 6}
+        self.assertEqual(TimeSeries.steady_state(series, 0.1), (1, 4))
+        self.assertEqual(TimeSeries.summary(series, 1, 4)[0], 395)
+        self.assertIsNone(TimeSeries.steady_state({"calls": [0, 0]}, 0.1))
+
+    def test_run_executor_steady_state(self):
+        generator = ParallelExecutor(prf_warmup,
+                                     label="Steady state",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_warmup_test.txt"))
+
+        setup=RunSetup(duration_second=2, start_delay=0, parameters={"steady_state": True, "time_series": 0.25,
+                                                                     "warmup_calls": 2})
+        perf = generator.run_executor([[1, 1], [2, 2]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        for result in perf.results:
+            self.assertIsNotNone(result[1].steady)
+            self.assertGreater(result[1].steady.count, 0)
+            self.assertLessEqual(result[1].steady.count, result[1].count)
@@ -0,0 +1,199 @@
+import unittest
+import json
+from qgate_perf.parallel_executor import ParallelExecutor, _executor_wrapper, _async_executor_wrapper
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.executor_pool import ExecutorPool, _executor_keys, _group_worker
+from qgate_perf.run_setup import RunSetup
+import time
+import os
+import multiprocessing
+import psutil
+from os import path
+import shutil
+
+
+def prf_hung(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, the second executor hangs after some calls"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    count = 0
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.001)
+        count += 1
+        if run_setup.executor_index == 1 and count > 50:
+            # simulation of deadlock
+            time.sleep(1000)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+def prf_hung_pid(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, the second executor hangs and writes own pid to the file"""
+
+    probe = ParallelProbe(run_setup)
+    while (True):
+        probe.start()
+        time.sleep(0.001)
+        if run_setup.executor_index == 1:
+            with open(run_setup.param("pid_file"), "w") as file:
+                file.write(str(os.getpid()))
+            time.sleep(1000)
+        if probe.stop():
+            break
+    return probe
+
+
+def prf_calls(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing, fixed-iteration mode"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.01)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCasePerfWatchdog(unittest.TestCase):
+    """Watchdog for hung executors, termination after deadline with partial statistics"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCasePerfWatchdog.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_executor_keys(self):
+        self.assertEqual(_executor_keys(2, 1, 1), [(2, 2)])
+        self.assertEqual(_executor_keys(1, 2, 1), [("1x0", 2), ("1x1", 3)])
+        self.assertEqual(_executor_keys(1, 1, 2), [("1x0", 2), ("1x1", 3)])
+        self.assertEqual(_executor_keys(1, 2, 2), [("1x0x0", 4), ("1x0x1", 5), ("1x1x0", 6), ("1x1x1", 7)])
+
+    def test_pool_watchdog(self):
+        pool = ExecutorPool(prf_hung, _executor_wrapper, _async_executor_wrapper)
+        pool.open(2)
+        try:
+            setup = RunSetup(duration_second=0.5, start_delay=1, parameters={"watchdog": 0.5})
+            setup.set_start_time()
+            begin = time.time()
+            return_dict = pool.execute(setup, 2, 1)
+            self.assertLess(time.time() - begin, 10)
+
+            # the hung process is replaced in next step
+            self.assertEqual(pool.size, 1)
+        finally:
+            pool.close()
+
+        self.assertIsNone(return_dict[0].exception)
+        hung = return_dict[1]
+        self.assertTrue(hung.timeout)
+        self.assertIsNotNone(hung.exception)
+        self.assertEqual(hung.counter, 50)
+        self.assertGreater(hung.total_duration, 0.05)
+        self.assertGreater(hung.max_duration, 0)
+
+    def test_group_terminate(self):
+        os.makedirs(self.OUTPUT_ADR, exist_ok=True)
+        pid_file = path.join(self.OUTPUT_ADR, "perf_watchdog_pid.txt")
+        if path.exists(pid_file):
+            os.remove(pid_file)
+
+        # sub-coordinator with hung executor
+        parent_connection, child_connection = multiprocessing.Pipe()
+        coordinator = multiprocessing.Process(target=_group_worker,
+                                              args=(prf_hung_pid, _executor_wrapper, _async_executor_wrapper, child_connection))
+        coordinator.start()
+        setup = RunSetup(duration_second=0.5, start_delay=0, parameters={"pid_file": pid_file})
+        setup.set_start_time()
+        parent_connection.send((0, 2, 1, 1, setup))
+        for i in range(100):
+            if path.exists(pid_file) and os.path.getsize(pid_file) > 0:
+                break
+            time.sleep(0.1)
+        with open(pid_file) as file:
+            pid = int(file.read())
+
+        # termination of sub-coordinator (e.g. from watchdog) terminates also own executors (without orphan process)
+        coordinator.terminate()
+        coordinator.join(ExecutorPool.TERMINATE_TIMEOUT * 5)
+        parent_connection.close()
+        self.assertFalse(coordinator.is_alive())
+        for i in range(20):
+            try:
+                if psutil.Process(pid).status() == psutil.STATUS_ZOMBIE:
+                    break
+            except psutil.NoSuchProcess:
+                break
+            time.sleep(0.1)
+        else:
+            os.kill(pid, 9)
+            self.fail("Orphan executor process")
+
+    def test_run_watchdog(self):
+        output_file = path.join(self.OUTPUT_ADR, "perf_watchdog_test.txt")
+        generator = ParallelExecutor(prf_hung,
+                                     label="Watchdog",
+                                     detail_output=True,
+                                     output_file=output_file,
+                                     group_size=2)
+
+        setup = RunSetup(duration_second=0.5, start_delay=1, parameters={"watchdog": 0.5, "percentile": 0.9})
+        perf = generator.run_executor([[1, 3]], setup, performance_detail=True)
+        self.assertFalse(perf.state)
+
+        with open(output_file) as file:
+            lines = [json.loads(line) for line in file if '"type":"detail"' in line or '"type":"core"' in line]
+        # only the hung thread is reported with partial statistics, the finished threads in the
+        # terminated process are reported with own results
+        timed_out = [line for line in lines if line.get("timeout")]
+        self.assertEqual(len(timed_out), 1)
+        self.assertEqual(timed_out[0]["calls"], 50)
+        self.assertEqual(lines[-1]["timeouts"], 1)
+        finished = [line for line in lines if line.get("type") == "detail" and not line.get("timeout")]
+        self.assertEqual(len(finished), 2)
+        self.assertTrue(all(line["calls"] > 50 and "err" not in line for line in finished))
+
+    def test_deadline_calls(self):
+        # fixed-iteration mode, the watchdog is time budget after start (the duration is ignored)
+        setup = RunSetup(duration_second=10, start_delay=0, parameters={"watchdog": 2, "total_calls": 100})
+        setup.set_start_time()
+        self.assertAlmostEqual(ExecutorPool._deadline(setup, None), setup.when_start.timestamp() + 2)
+        setup = RunSetup(duration_second=10, start_delay=0, parameters={"watchdog": 2})
+        setup.set_start_time()
+        self.assertAlmostEqual(ExecutorPool._deadline(setup, None), setup.when_start.timestamp() + 12)
+
+    def test_run_watchdog_calls(self):
+        generator = ParallelExecutor(prf_calls,
+                                     label="Watchdog calls",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_watchdog_calls_test.txt"))
+
+        # the healthy executors are longer than duration, but in time budget of watchdog
+        setup = RunSetup(duration_second=0, start_delay=1, parameters={"watchdog": 5, "total_calls": 200})
+        perf = generator.run_executor([[2, 1]], setup, performance_detail=True)
+        self.assertTrue(perf.state)
+        self.assertEqual(perf[0][1].iterations["calls"], 200)
@@ -9,14 +9,12 @@ class SimulateProbe(ParallelProbe):
 
     MATH_PRECISION = 5
 
-    def __init__(self, percentile, heap_init_size):
+    def __init__(self, percentile):
 
         self.percentile = percentile
-        self.heap_init_size = heap_init_size
 
         parameters={}
         parameters["percentile"] = self.percentile
-        parameters["heap_init_size"] = self.heap_init_size
 
         setup = RunSetup(0, 0, parameters)
         setup.set_start_time()
@@ -27,11 +25,11 @@ class SimulateProbe(ParallelProbe):
 
     def stop(self, duration_one_shot):
         if duration_one_shot >= 0:
-            self.heap.call(duration_one_shot)
+            self.call_fn(duration_one_shot)
 
         # Is it possible to end performance testing?
         if duration_one_shot == -1:
-            self.heap.close()
+            self.close_fn()
             return True
         return False
 
@@ -116,68 +114,68 @@ class TestCaseProbeSimulate(unittest.TestCase):
 
     def test_basic_0_with_exception(self):
         with self.assertRaises(Exception) as context:
-            simulate = SimulateProbe(0, 10)
+            simulate = SimulateProbe(0)
 
         with self.assertRaises(Exception) as context:
-            simulate = SimulateProbe(0, 10)
+            simulate = SimulateProbe(0)
 
     def test_basic_10(self):
-        simulate = SimulateProbe(0.1, 10)
+        simulate = SimulateProbe(0.1)
         result = simulate.check([0.24, 0.21, 0.34, 0.33])
         self.assertIsNone(result, result)
 
-        simulate = SimulateProbe(0.1, 10)
+        simulate = SimulateProbe(0.1)
         result = simulate.check([0.24, 0.21, 0.34, 0.33, 0.33, 0.221, 0.23, 0.21, 0.45, 0.76])
         self.assertIsNone(result, result)
 
     def test_basic_50(self):
-        simulate = SimulateProbe(0.5, 10)
+        simulate = SimulateProbe(0.5)
         result = simulate.check([0.24, 0.21, 0.34, 0.33])
         self.assertIsNone(result, result)
 
-        simulate = SimulateProbe(0.5, 10)
+        simulate = SimulateProbe(0.5)
         result = simulate.check([0.24, 0.21, 0.34, 0.33, 0.33, 0.221, 0.23, 0.21, 0.45, 0.76])
         self.assertIsNone(result, result)
 
     def test_basic_70(self):
-        simulate = SimulateProbe(0.7, 10)
+        simulate = SimulateProbe(0.7)
         result = simulate.check([0.24, 0.21, 0.34, 0.33])
         self.assertIsNone(result, result)
 
-        simulate = SimulateProbe(0.7, 10)
+        simulate = SimulateProbe(0.7)
         result = simulate.check([0.24, 0.21, 0.34, 0.33, 0.33, 0.221, 0.23, 0.21, 0.45, 0.76])
         self.assertIsNone(result, result)
 
     def test_basic_90(self):
-        simulate = SimulateProbe(0.9, 10)
+        simulate = SimulateProbe(0.9)
         result = simulate.check([0.24, 0.21, 0.34, 0.33])
         self.assertIsNone(result, result)
 
-        simulate = SimulateProbe(0.9, 10)
+        simulate = SimulateProbe(0.9)
         result = simulate.check([0.24, 0.21, 0.34, 0.33, 0.33, 0.221, 0.23, 0.21, 0.45, 0.76])
         self.assertIsNone(result, result)
 
     def test_basic_99(self):
-        simulate = SimulateProbe(0.99, 10)
+        simulate = SimulateProbe(0.99)
         result = simulate.check([0.24, 0.21, 0.34, 0.33])
         self.assertIsNone(result, result)
 
-        simulate = SimulateProbe(0.99, 10)
+        simulate = SimulateProbe(0.99)
         result = simulate.check([0.24, 0.21, 0.34, 0.33, 0.33, 0.221, 0.23, 0.21, 0.45, 0.76])
         self.assertIsNone(result, result)
 
     def test_basic_999(self):
-        simulate = SimulateProbe(0.999, 10)
+        simulate = SimulateProbe(0.999)
         result = simulate.check([0.24, 0.21, 0.34, 0.33])
         self.assertIsNone(result, result)
 
-        simulate = SimulateProbe(0.999, 10)
+        simulate = SimulateProbe(0.999)
         result = simulate.check([0.24, 0.21, 0.34, 0.33, 0.33, 0.221, 0.23, 0.21, 0.45, 0.76])
         self.assertIsNone(result, result)
 
     def test_basic_100_with_exception(self):
         with self.assertRaises(Exception) as context:
-            simulate = SimulateProbe(1, 10)
+            simulate = SimulateProbe(1)
 
         with self.assertRaises(Exception) as context:
-            simulate = SimulateProbe(1, 10)
+            simulate = SimulateProbe(1)
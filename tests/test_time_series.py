@@ -0,0 +1,87 @@
+import unittest
+from qgate_perf.parallel_executor import ParallelExecutor
+from qgate_perf.parallel_probe import ParallelProbe
+from qgate_perf.run_setup import RunSetup
+from qgate_perf.time_series import TimeSeries
+from numpy import array
+import time
+from os import path
+import shutil
+
+
+def prf_series(run_setup: RunSetup) -> ParallelProbe:
+    """ Function for performance testing"""
+
+    # init (contain executor synchronization, if needed)
+    probe = ParallelProbe(run_setup)
+
+    while (True):
+
+        # START - performance measure for specific part of code
+        probe.start()
+
+        time.sleep(0.001)
+
+        # STOP - performance measure specific part of code
+        if probe.stop():
+            break
+
+    # return outputs
+    return probe
+
+
+class TestCaseTimeSeries(unittest.TestCase):
+    """Time series of calls and durations in intervals"""
+
+    OUTPUT_ADR = "../output/test_perf/"
+    @classmethod
+    def setUpClass(cls):
+        shutil.rmtree(TestCaseTimeSeries.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_ring(self):
+        series = TimeSeries(0, 1, 3)
+        series.record(0.5, 0.1)
+        series.record(0.7, 0.3)
+        series.record(1.5, 0.2, 4)
+        series.record_batch(3.5, array([0.1, 0.5]))
+
+        # the first interval is out of ring, the empty interval is cleaned
+        dump = series.dump()
+        self.assertEqual(dump["first"], 1)
+        self.assertEqual(dump["calls"], [4, 0, 2])
+        self.assertAlmostEqual(dump["total"][0], 0.8)
+        self.assertEqual(dump["max"], [0.2, 0.0, 0.5])
+
+    def test_merge(self):
+        first, second = TimeSeries(0, 1, 10), TimeSeries(0, 1, 10)
+        first.record(0.5, 0.1)
+        second.record(0.5, 0.3)
+        second.record(1.5, 0.2)
+
+        merged = TimeSeries.merge([first.dump(), second.dump()])
+        self.assertEqual(merged["calls"], [2, 1])
+        self.assertEqual(merged["max"], [0.3, 0.2])
+        self.assertIsNone(TimeSeries.merge([]))
+
+    def test_probe_series(self):
+        setup = RunSetup(duration_second=1, start_delay=0, parameters={"time_series": 0.25, "percentile": 0.99})
+        setup.set_start_time()
+        probe = prf_series(setup)
+
+        dump = probe.series.dump()
+        self.assertIn(len(dump["calls"]), [4, 5])
+        self.assertEqual(sum(dump["calls"]), probe.counter)
+        self.assertAlmostEqual(sum(dump["total"]), probe.total_duration, 6)
+
+    def test_run_executor_series(self):
+        generator = ParallelExecutor(prf_series,
+                                     label="Time series",
+                                     detail_output=True,
+                                     output_file=path.join(self.OUTPUT_ADR, "perf_time_series_test.txt"))
+
+        setup=RunSetup(duration_second=1, start_delay=0, parameters={"time_series": 0.5})
+        self.assertTrue(generator.run_executor([[1, 1], [2, 2]], setup).state)